@@ -0,0 +1,282 @@
+"""
+app/__main__.py
+
+✅ 운영용 서버 런처:  python -m app
+
+왜 필요한가?
+- gunicorn/uvicorn 옵션을 매번 손으로 맞추다 보면
+  워커 수가 제각각이고, preload를 빼먹고, 캐시가 워커마다 중복 로딩된다.
+- 그래서 "이 프로젝트에 맞는 기본값"을 한 곳에 모았다.
+
+하는 일:
+1) 워커 수 = CPU 코어 수 (컨테이너 CPU 제한(affinity)도 반영)
+2) 이벤트 루프(uvloop) / HTTP 파서(httptools) 를 설치돼 있으면 자동 선택
+3) preload: 마스터에서 앱을 먼저 import 한 뒤 fork
+   → 이미 import된 모듈/메모리를 워커들이 copy-on-write로 공유
+   → gc.freeze()로 GC가 공유 페이지를 건드려 복사가 일어나는 것도 줄인다.
+4) graceful reload(SIGHUP) / max-requests 재시작 / graceful timeout
+5) 워커별 통계: GET /stats/worker (관리자만), 워커 종료 시 로그
+
+실행 엔진:
+- gunicorn이 있으면(리눅스/맥): gunicorn 마스터 + Uvicorn 워커
+- 없으면(예: Windows): uvicorn 자체 멀티 워커 모드 (preload 미지원)
+
+예:
+    python -m app                        # 설정값/자동값으로 실행
+    python -m app --workers 4 --max-requests 10000 --max-requests-jitter 1000
+    python -m app --reload               # 개발용(워커 1개, 코드 변경 시 재시작)
+    kill -HUP <master pid>               # 무중단 graceful reload (gunicorn)
+"""
+
+import argparse
+import gc
+import importlib.util
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger("documind.server")
+
+APP_PATH = "app.main:app"
+
+
+# ------------------------------------------------------------
+# 기본값 계산
+# ------------------------------------------------------------
+
+
+def default_workers() -> int:
+    """
+    ✅ 기본 워커 수 = 이 프로세스가 쓸 수 있는 CPU 코어 수
+
+    - async 워커(Uvicorn)는 워커 1개가 코어 1개를 꽉 채우는 구조라
+      "2*코어+1" 같은 sync 워커 공식보다 코어 수가 맞다.
+    - sched_getaffinity는 컨테이너/taskset CPU 제한을 반영한다.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+def _is_installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_loop(choice: str) -> str:
+    """auto → uvloop(설치돼 있으면) / asyncio"""
+    if choice == "auto":
+        return "uvloop" if _is_installed("uvloop") else "asyncio"
+    if choice == "uvloop" and not _is_installed("uvloop"):
+        raise SystemExit("--loop uvloop 을 쓰려면 `pip install uvloop` 이 필요합니다.")
+    return choice
+
+
+def resolve_http(choice: str) -> str:
+    """auto → httptools(설치돼 있으면) / h11"""
+    if choice == "auto":
+        return "httptools" if _is_installed("httptools") else "h11"
+    if choice == "httptools" and not _is_installed("httptools"):
+        raise SystemExit("--http httptools 를 쓰려면 `pip install httptools` 가 필요합니다.")
+    return choice
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app",
+        description="DocuMind API 멀티 프로세스 서버 런처",
+    )
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument(
+        "--workers", type=int, default=settings.SERVER_WORKERS,
+        help="워커 프로세스 수 (0 = CPU 코어 수)",
+    )
+    parser.add_argument(
+        "--loop", choices=["auto", "uvloop", "asyncio"], default=settings.SERVER_LOOP,
+    )
+    parser.add_argument(
+        "--http", choices=["auto", "httptools", "h11"], default=settings.SERVER_HTTP,
+    )
+    parser.add_argument(
+        "--preload", action=argparse.BooleanOptionalAction, default=settings.SERVER_PRELOAD,
+        help="fork 전에 마스터에서 앱 import (copy-on-write 공유)",
+    )
+    parser.add_argument(
+        "--max-requests", type=int, default=settings.SERVER_MAX_REQUESTS,
+        help="워커가 이 수만큼 요청을 처리하면 재시작 (0 = 끄기)",
+    )
+    parser.add_argument(
+        "--max-requests-jitter", type=int, default=settings.SERVER_MAX_REQUESTS_JITTER,
+        help="워커들이 동시에 재시작하지 않도록 max-requests에 더할 랜덤 범위",
+    )
+    parser.add_argument(
+        "--graceful-timeout", type=int, default=settings.SERVER_GRACEFUL_TIMEOUT,
+        help="재시작/종료 시 처리 중인 요청을 기다리는 최대 초",
+    )
+    parser.add_argument("--keepalive", type=int, default=settings.SERVER_KEEPALIVE)
+    parser.add_argument(
+        "--reload", action="store_true",
+        help="개발용: 코드 변경 시 자동 재시작 (워커 1개, preload 끔)",
+    )
+    parser.add_argument(
+        "--engine", choices=["auto", "gunicorn", "uvicorn"], default="auto",
+        help="auto = gunicorn이 설치돼 있으면 gunicorn, 아니면 uvicorn",
+    )
+    return parser
+
+
+# ------------------------------------------------------------
+# gunicorn 훅 (마스터/워커 프로세스에서 호출됨)
+# ------------------------------------------------------------
+
+
+def _when_ready(server: Any) -> None:
+    """
+    마스터: 앱 preload가 끝나고 워커를 fork 하기 직전.
+
+    gc.freeze(): 지금까지 만들어진 객체를 GC 추적 대상에서 빼서
+    워커의 GC가 공유 메모리 페이지에 쓰기를 하지 않게 한다(copy-on-write 유지).
+    """
+    gc.freeze()
+    server.log.info("DocuMind master ready (pid=%s)", os.getpid())
+
+
+def _post_fork(server: Any, worker: Any) -> None:
+    """
+    워커: fork 직후.
+
+    - preload 때 마스터가 열어둔 DB 커넥션을 자식이 같이 쓰면 안 되므로
+      풀을 버린다(close=False: 부모 쪽 커넥션은 닫지 않음).
+    - 통계는 이 워커 pid 기준으로 새로 시작.
+    """
+    from app.core.worker_stats import worker_stats
+    from app.db.database import engine
+
+    engine.dispose(close=False)
+    worker_stats.reset()
+
+
+def _worker_exit(server: Any, worker: Any) -> None:
+    """워커: 종료 직전. 이 워커가 처리한 요청 통계를 로그로 남긴다."""
+    from app.core.worker_stats import worker_stats
+
+    server.log.info("DocuMind worker stats: %s", worker_stats.snapshot())
+
+
+# ------------------------------------------------------------
+# 실행 엔진
+# ------------------------------------------------------------
+
+
+def _uvicorn_worker_class(loop: str, http: str) -> type:
+    """
+    ✅ loop/http 설정을 넣은 Uvicorn 워커 클래스
+
+    gunicorn은 워커 옵션을 클래스 속성(CONFIG_KWARGS)으로만 받기 때문에
+    서브클래스를 만들어서 넘긴다.
+    """
+    try:
+        from uvicorn_worker import UvicornWorker
+    except ImportError:
+        from uvicorn.workers import UvicornWorker
+
+    class DocuMindUvicornWorker(UvicornWorker):
+        # access_log=False: 요청 로그는 앱의 RequestLoggingMiddleware(JSON)가 남긴다
+        CONFIG_KWARGS = {
+            **UvicornWorker.CONFIG_KWARGS, "loop": loop, "http": http, "access_log": False,
+        }
+
+    return DocuMindUvicornWorker
+
+
+def gunicorn_options(args: argparse.Namespace, workers: int, loop: str, http: str) -> Dict[str, Any]:
+    """argparse 결과 → gunicorn 설정 dict"""
+    return {
+        "bind": f"{args.host}:{args.port}",
+        "workers": workers,
+        "worker_class": _uvicorn_worker_class(loop, http),
+        "preload_app": args.preload and not args.reload,
+        "reload": args.reload,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests_jitter,
+        "graceful_timeout": args.graceful_timeout,
+        "keepalive": args.keepalive,
+        "when_ready": _when_ready,
+        "post_fork": _post_fork,
+        "worker_exit": _worker_exit,
+    }
+
+
+def run_gunicorn(options: Dict[str, Any]) -> None:
+    from gunicorn.app.base import BaseApplication
+
+    class DocuMindApplication(BaseApplication):
+        """설정 파일 없이 dict로 gunicorn을 띄우는 커스텀 애플리케이션"""
+
+        def load_config(self) -> None:
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self) -> Any:
+            from app.main import app
+
+            return app
+
+    DocuMindApplication().run()
+
+
+def run_uvicorn(args: argparse.Namespace, workers: int, loop: str, http: str) -> None:
+    """
+    gunicorn이 없는 환경용(예: Windows).
+
+    - uvicorn 멀티 워커는 워커마다 앱을 새로 import 하므로 preload가 없다.
+    - graceful reload(SIGHUP)도 없다. 운영은 gunicorn 엔진을 권장.
+    """
+    import uvicorn
+
+    if args.preload and workers > 1:
+        logger.warning("uvicorn engine does not support --preload; workers import the app separately")
+
+    uvicorn.run(
+        APP_PATH,
+        host=args.host,
+        port=args.port,
+        workers=None if args.reload else workers,
+        loop=loop,
+        http=http,
+        reload=args.reload,
+        limit_max_requests=args.max_requests or None,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        timeout_keep_alive=args.keepalive,
+        access_log=False,   # 요청 로그는 RequestLoggingMiddleware(JSON)
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    workers = 1 if args.reload else (args.workers or default_workers())
+    loop = resolve_loop(args.loop)
+    http = resolve_http(args.http)
+
+    engine = args.engine
+    if engine == "auto":
+        engine = "gunicorn" if _is_installed("gunicorn") and os.name != "nt" else "uvicorn"
+
+    logging.basicConfig(level=logging.INFO)
+    logger.info(
+        "starting DocuMind engine=%s workers=%s loop=%s http=%s preload=%s",
+        engine, workers, loop, http, args.preload and not args.reload,
+    )
+
+    if engine == "gunicorn":
+        run_gunicorn(gunicorn_options(args, workers, loop, http))
+    else:
+        run_uvicorn(args, workers, loop, http)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
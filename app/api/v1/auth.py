@@ -3,7 +3,10 @@ app/api/v1/auth.py
 
 ✅ 인증(Auth) API 라우터
 - POST /auth/register : 회원가입
-- POST /auth/login    : 로그인(JWT 발급)
+- POST /auth/login    : 로그인(Access + Refresh 토큰 발급)
+- POST /auth/refresh  : Refresh Token 회전(rotation) + 재발급
+- POST /auth/logout   : 로그아웃(현재 Access Token 폐기 + Refresh 폐기)
+- GET  /auth/me/usage : 내 저장 용량/문서 수와 쿼터
 
 📌 이 파일은 "HTTP 레이어(프레젠테이션 레이어)"
 - 요청/응답(Pydantic)
@@ -15,20 +18,31 @@ DB CRUD는 repository로 넘긴다.
 보안(JWT/비밀번호)은 core/security로 넘긴다.
 """
 
-from datetime import timedelta
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.core import auth_dep                  # Bearer 토큰 파싱 + 현재 사용자 주입
 from app.core import security                  # 비밀번호 검증/토큰 생성 같은 보안 유틸
 from app.core.config import settings           # 토큰 만료시간 등 설정값
+from app.core.logging import bind_user, get_logger, log_event  # 구조화 로그
+from app.core.revocation import revocation_list  # 메모리 denylist (즉시 반영용)
 from app.db.deps import get_db                 # 요청마다 DB 세션 주입하는 Depends
+from app.models.user import User
+from app.repository import token_repository    # Refresh/폐기 토큰 DB 접근
 from app.repository import user_repository     # User 관련 DB 접근(CRUD)
-from app.schemas.user import UserCreate, UserResponse  # 요청/응답 스키마(DTO)
+from app.schemas.token import LogoutRequest, RefreshRequest, TokenResponse
+from app.schemas.user import UsageResponse, UserCreate, UserResponse  # 요청/응답 스키마(DTO)
 
 # ✅ 이 파일에서 제공할 라우터 객체
 router = APIRouter()
 
+logger = get_logger("auth")
+
 
 @router.post(
     "/register",
@@ -65,25 +79,62 @@ def register_user(
     return new_user
 
 
-@router.post("/login")
+def _issue_tokens(db: Session, user: User) -> Tuple[TokenResponse, str]:
+    """
+    ✅ Access + Refresh 토큰 한 쌍 발급
+
+    - refresh 기록(jti)은 세션에 추가만 하고, commit은 호출자가 한다.
+      (회전 시 "이전 refresh 폐기"와 같은 트랜잭션으로 묶기 위해)
+
+    반환:
+    - (토큰 응답, 새 refresh 토큰의 jti)
+    """
+    expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    # JWT 생성 (sub(subject)에 이메일을 넣는다)
+    access_token = security.create_access_token(
+        subject=user.email,
+        expires_delta=expires,
+    )
+    refresh_token, refresh_jti, refresh_expires_at = security.create_refresh_token(
+        subject=user.email,
+    )
+    token_repository.add_refresh_token(
+        db,
+        jti=refresh_jti,
+        user_id=user.id,
+        expires_at=refresh_expires_at,
+    )
+
+    tokens = TokenResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        expires_in=int(expires.total_seconds()),
+    )
+    return tokens, refresh_jti
+
+
+@router.post("/login", response_model=TokenResponse)
 def login_user(
     user: UserCreate,                          # ✅ 로그인 요청(email/password)
     db: Session = Depends(get_db),             # ✅ DB 세션 주입
-):
+) -> TokenResponse:
     """
     ✅ 로그인 + JWT 발급
 
     흐름:
     1) 이메일로 사용자 조회
     2) 비밀번호 검증
-    3) 만료시간 설정
-    4) JWT 토큰 생성 후 반환
+    3) Access(짧은 수명) + Refresh(긴 수명, 1회용) 발급
+    4) Refresh 기록을 DB에 저장 후 반환
     """
 
     # 1) 이메일로 사용자 조회
     db_user = user_repository.get_user_by_email(db, user.email)
     if not db_user:
         # 보안상 "이메일 틀림/비번 틀림"을 구분하지 않고 동일 메시지
+        # (로그에는 구분해서 남기되 이메일 원문은 남기지 않는다)
+        log_event(logger, "auth.login_failed", logging.WARNING, reason="unknown_email")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email or password",
@@ -91,23 +142,128 @@ def login_user(
 
     # 2) 비밀번호 검증 (평문 vs 해시 비교)
     if not security.verify_password(user.password, db_user.hashed_password):
+        log_event(
+            logger, "auth.login_failed", logging.WARNING,
+            reason="bad_password", target_user_id=db_user.id,
+        )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email or password",
         )
 
-    # 3) 토큰 만료 시간(기본 설정값) 적용
-    expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # 3) 토큰 발급 + 4) refresh 기록 저장
+    tokens, _ = _issue_tokens(db, db_user)
+    db.commit()
+    bind_user(db_user.id)
+    log_event(logger, "auth.login")
 
-    # 4) JWT 생성 (sub(subject)에 이메일을 넣는다)
-    token = security.create_access_token(
-        subject=db_user.email,
-        expires_delta=expires,
+    # 클라이언트는 이후 요청부터 Authorization 헤더에 아래처럼 넣는다:
+    #    Authorization: Bearer <access_token>
+    # access가 만료되면 refresh_token으로 /auth/refresh 를 호출한다.
+    return tokens
+
+
+@router.post("/refresh", response_model=TokenResponse)
+def refresh_tokens(
+    body: RefreshRequest,
+    db: Session = Depends(get_db),
+) -> TokenResponse:
+    """
+    ✅ Refresh Token 회전(rotation)
+
+    흐름:
+    1) refresh JWT 검증 (서명/만료/type=refresh)
+    2) DB 기록 조회
+       - 기록 없음 → 401
+       - 이미 폐기된 refresh → "재사용 = 탈취 의심"
+         → 사용자의 모든 refresh 폐기 후 401
+    3) 현재 refresh 폐기 + 새 토큰 쌍 발급 (한 트랜잭션)
+       - 폐기는 "revoked_at IS NULL 인 경우만" 조건부 UPDATE로 한다.
+         동시에 온 같은 refresh 중 늦은 쪽은 0행 → 재사용으로 보고 전체 폐기
+    """
+    invalid = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
     )
 
-    # 5) 클라이언트는 이후 요청부터 Authorization 헤더에 아래처럼 넣는다:
-    #    Authorization: Bearer <access_token>
-    return {
-        "access_token": token,
-        "token_type": "bearer",
-    }
+    # 1) JWT 검증
+    payload = security.decode_token(body.refresh_token, security.REFRESH_TOKEN_TYPE)
+    if payload is None:
+        raise invalid
+
+    # 2) DB 기록 확인
+    record = token_repository.get_refresh_token(db, payload["jti"])
+    if record is None:
+        raise invalid
+
+    if record.revoked_at is not None:
+        # 이미 쓴(회전된) refresh가 다시 왔다 → 누군가 훔쳐서 쓰고 있을 수 있다.
+        token_repository.revoke_user_refresh_tokens(db, record.user_id)
+        db.commit()
+        raise invalid
+
+    user = user_repository.get_user_by_email(db, payload["sub"])
+    if user is None or user.id != record.user_id:
+        raise invalid
+
+    # 3) 회전: 새 토큰 발급 + 이전 refresh 폐기
+    tokens, new_jti = _issue_tokens(db, user)
+    if not token_repository.rotate_refresh_token(db, record.jti, new_jti):
+        # 2)를 통과한 뒤 다른 요청이 먼저 회전했다 → 새 토큰은 버리고 재사용 처리
+        db.rollback()
+        token_repository.revoke_user_refresh_tokens(db, record.user_id)
+        db.commit()
+        raise invalid
+    db.commit()
+
+    return tokens
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout_user(
+    body: Optional[LogoutRequest] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(auth_dep.security),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(auth_dep.get_current_user),
+) -> Response:
+    """
+    ✅ 로그아웃
+
+    - 현재 Access Token의 jti를 denylist에 넣는다.
+      - DB(revoked_tokens)에 저장 → 다른 워커도 동기화 주기 내에 반영
+      - 이 프로세스 메모리에는 즉시 반영
+    - refresh_token을 같이 보내면 그 refresh도 폐기한다.
+    """
+    # get_current_user를 통과했으므로 여기서는 항상 유효한 access token이다.
+    payload = security.decode_token(credentials.credentials, security.ACCESS_TOKEN_TYPE)
+    token_repository.add_revoked_token(db, jti=payload["jti"], expires_at=int(payload["exp"]))
+
+    if body is not None and body.refresh_token:
+        refresh = security.decode_token(body.refresh_token, security.REFRESH_TOKEN_TYPE)
+        if refresh is not None:
+            record = token_repository.get_refresh_token(db, refresh["jti"])
+            if record is not None and record.user_id == current_user.id and record.revoked_at is None:
+                record.revoked_at = datetime.now(timezone.utc)
+
+    db.commit()
+    revocation_list.add(payload["jti"], int(payload["exp"]))
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/me/usage", response_model=UsageResponse)
+def get_my_usage(
+    current_user: User = Depends(auth_dep.get_current_user),
+) -> UsageResponse:
+    """
+    ✅ 내 사용량 조회 (O(1))
+
+    - users 테이블의 증분 카운터를 그대로 읽는다.
+      (get_current_user가 이미 User를 읽었으므로 추가 쿼리도 없다)
+    """
+    return UsageResponse(
+        storage_bytes_used=current_user.storage_bytes_used,
+        document_count=current_user.document_count,
+        storage_quota_bytes=settings.USER_STORAGE_QUOTA_BYTES or None,
+        document_quota=settings.USER_DOCUMENT_QUOTA or None,
+    )
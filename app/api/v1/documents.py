@@ -4,41 +4,84 @@ app/api/v1/documents.py
 ✅ 역할
 - 문서 업로드: /documents/upload
 - 내 문서 목록: /documents/me
+- 볼 수 있는 문서 목록(내 문서 + 공유받은 문서): /documents/accessible
+- 전체 문서 목록(관리자): /documents
+- 파생 산출물(추출 텍스트 등): /documents/{id}/artifacts/{type}
+- 문서 삭제: DELETE /documents/{id}, POST /documents/bulk-delete
+  (soft delete - 파일은 app/jobs/gc.py 가 나중에 치운다)
 
 이 파일도 "HTTP 입구(프레젠테이션 레이어)"다.
 파일 저장(로컬) + DB 메타데이터 기록을 처리한다.
 """
 
+import logging
 import os
+import time
 import uuid
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
+from fastapi import (
+    APIRouter, BackgroundTasks, UploadFile, File, Depends, HTTPException, Query, Request, Response, status,
+)
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from app.core.cache import LRUCache, etag_matches, make_weak_etag
+from app.core.compression import PrecompressedBody, compressed_response
+from app.core.config import settings
+from app.core.file_sniff import DOCX_MIME, PDF_MIME, ContentTypeMismatch, UnsupportedFileType
+from app.core.artifacts import artifact_cache, get_processor, process_document, processors_for
+from app.core.logging import get_logger, log_event
+from app.core.uploads import UploadTooLarge, write_upload
 from app.db.deps import get_db
 
 # ✅ 로그인한 사용자(User)를 꺼내오는 의존성(JWT 검증 포함)
-from app.core.auth_dep import get_current_user
+from app.core.auth_dep import get_current_admin, get_current_user
 
 from app.models.user import User
 
 # ✅ 문서 관련 DB 작업은 repository에 위임
 from app.repository.document_repository import (
     create_document,
+    get_document,
     get_documents_by_owner,
+    list_documents,
+    soft_delete_documents,
 )
+from app.repository.access_repository import can_access, get_accessible_documents
+from app.repository.usage_repository import QuotaExceededError, remaining_bytes
 
-from app.schemas.document import DocumentResponse
+from app.schemas.document import (
+    AdminDocumentResponse,
+    DocumentBulkDelete,
+    DocumentBulkDeleteResponse,
+    DocumentResponse,
+)
 
 router = APIRouter()
 
+logger = get_logger("documents")
+
 # ✅ 업로드 파일을 저장할 폴더(로컬 저장)
 UPLOAD_DIR = "app/uploads"
 
 # ✅ 서버 시작 시 uploads 폴더 없으면 생성
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# ✅ /documents/me 응답 캐시
+# - 키: (owner_id, catalog_version) / 값: 이미 직렬화된 JSON 바이트(+압축본)
+# - 압축본도 같이 보관하므로 같은 버전은 인코딩마다 1번만 압축한다.
+# - 버전이 키에 들어 있으므로 "무효화"가 따로 필요 없다.
+#   문서가 바뀌면 버전이 올라가고, 옛 버전 항목은 LRU로 자연스럽게 밀려난다.
+document_list_cache: LRUCache[PrecompressedBody] = LRUCache(settings.DOCUMENT_LIST_CACHE_SIZE)
+
+# ✅ 문서 리스트 → JSON 바이트 직렬화기 (매 요청마다 만들지 않도록 모듈 레벨에 1개)
+_document_list_adapter = TypeAdapter(List[DocumentResponse])
+
+# ✅ 클라이언트/프록시가 저장은 하되, 쓰기 전에 항상 ETag로 재검증하게 한다.
+# - private: 사용자별 데이터라 공유 캐시(CDN 등)에 저장 금지
+_LIST_CACHE_CONTROL = "private, no-cache"
+
 
 @router.post(
     "/upload",
@@ -46,6 +89,7 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
     status_code=status.HTTP_201_CREATED,
 )
 def upload_document(
+    background_tasks: BackgroundTasks,             # ✅ 응답 후 실행할 작업(산출물 처리)
     file: UploadFile = File(...),                  # ✅ multipart/form-data 로 업로드된 파일
     db: Session = Depends(get_db),                 # ✅ DB 세션
     current_user: User = Depends(get_current_user) # ✅ JWT 기반 로그인 유저
@@ -53,25 +97,32 @@ def upload_document(
     """
     ✅ 문서 업로드 처리 흐름
 
-    1) 파일 MIME 타입 검사 (PDF/DOCX만 허용)
+    1) 파일 MIME 타입 검사 (PDF/DOCX만 허용) - 클라이언트 주장값으로 1차 필터
     2) 파일명 충돌 방지를 위해 UUID 파일명 생성
-    3) uploads 폴더에 실제 파일 저장
-    4) DB에 문서 메타데이터(원본명/경로/타입/소유자) 저장
+    3) uploads 폴더에 스트리밍 저장 + 매직 바이트 검사(실제 형식/페이지 수) + 크기/해시
+       - 남은 저장 쿼터를 넘는 순간 중단(413)
+    4) DB에 문서 메타데이터(원본명/경로/타입/소유자/판별 결과/크기/해시) 저장
+       - 같은 트랜잭션에서 사용량 카운터 증가(동시 업로드도 쿼터를 넘지 못함)
     5) 저장된 문서 정보를 반환
+    6) 응답 후 파생 산출물 처리(텍스트 추출 등) - 같은 내용이 이미 처리됐으면 캐시 히트
     """
 
     # 1) 허용할 MIME 타입 목록
-    allowed_types = [
-        "application/pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    ]
- 
+    allowed_types = [PDF_MIME, DOCX_MIME]
+
     if file.content_type not in allowed_types:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only PDF and DOCX files are allowed.",
         )
 
+    # 문서 개수 쿼터가 이미 찼으면 파일을 쓰기 전에 거절
+    if 0 < settings.USER_DOCUMENT_QUOTA <= current_user.document_count:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail="Document quota exceeded",
+        )
+
     # 2) 원본 파일명과 확장자 추출
     original_filename = file.filename or "unknown"
     ext = original_filename.split(".")[-1]  # 예: report.pdf -> pdf
@@ -82,21 +133,75 @@ def upload_document(
     # 4) 저장 경로 생성
     save_path = os.path.join(UPLOAD_DIR, unique_filename)
 
-    # 5) 실제 파일 저장
-    # ⚠️ 지금 방식은 file 전체를 한 번에 읽는다(큰 파일이면 부담될 수 있음)
-    #    나중에 스트리밍 방식으로 개선 가능.
-    with open(save_path, "wb") as buffer:
-        buffer.write(file.file.read())
-
-    # 6) DB에 메타데이터 저장
-    doc = create_document(
-        db=db,
-        filename=original_filename,
-        file_path=save_path,
-        content_type=file.content_type,
-        owner_id=current_user.id,
+    # 5) 실제 파일 저장 (청크 단위 + 내용 검사 + 크기/해시 계산 + 쿼터)
+    # - current_user는 이번 요청에서 막 읽었으므로 사용량도 최신에 가깝다.
+    #   최종 판단은 create_document의 원자적 UPDATE가 한다.
+    started = time.perf_counter()
+    try:
+        stored = write_upload(
+            file.file,
+            save_path,
+            max_bytes=remaining_bytes(current_user),
+            expected_type=file.content_type,
+        )
+    except ContentTypeMismatch as exc:
+        # 실제 내용과 주장한 타입이 다르면(예: DOCX를 application/pdf로 보냄)
+        # 형식이 판별되는 청크에서 바로 중단된다 → 나머지 바디는 디스크에 쓰지 않음
+        log_event(
+            logger, "document.rejected", logging.WARNING,
+            reason="type_mismatch", declared=file.content_type,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    except UnsupportedFileType as exc:
+        log_event(logger, "document.rejected", logging.WARNING, reason="unsupported_content")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    except UploadTooLarge as exc:
+        log_event(logger, "document.rejected", logging.WARNING, reason="storage_quota")
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=str(exc),
+        )
+
+    # 6) DB에 메타데이터 저장 (+ 사용량 카운터)
+    try:
+        doc = create_document(
+            db=db,
+            filename=original_filename,
+            file_path=save_path,
+            content_type=file.content_type,
+            owner_id=current_user.id,
+            detected_type=stored.detected_type,
+            page_count=stored.page_count,
+            size_bytes=stored.size_bytes,
+            sha256=stored.sha256,
+        )
+    except QuotaExceededError as exc:
+        # 그 사이 다른 업로드가 쿼터를 써버린 경우 → 저장한 파일도 치운다
+        os.remove(save_path)
+        log_event(logger, "document.rejected", logging.WARNING, reason="quota_race")
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=str(exc),
+        )
+
+    log_event(
+        logger,
+        "document.uploaded",
+        document_id=doc.id,
+        content_type=doc.detected_type,
+        size_bytes=doc.size_bytes,
+        page_count=doc.page_count,
+        write_ms=round((time.perf_counter() - started) * 1000, 3),
     )
 
+    if processors_for(doc.detected_type):
+        background_tasks.add_task(process_document, doc.id)
     return doc
 
 
@@ -105,15 +210,155 @@ def upload_document(
     response_model=List[DocumentResponse],
 )
 def list_my_documents(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> List[DocumentResponse]:
+) -> Response:
     """
-    ✅ 내 문서 목록 조회
+    ✅ 내 문서 목록 조회 (ETag 기반 조건부 GET 지원)
 
     - Authorization: Bearer <token> 필요
     - 현재 로그인한 사용자의 id 기준으로 documents를 조회해서 반환
+
+    흐름:
+    1) users.catalog_version 으로 약한 ETag 생성 (User는 이미 로드됨 → 추가 쿼리 X)
+    2) If-None-Match 가 일치하면 문서 쿼리 없이 304 반환
+    3) 캐시에 직렬화된(필요하면 압축된) 바디가 있으면 그대로 200 반환
+    4) 없으면 조회 + 직렬화 후 캐시에 넣고 200 반환
     """
 
-    docs = get_documents_by_owner(db, owner_id=current_user.id)
-    return docs
+    owner_id = current_user.id
+    version = current_user.catalog_version
+    etag = make_weak_etag("docs", owner_id, version)
+    headers = {"ETag": etag, "Cache-Control": _LIST_CACHE_CONTROL}
+
+    # 2) 클라이언트가 가진 버전이 최신이면 바디 없이 304
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # 3) 같은 버전을 이미 직렬화해둔 적이 있으면 재사용
+    cache_key = (owner_id, version)
+    body = document_list_cache.get(cache_key)
+
+    if body is None:
+        # 4) 버전을 먼저 읽고 나서 문서를 조회하므로,
+        #    그 사이 업로드가 끼어들어도 "버전보다 오래된 목록"이 캐시에 들어가진 않는다.
+        docs = get_documents_by_owner(db, owner_id=owner_id)
+        body = PrecompressedBody(
+            _document_list_adapter.dump_json(
+                _document_list_adapter.validate_python(docs, from_attributes=True)
+            )
+        )
+        document_list_cache.put(cache_key, body)
+
+    return compressed_response(
+        request, body, media_type="application/json", headers=headers
+    )
+
+
+@router.get(
+    "/accessible",
+    response_model=List[DocumentResponse],
+)
+def list_accessible_documents(
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> List[DocumentResponse]:
+    """
+    ✅ 내가 볼 수 있는 문서 목록 (내 문서 + 사용자/그룹/폴더로 공유받은 문서)
+
+    - 공유 규칙(ACL)을 조인하지 않고 미리 계산해 둔 접근 인덱스
+      (document_access)를 범위 스캔한다 → 그룹 중첩이 깊어도 쿼리 1번
+    - /documents/me 는 기존대로 "내가 올린 문서"만 (캐시/ETag 유지)
+    """
+    return get_accessible_documents(db, current_user.id, limit=limit, offset=offset)
+
+
+@router.get(
+    "",
+    response_model=List[AdminDocumentResponse],
+)
+def list_all_documents(
+    owner_id: Optional[List[int]] = Query(None),   # ✅ ?owner_id=1&owner_id=2 로 여러 명 필터
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    _admin: User = Depends(get_current_admin),
+) -> List[AdminDocumentResponse]:
+    """
+    ✅ 전체 문서 목록 (관리자 전용, 소유자 이메일 포함)
+
+    - owner(User)를 문서와 함께 한 번에 로딩한다(joined/selectin).
+      → 문서가 몇 개든 쿼리 수가 고정 (행마다 user 쿼리 X)
+    """
+    return list_documents(db, owner_ids=owner_id, limit=limit, offset=offset)
+
+
+@router.post("/bulk-delete", response_model=DocumentBulkDeleteResponse)
+def bulk_delete_documents(
+    body: DocumentBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> DocumentBulkDeleteResponse:
+    """
+    ✅ 내 문서 여러 개 삭제 (트랜잭션 1번)
+
+    - 내 문서가 아닌 id는 건너뛰고 not_found 로 알려준다(전체를 실패시키지 않음).
+    """
+    deleted = soft_delete_documents(db, current_user.id, body.ids)
+    log_event(logger, "document.deleted", count=len(deleted))
+    return DocumentBulkDeleteResponse(
+        deleted=deleted,
+        not_found=sorted(set(body.ids) - set(deleted)),
+    )
+
+
+@router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_document(
+    document_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    """
+    ✅ 문서 삭제 (soft delete)
+
+    - deleted_at만 채우고 바로 204 → 파일 크기와 상관없이 빠르다.
+    - 목록/공유/쿼터에서는 바로 빠지고, 파일은 유예 기간 뒤 GC가 회수한다.
+    - 볼 수 없는 문서(없음/삭제됨 포함)는 404, 공유받았지만 내 문서가 아니면 403
+    """
+    doc = get_document(db, document_id)
+    if doc is None or not can_access(db, current_user.id, document_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+    if doc.owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not the document owner")
+
+    soft_delete_documents(db, current_user.id, [document_id])
+    log_event(logger, "document.deleted", document_id=document_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/{document_id}/artifacts/{artifact_type}")
+def get_document_artifact(
+    document_id: int,
+    artifact_type: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    """
+    ✅ 문서의 파생 산출물 (예: /documents/1/artifacts/text → 추출 텍스트)
+
+    - 볼 수 있는 문서(내 문서 + 공유받은 문서)만
+    - 같은 내용(sha256)의 결과가 캐시에 있으면 그대로, 없으면 지금 계산해서 저장
+    """
+    doc = get_document(db, document_id)
+    if doc is None or not can_access(db, current_user.id, document_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+
+    processor = get_processor(artifact_type)
+    if processor is None or doc.detected_type not in processor.content_types or not doc.sha256:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Artifact not available")
+
+    data = artifact_cache.get_or_compute(db, processor, doc.sha256, doc.file_path)
+    return Response(content=data, media_type=processor.media_type)
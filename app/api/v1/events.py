@@ -0,0 +1,190 @@
+"""
+app/api/v1/events.py
+
+✅ 문서 이벤트 알림 API 라우터 (/documents 아래에 붙는다)
+- GET    /documents/events          : SSE 스트림 (새 문서 이벤트를 실시간으로 받음)
+- POST   /documents/webhooks        : 웹훅 구독 추가
+- GET    /documents/webhooks        : 내 웹훅 구독 목록
+- DELETE /documents/webhooks/{id}   : 웹훅 구독 삭제
+
+왜 필요한가?
+- 새 문서를 알기 위해 /documents/me 를 주기적으로 폴링하면
+  매번 목록 전체를 읽는다(대부분 변화 없음).
+- 이벤트는 문서와 같은 트랜잭션에서 outbox_events 에 기록되고,
+  - 서버 간 연동은 웹훅(app/jobs/outbox_dispatcher.py가 전달)
+  - 브라우저/CLI는 SSE 연결 하나로
+  "바뀐 것만" 받는다.
+
+SSE 재연결:
+- 이벤트마다 id 를 보내므로 끊겼다가 다시 연결할 때
+  Last-Event-ID 헤더(브라우저 EventSource가 자동으로 보냄) 또는 ?after= 로 이어받는다.
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.auth_dep import get_current_user
+from app.core.config import settings
+from app.core.webhook_targets import UnsafeWebhookTarget, resolve_webhook_target
+from app.db.database import SessionLocal
+from app.db.deps import get_db
+from app.models.user import User
+from app.repository import outbox_repository
+from app.schemas.event import WebhookCreate, WebhookCreatedResponse, WebhookResponse
+
+router = APIRouter()
+
+
+# ------------------------------------------------------------
+# SSE
+# ------------------------------------------------------------
+
+
+def _fetch_events(owner_id: int, after_id: int) -> List[Tuple[int, str, str]]:
+    """스트림용 짧은 조회 (요청 세션을 스트림 내내 잡고 있지 않도록 매번 새 세션)"""
+    with SessionLocal() as db:
+        return [
+            (event.id, event.event_type, event.payload)
+            for event in outbox_repository.get_events_after(
+                db,
+                owner_id,
+                after_id,
+                limit=settings.WEBHOOK_BATCH_SIZE,
+                visible_before=outbox_repository.visible_before(),
+            )
+        ]
+
+
+def _current_cursor(owner_id: int) -> int:
+    """?after / Last-Event-ID 가 없을 때 시작 cursor (지금 시점)"""
+    with SessionLocal() as db:
+        return outbox_repository.get_last_event_id(
+            db, owner_id, visible_before=outbox_repository.visible_before()
+        )
+
+
+async def event_stream(
+    owner_id: int,
+    after_id: int,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    *,
+    poll_seconds: Optional[float] = None,
+    heartbeat_seconds: Optional[float] = None,
+) -> AsyncIterator[str]:
+    """
+    ✅ SSE 메시지 생성기
+
+    - after_id 이후 이벤트를 id 순서로 보낸다.
+      (OUTBOX_CURSOR_LAG_SECONDS 만큼 지난 이벤트만 → commit이 늦은 작은 id를 건너뛰지 않음)
+    - 새 이벤트가 없으면 poll_seconds 쉬고 다시 확인((owner_id, id) 인덱스 조회 1번)
+    - heartbeat_seconds 동안 보낸 게 없으면 주석 라인(": ping")으로 연결 유지
+    """
+    poll = settings.OUTBOX_SSE_POLL_SECONDS if poll_seconds is None else poll_seconds
+    heartbeat = settings.OUTBOX_SSE_HEARTBEAT_SECONDS if heartbeat_seconds is None else heartbeat_seconds
+    cursor = after_id
+    last_sent = time.monotonic()
+
+    # 재연결 간격 안내 (ms)
+    yield f"retry: {int(poll * 1000)}\n\n"
+
+    while not await is_disconnected():
+        events = await run_in_threadpool(_fetch_events, owner_id, cursor)
+        for event_id, event_type, payload in events:
+            yield f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n"
+            cursor = event_id
+        if events:
+            last_sent = time.monotonic()
+            if len(events) >= settings.WEBHOOK_BATCH_SIZE:
+                continue  # 밀린 이벤트가 더 있다 → 쉬지 않고 이어서
+        elif time.monotonic() - last_sent >= heartbeat:
+            yield ": ping\n\n"
+            last_sent = time.monotonic()
+        await asyncio.sleep(poll)
+
+
+@router.get("/events")
+async def stream_document_events(
+    request: Request,
+    after: Optional[int] = Query(None, ge=0, description="이 id 이후 이벤트부터 (없으면 지금부터)"),
+    last_event_id: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    ✅ 내 문서 이벤트 SSE 스트림
+
+    - Content-Type: text/event-stream (압축 미들웨어 대상 아님 → 버퍼링 없이 바로 전송)
+    - 이벤트 형식:
+        id: 42
+        event: document.created
+        data: {"id": 7, "filename": "a.pdf", ...}
+    """
+    owner_id = current_user.id
+
+    cursor = after
+    if cursor is None and last_event_id and last_event_id.isdigit():
+        cursor = int(last_event_id)
+    if cursor is None:
+        # async 엔드포인트라서 동기 DB 조회는 스레드풀에서 (이벤트 루프를 막지 않음)
+        cursor = await run_in_threadpool(_current_cursor, owner_id)
+
+    return StreamingResponse(
+        event_stream(owner_id, cursor, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ------------------------------------------------------------
+# 웹훅 구독
+# ------------------------------------------------------------
+
+
+@router.post(
+    "/webhooks",
+    response_model=WebhookCreatedResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_webhook(
+    body: WebhookCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> WebhookCreatedResponse:
+    """
+    ✅ 웹훅 구독 추가
+
+    - 구독 이후에 생기는 이벤트부터 전달한다.
+    - 응답의 secret으로 요청 서명(X-DocuMind-Signature)을 검증할 수 있다.
+    - https + 공인 주소로 풀리는 호스트만 받는다(SSRF 방지, app/core/webhook_targets.py).
+    """
+    try:
+        resolve_webhook_target(str(body.url))
+    except UnsafeWebhookTarget as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return outbox_repository.create_subscription(db, owner_id=current_user.id, url=str(body.url))
+
+
+@router.get("/webhooks", response_model=List[WebhookResponse])
+def list_webhooks(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> List[WebhookResponse]:
+    return outbox_repository.get_subscriptions_by_owner(db, current_user.id)
+
+
+@router.delete("/webhooks/{subscription_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_webhook(
+    subscription_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    subscription = outbox_repository.get_subscription(db, subscription_id)
+    if subscription is None or subscription.owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Webhook not found")
+    outbox_repository.delete_subscription(db, subscription)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
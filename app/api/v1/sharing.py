@@ -0,0 +1,200 @@
+"""
+app/api/v1/sharing.py
+
+✅ 공유(Sharing) API 라우터
+- POST   /sharing/folders                       : 폴더 만들기
+- PUT    /sharing/documents/{id}/folder         : 문서를 폴더에 넣기/빼기
+- POST   /sharing/groups                        : 그룹 만들기
+- POST   /sharing/groups/{id}/members           : 그룹에 사용자/하위 그룹 추가
+- DELETE /sharing/groups/{id}/members/{member}  : 그룹 구성원 제거
+- POST   /sharing/shares                        : 문서/폴더를 사용자/그룹에 공유
+- DELETE /sharing/shares/{id}                   : 공유 해제
+
+"공유받은 문서 목록"은 GET /documents/accessible (app/api/v1/documents.py)
+
+권한 정책
+- 폴더/문서/그룹은 소유자(만든 사람)만 바꿀 수 있다. (아니면 403)
+- 없는 대상이면 404
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session
+
+from app.core.auth_dep import get_current_user
+from app.db.deps import get_db
+from app.models.user import User
+from app.repository import document_repository, sharing_repository, user_repository
+from app.schemas.document import DocumentResponse
+from app.schemas.sharing import (
+    DocumentMove,
+    FolderCreate,
+    FolderResponse,
+    GroupCreate,
+    GroupMemberCreate,
+    GroupMemberResponse,
+    GroupResponse,
+    ShareCreate,
+    ShareResponse,
+)
+
+router = APIRouter()
+
+
+def _require_owner(obj, current_user: User, name: str):
+    """대상이 없으면 404, 내 것이 아니면 403"""
+    if obj is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{name} not found")
+    if obj.owner_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Not the {name.lower()} owner")
+    return obj
+
+
+def _require_user(db: Session, user_id: int) -> None:
+    if not user_repository.get_users_by_ids(db, [user_id]):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+
+# ------------------------------------------------------------
+# 폴더
+# ------------------------------------------------------------
+
+
+@router.post("/folders", response_model=FolderResponse, status_code=status.HTTP_201_CREATED)
+def create_folder(
+    body: FolderCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> FolderResponse:
+    return sharing_repository.create_folder(db, name=body.name, owner_id=current_user.id)
+
+
+@router.put("/documents/{document_id}/folder", response_model=DocumentResponse)
+def move_document(
+    document_id: int,
+    body: DocumentMove,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> DocumentResponse:
+    """
+    ✅ 문서를 폴더에 넣기(folder_id) / 빼기(null)
+
+    - 폴더에 걸린 공유가 이 문서에도 적용된다(접근 인덱스는 이 문서만 다시 계산).
+    """
+    document = _require_owner(
+        document_repository.get_document(db, document_id), current_user, "Document"
+    )
+    if body.folder_id is not None:
+        _require_owner(sharing_repository.get_folder(db, body.folder_id), current_user, "Folder")
+    return sharing_repository.move_document(db, document, body.folder_id)
+
+
+# ------------------------------------------------------------
+# 그룹
+# ------------------------------------------------------------
+
+
+@router.post("/groups", response_model=GroupResponse, status_code=status.HTTP_201_CREATED)
+def create_group(
+    body: GroupCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> GroupResponse:
+    return sharing_repository.create_group(db, name=body.name, owner_id=current_user.id)
+
+
+@router.post(
+    "/groups/{group_id}/members",
+    response_model=GroupMemberResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def add_group_member(
+    group_id: int,
+    body: GroupMemberCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> GroupMemberResponse:
+    """
+    ✅ 그룹에 사용자 또는 하위 그룹 추가
+
+    - 하위 그룹도 내가 만든 그룹이어야 한다.
+    - 순환(A ⊃ B ⊃ A)이 생기면 409
+    """
+    _require_owner(sharing_repository.get_group(db, group_id), current_user, "Group")
+    if body.group_id is not None:
+        _require_owner(sharing_repository.get_group(db, body.group_id), current_user, "Group")
+    else:
+        _require_user(db, body.user_id)
+
+    try:
+        return sharing_repository.add_group_member(
+            db, group_id, user_id=body.user_id, member_group_id=body.group_id
+        )
+    except sharing_repository.GroupCycleError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+
+
+@router.delete("/groups/{group_id}/members/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
+def remove_group_member(
+    group_id: int,
+    member_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    _require_owner(sharing_repository.get_group(db, group_id), current_user, "Group")
+    member = sharing_repository.get_group_member(db, member_id)
+    if member is None or member.group_id != group_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
+    sharing_repository.remove_group_member(db, member)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# ------------------------------------------------------------
+# 공유 규칙
+# ------------------------------------------------------------
+
+
+@router.post("/shares", response_model=ShareResponse, status_code=status.HTTP_201_CREATED)
+def create_share(
+    body: ShareCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ShareResponse:
+    """
+    ✅ 문서/폴더 공유
+
+    - 대상(문서/폴더)은 내 것이어야 한다.
+    - 받는 쪽은 사용자 또는 (아무) 그룹
+    """
+    if body.document_id is not None:
+        _require_owner(document_repository.get_document(db, body.document_id), current_user, "Document")
+    else:
+        _require_owner(sharing_repository.get_folder(db, body.folder_id), current_user, "Folder")
+
+    if body.user_id is not None:
+        _require_user(db, body.user_id)
+    elif sharing_repository.get_group(db, body.group_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
+
+    return sharing_repository.create_share(
+        db,
+        created_by=current_user.id,
+        document_id=body.document_id,
+        folder_id=body.folder_id,
+        user_id=body.user_id,
+        group_id=body.group_id,
+    )
+
+
+@router.delete("/shares/{share_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_share(
+    share_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    share = sharing_repository.get_share(db, share_id)
+    if share is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share not found")
+    if share.created_by != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not the share owner")
+    sharing_repository.delete_share(db, share)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,316 @@
+"""
+app/core/artifacts.py
+
+✅ 파생 산출물(텍스트/미리보기/임베딩 등) 캐시 + 프로세서 레지스트리
+
+왜 필요한가?
+- 문서 처리 결과를 Document row마다 계산하면, 같은 파일(같은 sha256)이
+  여러 번 올라올 때마다 같은 계산을 반복한다.
+- 그래서 결과를 (content_sha256, artifact_type, processor_version) 키로 한 번만 만들고
+  이후에는 캐시 파일을 읽는다.
+
+구성:
+- 프로세서: register_processor(...)로 등록하는 "파일 경로 → bytes" 함수
+  (artifact_type, version, 적용할 content_type, 응답 media_type)
+- 저장: ARTIFACT_DIR/<sha 앞 2글자>/<sha>.<type>.<version>.z  (zlib 압축)
+  + derived_artifacts 테이블(인덱스/LRU 정보)
+- 용량 상한(ARTIFACT_CACHE_MAX_BYTES, 압축 후 기준)을 넘으면
+  마지막 사용 시각이 가장 오래된 것부터 지운다(LRU).
+- 통계: 히트율 / 히트로 아낀 원본 바이트 / 아낀 계산 시간(ms) → GET /stats/artifacts
+
+업로드 후 처리:
+- upload_document 가 응답을 보낸 뒤(BackgroundTasks) process_document(document_id)를 실행한다.
+- 새 프로세서를 붙여도 처리 전에 항상 캐시를 먼저 본다(get_or_compute).
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import extractors
+from app.core.config import settings
+from app.core.file_sniff import DOCX_MIME, PDF_MIME
+from app.db.database import SessionLocal
+from app.models.artifact import DerivedArtifact
+from app.models.document import Document
+from app.repository import artifact_repository
+
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+# ------------------------------------------------------------
+# 프로세서 레지스트리
+# ------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Processor:
+    artifact_type: str
+    version: str
+    content_types: FrozenSet[str]
+    media_type: str
+    func: Callable[[str], bytes]
+
+
+_processors: Dict[str, Processor] = {}
+
+
+def register_processor(
+    artifact_type: str,
+    func: Callable[[str], bytes],
+    *,
+    version: str,
+    content_types: Iterable[str],
+    media_type: str = "application/octet-stream",
+) -> Processor:
+    """
+    프로세서 등록 (같은 artifact_type이면 교체)
+
+    - 처리 로직을 바꾸면 version을 올린다 → 예전 캐시는 키가 달라서 안 쓰이고 LRU로 정리된다.
+    """
+    processor = Processor(artifact_type, version, frozenset(content_types), media_type, func)
+    _processors[artifact_type] = processor
+    return processor
+
+
+def get_processor(artifact_type: str) -> Optional[Processor]:
+    return _processors.get(artifact_type)
+
+
+def processors_for(content_type: Optional[str]) -> List[Processor]:
+    """업로드 후 자동 실행할 프로세서 (ARTIFACT_PROCESSORS 에 켜진 것 + 형식 일치)"""
+    return [
+        p for name, p in _processors.items()
+        if name in settings.ARTIFACT_PROCESSORS and content_type in p.content_types
+    ]
+
+
+# ------------------------------------------------------------
+# 통계
+# ------------------------------------------------------------
+
+
+class ArtifactStats:
+    """이 프로세스의 캐시 통계 (DB 누적값은 artifact_repository.summary)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0        # 히트로 다시 만들지 않은 원본 바이트
+        self.compute_ms_saved = 0.0
+        self.compute_ms_spent = 0.0
+        self.evictions = 0
+
+    def record_hit(self, artifact: DerivedArtifact) -> None:
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += artifact.raw_size_bytes
+            self.compute_ms_saved += artifact.compute_ms
+
+    def record_miss(self, compute_ms: float) -> None:
+        with self._lock:
+            self.misses += 1
+            self.compute_ms_spent += compute_ms
+
+    def record_evictions(self, count: int) -> None:
+        with self._lock:
+            self.evictions += count
+
+    def snapshot(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "bytes_saved": self.bytes_saved,
+            "compute_ms_saved": round(self.compute_ms_saved, 3),
+            "compute_ms_spent": round(self.compute_ms_spent, 3),
+            "evictions": self.evictions,
+        }
+
+
+# ------------------------------------------------------------
+# 캐시
+# ------------------------------------------------------------
+
+
+class ArtifactCache:
+    """
+    ✅ 내용 해시 기반 산출물 캐시
+
+    - 같은 키를 동시에 처리하려는 요청은 키별 락(64개 줄무늬 락)으로 줄 세워서
+      이 프로세스 안에서는 한 번만 계산한다.
+      (다른 워커와 동시에 계산하면 같은 경로에 같은 내용을 쓰고, 인덱스는 먼저 저장한 쪽이 이긴다)
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        level: Optional[int] = None,
+    ) -> None:
+        self.root = settings.ARTIFACT_DIR if root is None else root
+        self.max_bytes = settings.ARTIFACT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.level = settings.ARTIFACT_COMPRESSION_LEVEL if level is None else level
+        self.stats = ArtifactStats()
+        self._locks = [threading.Lock() for _ in range(64)]
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._locks[int(hashlib.blake2b(key.encode(), digest_size=2).hexdigest(), 16) % 64]
+
+    def path_for(self, sha256: str, processor: Processor) -> str:
+        name = _SAFE_NAME_RE.sub("_", f"{sha256}.{processor.artifact_type}.{processor.version}")
+        return os.path.join(self.root, sha256[:2], f"{name}.z")
+
+    def _read(self, db: Session, artifact: DerivedArtifact) -> Optional[bytes]:
+        """캐시 파일 읽기. 파일이 없거나 깨졌으면 인덱스를 지우고 None(→ 다시 계산)"""
+        try:
+            with open(artifact.file_path, "rb") as src:
+                return zlib.decompress(src.read())
+        except (OSError, zlib.error):
+            artifact_repository.delete_artifact(db, artifact)
+            return None
+
+    def lookup(self, db: Session, processor: Processor, sha256: str) -> Optional[bytes]:
+        """캐시에 있으면 내용, 없으면 None (히트 통계/LRU 시각 갱신 포함)"""
+        artifact = artifact_repository.get_artifact(
+            db, sha256, processor.artifact_type, processor.version
+        )
+        if artifact is None:
+            return None
+        data = self._read(db, artifact)
+        if data is None:
+            return None
+        artifact_repository.touch_artifact(db, artifact.id, time.time())
+        self.stats.record_hit(artifact)
+        return data
+
+    def get_or_compute(
+        self, db: Session, processor: Processor, sha256: str, source_path: str
+    ) -> bytes:
+        """
+        ✅ 캐시를 먼저 보고, 없으면 계산해서 저장한 뒤 반환
+        """
+        key = f"{sha256}:{processor.artifact_type}:{processor.version}"
+        with self._lock_for(key):
+            cached = self.lookup(db, processor, sha256)
+            if cached is not None:
+                return cached
+
+            started = time.perf_counter()
+            data = processor.func(source_path)
+            compute_ms = (time.perf_counter() - started) * 1000
+            self.stats.record_miss(compute_ms)
+
+            self._store(db, processor, sha256, data, compute_ms)
+            return data
+
+    def _store(
+        self, db: Session, processor: Processor, sha256: str, data: bytes, compute_ms: float
+    ) -> None:
+        compressed = zlib.compress(data, self.level)
+        if len(compressed) > self.max_bytes:
+            return  # 이 결과 하나가 상한보다 크다 → 저장하지 않음
+
+        path = self.path_for(sha256, processor)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as out:
+            out.write(compressed)
+        os.replace(tmp_path, path)    # 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 원자적 교체
+
+        now = time.time()
+        stored = artifact_repository.add_artifact(
+            db,
+            DerivedArtifact(
+                sha256=sha256,
+                artifact_type=processor.artifact_type,
+                processor_version=processor.version,
+                file_path=path,
+                size_bytes=len(compressed),
+                raw_size_bytes=len(data),
+                compute_ms=compute_ms,
+                created_at=now,
+                last_accessed_at=now,
+            ),
+        )
+        if stored:
+            self.evict(db)
+        # 다른 워커가 먼저 저장했으면 같은 경로(같은 내용)를 쓰고 있으므로 파일은 그대로 둔다.
+
+    def evict(self, db: Session) -> int:
+        """압축 크기 합계가 상한 이하가 될 때까지 LRU 순서로 삭제. 지운 개수 반환"""
+        total = artifact_repository.total_size(db)
+        evicted = 0
+        while total > self.max_bytes:
+            victims = artifact_repository.least_recently_used(db)
+            if not victims:
+                break
+            for artifact in victims:
+                if total <= self.max_bytes:
+                    break
+                total -= artifact.size_bytes
+                try:
+                    os.remove(artifact.file_path)
+                except OSError:
+                    pass
+                artifact_repository.delete_artifact(db, artifact)
+                evicted += 1
+        self.stats.record_evictions(evicted)
+        return evicted
+
+
+# 프로세스 전역 1개
+artifact_cache = ArtifactCache()
+
+
+def run_processors(db: Session, sha256: str, content_type: str, source_path: str) -> Dict[str, int]:
+    """
+    문서 1개에 켜진 프로세서를 모두 적용한다(캐시 우선). 산출물 크기 반환
+
+    - 프로세서가 실패해도 업로드/다른 프로세서에는 영향을 주지 않는다.
+    """
+    results: Dict[str, int] = {}
+    for processor in processors_for(content_type):
+        try:
+            data = artifact_cache.get_or_compute(db, processor, sha256, source_path)
+        except Exception:
+            db.rollback()
+            continue
+        results[processor.artifact_type] = len(data)
+    return results
+
+
+def process_document(document_id: int) -> None:
+    """
+    ✅ 업로드 직후 백그라운드 처리 (응답을 보낸 뒤 실행, 자체 세션 사용)
+    """
+    with SessionLocal() as db:
+        document = db.get(Document, document_id)
+        if document is None or not document.sha256:
+            return
+        run_processors(db, document.sha256, document.detected_type, document.file_path)
+
+
+# ------------------------------------------------------------
+# 기본 프로세서
+# ------------------------------------------------------------
+
+register_processor(
+    "text",
+    extractors.extract_text,
+    version="1",
+    content_types=[PDF_MIME, DOCX_MIME],
+    media_type="text/plain; charset=utf-8",
+)
@@ -13,11 +13,15 @@ FastAPI가 자동으로:
 4) current_user로 User ORM 객체를 주입해준다.
 """
 
+import logging
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from app.core.security import decode_access_token     # JWT 검증 + sub 추출
+from app.core.logging import bind_user, get_logger, log_event  # 구조화 로그
+from app.core.revocation import revocation_list       # 폐기 토큰 denylist (메모리)
+from app.core.security import decode_access_token     # JWT 검증 + 폐기 검사 + sub 추출
 from app.db.deps import get_db                         # 요청당 DB 세션 주입
 from app.repository.user_repository import get_user_by_email  # 유저 조회(이메일)
 from app.models.user import User                       # 반환 타입(ORM 모델)
@@ -27,6 +31,8 @@ from app.models.user import User                       # 반환 타입(ORM 모
 # - 실패하면(헤더 없거나 포맷 이상) FastAPI가 403/401 계열로 처리한다.
 security = HTTPBearer()
 
+logger = get_logger("auth")
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),  # ✅ Bearer 토큰 파싱 결과
@@ -50,9 +56,12 @@ def get_current_user(
 
     # 2) JWT 검증 + sub(subject) 추출
     # - 유효하면 이메일(sub) 문자열이 나온다.
-    # - 만료/위조/포맷 오류면 None
+    # - 만료/위조/포맷 오류/폐기(로그아웃)된 토큰이면 None
+    # - 폐기 목록은 몇 초마다만 DB와 증분 동기화한다(대부분 시간 비교 1번으로 끝)
+    revocation_list.maybe_sync(db)
     email = decode_access_token(token)
     if email is None:
+        log_event(logger, "auth.rejected", logging.WARNING, reason="invalid_token")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
@@ -65,10 +74,32 @@ def get_current_user(
         # - 탈퇴했거나
         # - DB가 초기화됐거나
         # - 이상한 토큰을 들고 온 케이스
+        log_event(logger, "auth.rejected", logging.WARNING, reason="user_not_found")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
     # 4) 검증 통과 → 현재 사용자(User ORM 객체) 반환
+    # - 요청 로그에 user_id를 붙인다. 성공 이벤트는 DEBUG(평소엔 링 버퍼에만)
+    bind_user(user.id)
+    log_event(logger, "auth.authenticated", logging.DEBUG)
     return user
+
+
+def get_current_admin(
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """
+    ✅ 관리자만 통과시키는 Depends
+
+    - 인증 실패 → get_current_user가 401
+    - 인증은 됐지만 관리자가 아님 → 403 (docs/concepts/02 정책)
+    - 권한은 토큰 클레임이 아니라 DB의 is_admin으로 판단한다(변경 즉시 반영).
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return current_user
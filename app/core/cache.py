@@ -0,0 +1,94 @@
+"""
+app/core/cache.py
+
+✅ HTTP 응답 캐싱 유틸 모듈
+- LRUCache       : 프로세스 내부(in-process) LRU 캐시 (직렬화된 응답 바디 저장용)
+- make_weak_etag : "버전 번호"로부터 약한(weak) ETag 문자열 생성
+- etag_matches   : If-None-Match 헤더와 ETag 비교 (조건부 GET → 304 판단)
+
+왜 필요한가?
+- 모바일 클라이언트가 /documents/me 를 몇 초마다 폴링한다.
+- 아무것도 안 바뀌었는데 매번 쿼리 + JSON 직렬화를 다시 하는 건 낭비다.
+- "소유자별 카탈로그 버전(users.catalog_version)"만 보면 변경 여부를 알 수 있으므로
+  버전 → ETag 로 만들어서 304 Not Modified 로 응답하면 된다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """
+    ✅ 스레드 안전한 LRU(Least Recently Used) 캐시
+
+    - 최대 max_entries 개까지만 보관한다.
+    - 꽉 차면 "가장 오래 안 쓰인" 항목부터 버린다.
+    - FastAPI의 sync 엔드포인트는 스레드풀에서 돌기 때문에 Lock으로 보호한다.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                # 최근에 사용됨 → 맨 뒤로 이동
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            # 용량 초과분은 앞쪽(가장 오래된 것)부터 제거
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def make_weak_etag(*parts: object) -> str:
+    """
+    ✅ 약한(weak) ETag 생성
+
+    예) make_weak_etag("docs", 3, 17) -> 'W/"docs-3-17"'
+
+    weak(W/)를 쓰는 이유:
+    - 바이트 단위로 완전히 같다는 보장이 아니라
+      "의미상 같은 목록"이라는 뜻이기 때문 (압축/직렬화 방식이 달라도 같은 버전)
+    """
+    return 'W/"' + "-".join(str(p) for p in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    ✅ If-None-Match 헤더 값과 ETag 비교 (RFC 9110 weak comparison)
+
+    - "*" 이면 무조건 일치
+    - 콤마로 여러 개가 올 수 있다: W/"a", W/"b"
+    - 약한 비교이므로 W/ 접두사는 무시하고 따옴표 안의 값만 비교한다.
+    """
+    if not if_none_match:
+        return False
+
+    target = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.removeprefix("W/") == target:
+            return True
+    return False
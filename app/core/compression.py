@@ -0,0 +1,420 @@
+"""
+app/core/compression.py
+
+✅ 응답 압축(Compression) 모듈
+- CompressionMiddleware : ASGI 미들웨어 (gzip + zstd/brotli가 설치돼 있으면 함께 사용)
+- PrecompressedBody     : "한 번만 압축하고 재사용"하는 캐시용 바디 래퍼
+- compressed_response   : 캐시된 바디를 Accept-Encoding에 맞게 돌려주는 헬퍼
+
+왜 필요한가?
+- 문서 목록 같은 JSON은 압축률이 매우 높다(반복되는 키/경로 문자열).
+- 종량제(모바일) 네트워크에서는 전송 바이트가 곧 비용/지연이다.
+- 대신 압축은 CPU를 쓰므로
+  1) 너무 작은 응답은 압축하지 않고(min_size)
+  2) 압축 효과가 있는 Content-Type만 압축하고(allowlist)
+  3) 캐시되는 바디는 "압축된 상태로" 저장해서 CPU 비용을 1번만 낸다.
+
+선택 의존성(optional dependency):
+- zstd   : `pip install zstandard`
+- brotli : `pip install brotli`
+설치돼 있지 않으면 조용히 gzip만 사용한다.
+"""
+
+import gzip
+import threading
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:  # pragma: no cover - 설치 여부에 따라 다름
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:  # pragma: no cover - 설치 여부에 따라 다름
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+# ------------------------------------------------------------
+# 코덱(Codec) 정의
+# ------------------------------------------------------------
+# 각 코덱은 두 가지 방식을 제공한다.
+# - compress(data)  : 한 번에 전체 바디 압축 (일반 Response)
+# - stream()        : 청크 단위 압축기 (StreamingResponse)
+#   stream 압축기는 chunk()마다 flush해서, 받은 만큼은 바로 클라이언트로 흘려보낸다.
+
+
+class _GzipStream:
+    def __init__(self, level: int) -> None:
+        # wbits=16+MAX_WBITS → zlib 대신 gzip 헤더/트레일러를 붙인다.
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliStream:  # pragma: no cover - brotli 설치 시에만
+    def __init__(self, quality: int) -> None:
+        self._obj = brotli.Compressor(quality=quality)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._obj.process(data) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdStream:  # pragma: no cover - zstandard 설치 시에만
+    def __init__(self, level: int) -> None:
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class Codec:
+    """
+    ✅ Content-Encoding 1개(gzip/br/zstd)에 대한 압축 방법 묶음
+    """
+
+    def __init__(
+        self,
+        name: str,
+        compress: Callable[[bytes], bytes],
+        stream: Callable[[], object],
+    ) -> None:
+        self.name = name
+        self.compress = compress
+        self.stream = stream
+
+
+def _build_codecs() -> Dict[str, Codec]:
+    """
+    ✅ 현재 환경에서 사용 가능한 코덱만 모아서 반환
+    - gzip은 표준 라이브러리라 항상 있다.
+    """
+    gzip_level = settings.COMPRESSION_GZIP_LEVEL
+    codecs: Dict[str, Codec] = {
+        "gzip": Codec(
+            "gzip",
+            # mtime=0 → 같은 입력이면 같은 출력(캐시/ETag 재현성)
+            lambda data: gzip.compress(data, compresslevel=gzip_level, mtime=0),
+            lambda: _GzipStream(gzip_level),
+        ),
+    }
+
+    if brotli is not None:  # pragma: no cover
+        quality = settings.COMPRESSION_BROTLI_QUALITY
+        codecs["br"] = Codec(
+            "br",
+            lambda data: brotli.compress(data, quality=quality),
+            lambda: _BrotliStream(quality),
+        )
+
+    if zstandard is not None:  # pragma: no cover
+        level = settings.COMPRESSION_ZSTD_LEVEL
+        codecs["zstd"] = Codec(
+            "zstd",
+            lambda data: zstandard.ZstdCompressor(level=level).compress(data),
+            lambda: _ZstdStream(level),
+        )
+
+    return codecs
+
+
+# 모듈 로드 시 1번만 구성 (설정값은 프로세스 수명 동안 고정)
+CODECS: Dict[str, Codec] = _build_codecs()
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str],
+    preferred: Iterable[str] = (),
+) -> Optional[str]:
+    """
+    ✅ Accept-Encoding 헤더를 보고 사용할 인코딩 1개를 고른다.
+
+    예) "gzip, br;q=0.9, *;q=0.1"
+
+    규칙:
+    - q=0 인 인코딩은 "받지 않음"
+    - q값이 가장 큰 것을 고르고, 같으면 서버 선호 순서(preferred)를 따른다.
+    - 고를 게 없으면 None (압축하지 않음)
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    wildcard = weights.get("*", 0.0)
+    order = list(preferred or settings.COMPRESSION_ENCODINGS)
+
+    best: Optional[str] = None
+    best_q = 0.0
+    for name in order:
+        if name not in CODECS:
+            continue
+        q = weights.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def _is_compressible(content_type: Optional[str]) -> bool:
+    """
+    ✅ Content-Type allowlist 검사
+    - "application/json; charset=utf-8" → "application/json" 만 비교
+    """
+    if not content_type:
+        return False
+    base = content_type.split(";", 1)[0].strip().lower()
+    return base in settings.COMPRESSION_CONTENT_TYPES
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    # 같은 URL이라도 Accept-Encoding에 따라 응답이 다르다는 걸 캐시(프록시)에 알린다.
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+# ------------------------------------------------------------
+# 캐시용: 한 번 압축해서 재사용하는 바디
+# ------------------------------------------------------------
+
+
+class PrecompressedBody:
+    """
+    ✅ 직렬화된 원본 바디 + 인코딩별 압축 결과를 함께 보관하는 객체
+
+    - 캐시(LRUCache)에 이 객체를 넣어두면
+      같은 버전의 응답은 인코딩마다 "딱 1번"만 압축된다.
+    - 압축 결과는 처음 요청될 때 만든다(lazy). 안 쓰는 인코딩은 만들지 않는다.
+    """
+
+    __slots__ = ("raw", "_variants", "_lock")
+
+    def __init__(self, raw: bytes) -> None:
+        self.raw = raw
+        self._variants: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: str) -> bytes:
+        variant = self._variants.get(encoding)
+        if variant is None:
+            with self._lock:
+                variant = self._variants.get(encoding)
+                if variant is None:
+                    variant = CODECS[encoding].compress(self.raw)
+                    self._variants[encoding] = variant
+        return variant
+
+
+def compressed_response(
+    request: Request,
+    body: PrecompressedBody,
+    *,
+    media_type: str,
+    headers: Optional[Dict[str, str]] = None,
+    status_code: int = 200,
+) -> Response:
+    """
+    ✅ PrecompressedBody를 클라이언트 Accept-Encoding에 맞게 Response로 만든다.
+
+    - 압축을 골랐으면 Content-Encoding을 붙여서 내보낸다.
+      (미들웨어는 Content-Encoding이 이미 있으면 건드리지 않으므로 이중 압축 X)
+    - 작거나 압축 꺼져 있으면 원본 그대로
+    """
+    response_headers = dict(headers or {})
+    content = body.raw
+
+    if (
+        settings.COMPRESSION_ENABLED
+        and len(body.raw) >= settings.COMPRESSION_MIN_SIZE
+        and _is_compressible(media_type)
+    ):
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        response_headers["Vary"] = "Accept-Encoding"
+        if encoding is not None:
+            content = body.encoded(encoding)
+            response_headers["Content-Encoding"] = encoding
+
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type=media_type,
+        headers=response_headers,
+    )
+
+
+# ------------------------------------------------------------
+# ASGI 미들웨어
+# ------------------------------------------------------------
+
+
+class CompressionMiddleware:
+    """
+    ✅ 응답 압축 ASGI 미들웨어
+
+    동작:
+    1) 요청의 Accept-Encoding으로 인코딩 선택 (없으면 압축하지 않음)
+    2) 응답 헤더를 보고 압축 대상인지 판단
+       - Content-Type이 allowlist에 없으면 통과
+       - allowlist에 있으면 압축 여부와 관계없이 Vary: Accept-Encoding 을 붙인다
+         (압축 안 한 응답에 Vary가 없으면 공유 캐시가 그걸 gzip 클라이언트에게 줄 수 있다)
+       - 이미 Content-Encoding이 있으면 통과 (캐시에서 미리 압축된 응답 등)
+       - 바디가 min_size보다 작으면 통과
+    3) 일반 응답: 한 번에 압축해서 Content-Length 갱신
+       StreamingResponse: streaming=True면 청크 단위로 압축해서 흘려보냄
+
+    main.py 에서:
+        app.add_middleware(CompressionMiddleware)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        min_size: Optional[int] = None,
+        streaming: Optional[bool] = None,
+    ) -> None:
+        self.app = app
+        self.min_size = settings.COMPRESSION_MIN_SIZE if min_size is None else min_size
+        self.streaming = settings.COMPRESSION_STREAMING if streaming is None else streaming
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("method") == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        responder = _CompressionResponder(
+            send, CODECS[encoding] if encoding else None, self.min_size, self.streaming
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """
+    ✅ 응답 1개를 압축하는 send 래퍼 (요청마다 1개 생성)
+
+    http.response.start 메시지는 바로 보내지 않고 잡아둔다.
+    첫 번째 body 메시지를 보고 나서야 압축 여부/헤더를 결정할 수 있기 때문이다.
+    """
+
+    def __init__(
+        self, send: Send, codec: Optional[Codec], min_size: int, streaming: bool
+    ) -> None:
+        self._send = send
+        self._codec = codec
+        self._min_size = min_size
+        self._streaming = streaming
+        self._start: Optional[Message] = None
+        self._stream = None          # 스트리밍 압축기 (스트리밍 모드일 때만)
+        self._passthrough = False    # True면 이후 메시지는 그대로 전달
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = MutableHeaders(raw=list(message["headers"]))
+            status_code = message["status"]
+            if (
+                status_code == 204
+                or status_code < 200
+                or not _is_compressible(headers.get("content-type"))
+            ):
+                self._passthrough = True
+                await self._send(message)
+                return
+            # 압축 대상 Content-Type이면 이번에 압축하지 않더라도 Vary를 붙인다.
+            _add_vary(headers)
+            message = {**message, "headers": headers.raw}
+            if self._codec is None or "content-encoding" in headers or status_code == 304:
+                self._passthrough = True
+                await self._send(message)
+                return
+            self._start = message
+            return
+
+        if message_type != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self._stream is not None:
+            # 스트리밍 압축 진행 중
+            data = self._stream.chunk(body) if body else b""
+            if not more_body:
+                data += self._stream.finish()
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        start = self._start
+        headers = MutableHeaders(raw=start["headers"])
+
+        if not more_body:
+            # 일반 Response: 바디가 한 번에 다 왔다.
+            if len(body) < self._min_size:
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            compressed = self._codec.compress(body)
+            headers["Content-Encoding"] = self._codec.name
+            headers["Content-Length"] = str(len(compressed))
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # StreamingResponse: 전체 크기를 미리 알 수 없다.
+        if not self._streaming:
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        self._stream = self._codec.stream()
+        headers["Content-Encoding"] = self._codec.name
+        if "content-length" in headers:
+            del headers["content-length"]
+        await self._send(start)
+        await self._send(
+            {"type": "http.response.body", "body": self._stream.chunk(body), "more_body": True}
+        )
+
+
+def available_encodings() -> List[str]:
+    """현재 프로세스에서 쓸 수 있는 인코딩 이름 목록 (벤치마크/디버깅용)"""
+    return list(CODECS)
@@ -16,6 +16,7 @@ app/core/config.py
 """
 
 from pathlib import Path
+from typing import Dict, List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -62,7 +63,171 @@ class Settings(BaseSettings):
     # ✅ JWT 관련 설정
     JWT_SECRET_KEY: str = "dev-secret-change-me"
     JWT_ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # - Access Token은 짧게: 폐기(denylist)가 필요한 기간 자체를 줄인다.
+    # - 대신 Refresh Token(회전 방식)으로 재발급한다.
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+
+    # ✅ Access Token 폐기 목록(app/core/revocation.py)
+    # - BLOOM_CAPACITY / ERROR_RATE: Bloom Filter 크기 계산용(넘으면 자동 확장)
+    # - SYNC_SECONDS: 다른 워커에서 폐기된 토큰을 DB에서 가져오는 주기
+    # - SYNC_LAG_SECONDS: 추가된 지 이 시간이 안 된 row에서는 cursor를 멈춘다
+    #   (id는 INSERT 때 정해지고 commit은 나중이라 작은 id가 늦게 보일 수 있음)
+    # - PURGE_SECONDS: 만료된 jti를 메모리에서 치우고 Bloom을 다시 만드는 주기
+    REVOCATION_BLOOM_CAPACITY: int = 100_000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_SYNC_SECONDS: float = 5.0
+    REVOCATION_SYNC_LAG_SECONDS: float = 1.0
+    REVOCATION_PURGE_SECONDS: float = 600.0
+
+    # ✅ 문서 목록에서 소유자(User)를 함께 읽는 방식
+    # - "joined"  : documents JOIN users 1번 (다대일 관계에 보통 가장 빠름)
+    # - "selectin": documents 1번 + users WHERE id IN (...) 1번
+    DOCUMENT_OWNER_LOAD_STRATEGY: str = "joined"
+
+    # ✅ /documents/me 응답 캐시 설정
+    # - (owner_id, catalog_version) 키로 직렬화된 응답 바디를 최대 몇 개까지 보관할지
+    # - 0이면 캐시를 쓰지 않는다(ETag/304는 그대로 동작)
+    DOCUMENT_LIST_CACHE_SIZE: int = 1024
+
+    # ✅ 업로드 설정
+    # - UPLOAD_CHUNK_SIZE: 업로드 파일을 디스크에 쓸 때 한 번에 읽는 크기
+    # - UPLOAD_SNIFF_LIMIT: 이 바이트 안에 PDF/DOCX 판별이 안 되면 거부
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+    UPLOAD_SNIFF_LIMIT: int = 4 * 1024 * 1024
+
+    # ✅ 파생 산출물 캐시 (app/core/artifacts.py)
+    # - ARTIFACT_DIR: 압축된 산출물 파일 저장 폴더
+    # - ARTIFACT_CACHE_MAX_BYTES: 압축 후 크기 합계 상한(넘으면 LRU 삭제)
+    # - ARTIFACT_PROCESSORS: 업로드 후 자동 실행할 프로세서 (빈 목록 = 끄기, 요청 시 계산은 가능)
+    ARTIFACT_DIR: str = "app/artifacts"
+    ARTIFACT_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    ARTIFACT_COMPRESSION_LEVEL: int = 6
+    ARTIFACT_PROCESSORS: List[str] = ["text"]
+
+    # ✅ 삭제 문서 GC (app/jobs/gc.py)
+    # - GC_GRACE_SECONDS: 삭제 후 이 시간이 지나야 파일/row를 치운다
+    #   (진행 중인 다운로드/처리가 끝날 시간 + 실수로 지운 경우 DB에서 되살릴 여유)
+    # - GC_BATCH_SIZE: 배치 1번에 처리할 문서 수 (배치마다 commit)
+    # - GC_MAX_BYTES_PER_SECOND: 초당 지우는 파일 바이트 상한 (0 = 무제한)
+    # - GC_BATCH_PAUSE_SECONDS: 배치 사이 쉬는 시간
+    # - GC_MAX_BATCHES: 1회 실행에서 처리할 최대 배치 수 (0 = 남은 게 없을 때까지)
+    GC_GRACE_SECONDS: float = 24 * 60 * 60
+    GC_BATCH_SIZE: int = 100
+    GC_MAX_BYTES_PER_SECOND: int = 64 * 1024 * 1024
+    GC_BATCH_PAUSE_SECONDS: float = 1.0
+    GC_MAX_BATCHES: int = 0
+
+    # ✅ 사용자별 쿼터 (0이면 무제한)
+    # - 업로드 스트리밍 중에 남은 용량을 넘으면 바로 중단(413)
+    USER_STORAGE_QUOTA_BYTES: int = 1024 * 1024 * 1024
+    USER_DOCUMENT_QUOTA: int = 10_000
+
+    # ✅ Idempotency-Key 재시도 중복 제거 (app/core/idempotency.py)
+    # - PATHS: 적용할 POST 경로 (헤더가 없는 요청은 그대로 통과)
+    # - TTL_SECONDS: 첫 응답을 보관하는 시간
+    # - MAX_ENTRIES / MAX_BYTES: 저장소 상한(넘으면 오래된 것부터 버림)
+    # - WAIT_SECONDS: 같은 키가 처리 중일 때 재시도가 기다리는 최대 시간(넘으면 409)
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_PATHS: List[str] = ["/auth/register", "/documents/upload"]
+    IDEMPOTENCY_TTL_SECONDS: float = 24 * 60 * 60
+    IDEMPOTENCY_MAX_ENTRIES: int = 10_000
+    IDEMPOTENCY_MAX_BYTES: int = 16 * 1024 * 1024
+    IDEMPOTENCY_WAIT_SECONDS: float = 30.0
+
+    # ✅ 문서 이벤트 outbox / 웹훅 / SSE
+    # - OUTBOX_RETENTION_DAYS: 이보다 오래된 이벤트는 디스패처가 삭제
+    # - OUTBOX_SSE_POLL_SECONDS: /documents/events 가 새 이벤트를 확인하는 주기
+    # - OUTBOX_SSE_HEARTBEAT_SECONDS: 이벤트가 없을 때 연결 유지용 주석 라인 주기
+    # - WEBHOOK_BATCH_SIZE: 요청 1번에 담는 최대 이벤트 수
+    # - WEBHOOK_RETRY_*: 실패 시 지수 백오프(BASE * 2^(n-1), 최대 MAX)
+    # - WEBHOOK_MAX_FAILURES: 연속 실패가 이만큼이면 구독 비활성화 (0 = 무제한)
+    # - OUTBOX_CURSOR_LAG_SECONDS: 만들어진 지 이 시간이 안 된 이벤트는 아직 읽지 않는다.
+    #   id는 INSERT 때 정해지고 commit은 나중이라, 작은 id가 큰 id보다 늦게 보일 수 있다.
+    #   cursor는 id로만 전진하므로 문서 변경 트랜잭션은 이 시간 안에 commit돼야 한다.
+    # - WEBHOOK_ALLOW_HTTP / WEBHOOK_ALLOW_PRIVATE_NETWORKS: 로컬 개발/테스트용.
+    #   운영에서는 False로 둔다(https + 공인 주소만 허용, app/core/webhook_targets.py)
+    OUTBOX_RETENTION_DAYS: int = 7
+    OUTBOX_CURSOR_LAG_SECONDS: float = 1.0
+    OUTBOX_SSE_POLL_SECONDS: float = 1.0
+    OUTBOX_SSE_HEARTBEAT_SECONDS: float = 15.0
+    WEBHOOK_TIMEOUT_SECONDS: float = 5.0
+    WEBHOOK_BATCH_SIZE: int = 100
+    WEBHOOK_CONCURRENCY: int = 8
+    WEBHOOK_RETRY_BASE_SECONDS: float = 5.0
+    WEBHOOK_RETRY_MAX_SECONDS: float = 3600.0
+    WEBHOOK_MAX_FAILURES: int = 20
+    WEBHOOK_ALLOW_HTTP: bool = False
+    WEBHOOK_ALLOW_PRIVATE_NETWORKS: bool = False
+
+    # ✅ 구조화 로그 (app/core/logging.py)
+    # - LOG_STDOUT / LOG_FILE: 출력 대상 (LOG_FILE이 비어 있으면 파일 출력 안 함)
+    # - LOG_QUEUE_SIZE: 출력 스레드가 밀리면 이 개수를 넘는 로그는 버린다(요청을 막지 않음)
+    # - LOG_BATCH_SIZE / LOG_FLUSH_INTERVAL: 모아서 한 번에 쓰는 단위/최대 대기(초)
+    # - LOG_SAMPLE_RATES: 경로 prefix → 요청 로그 샘플링 비율 (예: {"/documents/me": 0.1})
+    #   에러(5xx)와 LOG_SLOW_MS 이상 걸린 요청은 항상 기록
+    # - LOG_RING_SIZE: 에러 시 함께 남길 최근 기록(DEBUG 포함) 보관 개수
+    LOG_ENABLED: bool = True
+    LOG_LEVEL: str = "INFO"
+    LOG_STDOUT: bool = True
+    LOG_FILE: str = ""
+    LOG_QUEUE_SIZE: int = 10_000
+    LOG_BATCH_SIZE: int = 256
+    LOG_FLUSH_INTERVAL: float = 0.5
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+    LOG_SLOW_MS: float = 1000.0
+    LOG_RING_SIZE: int = 512
+
+    # ✅ 응답 압축 설정 (app/core/compression.py)
+    # - COMPRESSION_MIN_SIZE 보다 작은 응답은 압축하지 않는다(CPU 대비 이득 없음)
+    # - COMPRESSION_ENCODINGS: 서버 선호 순서. 설치 안 된 코덱(zstd/br)은 자동으로 건너뜀
+    # - COMPRESSION_STREAMING: StreamingResponse도 청크 단위로 압축할지
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_ENCODINGS: List[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_CONTENT_TYPES: List[str] = [
+        "application/json",
+        "application/problem+json",
+        "application/xml",
+        "text/plain",
+        "text/html",
+        "text/css",
+        "text/csv",
+        "text/javascript",
+        "application/javascript",
+    ]
+    COMPRESSION_STREAMING: bool = True
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # ✅ 요청 단위 프로파일링(app/core/profiling.py)
+    # - ENABLED=False면 미들웨어가 아예 등록되지 않는다(오버헤드 0)
+    # - SECRET: X-Profile-Token 서명 키(비어 있으면 헤더 트리거 비활성)
+    # - SAMPLE_RATE: 0~1, 무작위로 고른 요청을 프로파일 (PATHS로 경로 prefix 제한)
+    # - DIR / MAX_FILES: 결과 저장 폴더와 보관할 최대 요청 수
+    PROFILING_ENABLED: bool = False
+    PROFILING_SECRET: str = ""
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_PATHS: List[str] = []
+    PROFILING_INTERVAL_MS: float = 1.0
+    PROFILING_DIR: str = "profiles"
+    PROFILING_MAX_FILES: int = 50
+
+    # ✅ 서버 런처(python -m app) 기본값 - CLI 인자로 덮어쓸 수 있다.
+    # - SERVER_WORKERS=0 이면 CPU 코어 수로 자동 결정
+    # - SERVER_LOOP / SERVER_HTTP: "auto"면 uvloop/httptools가 설치돼 있을 때 사용
+    # - SERVER_MAX_REQUESTS: 워커가 이만큼 처리하면 재시작(메모리 누수/단편화 방지), 0=끄기
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_LOOP: str = "auto"
+    SERVER_HTTP: str = "auto"
+    SERVER_PRELOAD: bool = True
+    SERVER_MAX_REQUESTS: int = 0
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+    SERVER_KEEPALIVE: int = 5
 
 
 # 전역에서 한 번만 Settings를 생성해서 공유한다(싱글톤처럼 사용)
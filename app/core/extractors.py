@@ -0,0 +1,95 @@
+"""
+app/core/extractors.py
+
+✅ 문서 텍스트 추출기 (표준 라이브러리만 사용)
+
+- docx_text: word/document.xml 의 <w:t> 텍스트를 문단 단위로 합친다.
+- pdf_text : 내용 스트림(압축 해제 포함)의 문자열 그리기 연산자(Tj / TJ / ' / ")에서
+             리터럴 문자열을 꺼낸다.
+             → 단순한 PDF(일반 폰트 인코딩)용 best-effort. 스캔본/CID 폰트는 빈 결과가 나올 수 있다.
+
+extract_text 가 파일 앞부분(매직 바이트)을 보고 둘 중 하나를 고른다.
+"파일 경로 → UTF-8 bytes" 형태라 app/core/artifacts.py 의 "text" 프로세서로 등록된다.
+"""
+
+import html
+import re
+import zipfile
+import zlib
+
+_DOCX_PARAGRAPH_RE = re.compile(rb"<w:p[ >].*?</w:p>", re.S)
+_DOCX_TEXT_RE = re.compile(rb"<w:t(?:\s[^>]*)?>([^<]*)</w:t>")
+
+_PDF_STREAM_RE = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.S)
+_PDF_TEXT_BLOCK_RE = re.compile(rb"BT(.*?)ET", re.S)
+_PDF_STRING_RE = re.compile(rb"\((?:\\.|[^\\()])*\)", re.S)
+_PDF_SHOW_RE = re.compile(rb"(\[(?:[^\]]*)\]\s*TJ|\((?:\\.|[^\\()])*\)\s*(?:Tj|'|\"))", re.S)
+_PDF_ESCAPES = {
+    b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f",
+    b"(": b"(", b")": b")", b"\\": b"\\",
+}
+
+
+def docx_text(path: str) -> bytes:
+    with zipfile.ZipFile(path) as archive:
+        xml = archive.read("word/document.xml")
+    paragraphs = []
+    for paragraph in _DOCX_PARAGRAPH_RE.finditer(xml):
+        text = b"".join(_DOCX_TEXT_RE.findall(paragraph.group(0)))
+        paragraphs.append(html.unescape(text.decode("utf-8", "replace")))
+    return "\n".join(paragraphs).strip().encode("utf-8")
+
+
+def _unescape_pdf_string(raw: bytes) -> bytes:
+    out = bytearray()
+    i = 0
+    while i < len(raw):
+        ch = raw[i:i + 1]
+        if ch == b"\\" and i + 1 < len(raw):
+            nxt = raw[i + 1:i + 2]
+            if nxt in _PDF_ESCAPES:
+                out += _PDF_ESCAPES[nxt]
+                i += 2
+                continue
+            octal = re.match(rb"[0-7]{1,3}", raw[i + 1:i + 4])
+            if octal:
+                out.append(int(octal.group(0), 8) & 0xFF)
+                i += 1 + len(octal.group(0))
+                continue
+            i += 1
+            continue
+        out += ch
+        i += 1
+    return bytes(out)
+
+
+def _content_streams(data: bytes):
+    for match in _PDF_STREAM_RE.finditer(data):
+        stream = match.group(1)
+        try:
+            yield zlib.decompress(stream)
+        except zlib.error:
+            yield stream
+
+
+def pdf_text(path: str) -> bytes:
+    with open(path, "rb") as src:
+        data = src.read()
+    lines = []
+    for stream in _content_streams(data):
+        for block in _PDF_TEXT_BLOCK_RE.finditer(stream):
+            for show in _PDF_SHOW_RE.finditer(block.group(1)):
+                parts = [_unescape_pdf_string(s[1:-1]) for s in _PDF_STRING_RE.findall(show.group(0))]
+                text = b"".join(parts).decode("latin-1").strip()
+                if text:
+                    lines.append(text)
+    return "\n".join(lines).encode("utf-8")
+
+
+def extract_text(path: str) -> bytes:
+    """PDF/DOCX 구분해서 텍스트 추출"""
+    with open(path, "rb") as src:
+        head = src.read(5)
+    if head.startswith(b"%PDF-"):
+        return pdf_text(path)
+    return docx_text(path)
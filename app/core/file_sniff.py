@@ -0,0 +1,300 @@
+"""
+app/core/file_sniff.py
+
+✅ 업로드 파일 내용 검사(매직 바이트 스니핑) 모듈
+
+왜 필요한가?
+- file.content_type 은 "클라이언트가 주장하는 값"일 뿐이다.
+  아무 파일이나 application/pdf 로 보내면 그대로 저장되고,
+  나중에 처리 단계(텍스트 추출 등)에서 CPU만 쓰고 실패한다.
+- 그래서 실제 바이트를 보고 판단한다.
+  - PDF : 파일이 "%PDF-" 로 시작
+  - DOCX: ZIP 컨테이너("PK\\x03\\x04") + [Content_Types].xml + word/ 파트 존재
+
+설계 포인트(스트리밍):
+- 업로드 파일을 청크 단위로 디스크에 쓰는 "같은 루프"에서 feed(chunk)를 호출한다.
+  → 검사를 위해 파일을 한 번 더 읽지 않는다.
+- 판별이 끝나는 즉시(PDF는 5바이트, DOCX는 보통 첫 몇 KB) 결과가 정해지고,
+  잘못된 파일이면 그 자리에서 UnsupportedFileType 을 던져서 나머지는 쓰지 않는다.
+- 판별 후에도 계속 흘려보내면서 페이지 수를 센다(다운스트림 스케줄링용).
+  - PDF : "/Type /Page" 객체 수 (없으면 /Count 최댓값)
+  - DOCX: docProps/app.xml 의 <Pages> 값
+  - 압축된 객체 스트림 등으로 셀 수 없으면 None
+"""
+
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.config import settings
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+_PDF_MAGIC = b"%PDF-"
+_ZIP_LOCAL = b"PK\x03\x04"
+_ZIP_CENTRAL = b"PK\x01\x02"
+_ZIP_END = b"PK\x05\x06"
+
+# "/Type /Page" (뒤에 s가 붙은 /Pages 는 제외) / "/Count 12"
+_PDF_PAGE_RE = re.compile(rb"/Type\s{0,8}/Page(?![A-Za-z])")
+_PDF_COUNT_RE = re.compile(rb"/Count\s{1,8}(\d{1,7})(?!\d)")
+# 정규식 매치가 청크 경계에 걸칠 수 있으므로 이만큼은 다음 청크 앞에 붙여서 다시 본다.
+_PDF_OVERLAP = 64
+
+_DOCX_PAGES_RE = re.compile(rb"<Pages>(\d+)</Pages>")
+_DOCX_APP_XML = "docProps/app.xml"
+# app.xml은 작다. 비정상적으로 크면 페이지 수는 포기한다(메모리 보호).
+_DOCX_APP_XML_MAX = 1024 * 1024
+
+
+class UnsupportedFileType(ValueError):
+    """실제 내용이 허용된 형식(PDF/DOCX)이 아닐 때"""
+
+
+class ContentTypeMismatch(UnsupportedFileType):
+    """허용된 형식이지만 클라이언트가 주장한 타입과 다를 때 (예: DOCX를 application/pdf로 보냄)"""
+
+
+@dataclass
+class SniffResult:
+    detected_type: str
+    page_count: Optional[int]
+
+
+class _PdfScanner:
+    """PDF 바이트를 흘려보내면서 페이지 객체 수를 센다."""
+
+    def __init__(self) -> None:
+        self._tail = b""
+        self._tail_offset = 0      # _tail[0]의 스트림 내 위치
+        self._counted_until = 0    # 이 위치까지 끝나는 매치는 이미 셌다
+        self.pages = 0
+        self.max_count = 0
+
+    def _scan(self, data: bytes, final: bool) -> None:
+        # 마지막 1바이트는 (?!...) 판단용으로 남겨둔다(final 제외)
+        limit = self._tail_offset + len(data) - (0 if final else 1)
+        for match in _PDF_PAGE_RE.finditer(data):
+            end = self._tail_offset + match.end()
+            if self._counted_until < end <= limit:
+                self.pages += 1
+        for match in _PDF_COUNT_RE.finditer(data):
+            end = self._tail_offset + match.end()
+            if self._counted_until < end <= limit:
+                self.max_count = max(self.max_count, int(match.group(1)))
+        self._counted_until = max(self._counted_until, limit)
+
+    def feed(self, chunk: bytes) -> None:
+        data = self._tail + chunk
+        self._scan(data, final=False)
+        keep = min(len(data), _PDF_OVERLAP)
+        self._tail_offset += len(data) - keep
+        self._tail = data[-keep:] if keep else b""
+
+    def finish(self) -> Optional[int]:
+        self._scan(self._tail, final=True)
+        if self.pages:
+            return self.pages
+        return self.max_count or None
+
+
+class _ZipScanner:
+    """
+    ZIP 로컬 파일 헤더를 순서대로 따라가면서 엔트리 이름을 모은다.
+
+    로컬 헤더(30바이트) 구조:
+      0  시그니처 PK\\x03\\x04
+      6  flags     (bit 3 = 크기를 뒤쪽 data descriptor에 기록)
+      8  압축 방식 (0 = stored, 8 = deflate)
+      18 압축된 크기
+      26 파일명 길이 / 28 extra 길이
+    크기를 모르는 엔트리(data descriptor)를 만나면 다음 시그니처를 검색해서 이어간다.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._skip = 0                      # 건너뛸 남은 바이트(엔트리 데이터)
+        self._capture: Optional[bytearray] = None
+        self._capture_method = 0
+        self._searching = False             # data descriptor 때문에 시그니처 검색 중
+        self.done = False                   # 중앙 디렉터리 도달 → 더 볼 것 없음
+        self.has_content_types = False
+        self.has_word_part = False
+        self.pages: Optional[int] = None
+
+    @property
+    def is_docx(self) -> bool:
+        return self.has_content_types and self.has_word_part
+
+    def _on_entry(self, name: str, method: int, size: int) -> None:
+        if name == "[Content_Types].xml":
+            self.has_content_types = True
+        elif name.startswith("word/"):
+            self.has_word_part = True
+        if name == _DOCX_APP_XML and size <= _DOCX_APP_XML_MAX and method in (0, 8):
+            self._capture = bytearray()
+            self._capture_method = method
+
+    def _finish_capture(self) -> None:
+        data = bytes(self._capture)
+        self._capture = None
+        try:
+            if self._capture_method == 8:
+                data = zlib.decompress(data, -zlib.MAX_WBITS)
+        except zlib.error:
+            return
+        match = _DOCX_PAGES_RE.search(data)
+        if match:
+            self.pages = int(match.group(1))
+
+    def feed(self, chunk: bytes) -> None:
+        if self.done:
+            return
+
+        # 1) 엔트리 데이터 건너뛰기 (app.xml이면 캡처)
+        if self._skip:
+            take = min(self._skip, len(chunk))
+            if self._capture is not None:
+                self._capture += chunk[:take]
+            self._skip -= take
+            chunk = chunk[take:]
+            if self._skip == 0 and self._capture is not None:
+                self._finish_capture()
+            if not chunk:
+                return
+
+        self._buf += chunk
+
+        # 2) 헤더 파싱 루프
+        while not self.done:
+            if self._searching:
+                pos_local = self._buf.find(_ZIP_LOCAL)
+                pos_central = self._buf.find(_ZIP_CENTRAL)
+                hits = [p for p in (pos_local, pos_central) if p >= 0]
+                if not hits:
+                    # 시그니처가 경계에 걸칠 수 있으니 3바이트만 남긴다
+                    del self._buf[:-3]
+                    return
+                del self._buf[:min(hits)]
+                self._searching = False
+
+            if len(self._buf) < 4:
+                return
+            signature = bytes(self._buf[:4])
+            if signature in (_ZIP_CENTRAL, _ZIP_END):
+                self.done = True
+                self._buf.clear()
+                return
+            if signature != _ZIP_LOCAL:
+                # 엔트리 경계가 어긋났다 → 다음 시그니처를 찾는다
+                self._searching = True
+                del self._buf[:1]
+                continue
+
+            if len(self._buf) < 30:
+                return
+            flags, method = struct.unpack_from("<HH", self._buf, 6)
+            comp_size = struct.unpack_from("<I", self._buf, 18)[0]
+            name_len, extra_len = struct.unpack_from("<HH", self._buf, 26)
+            header_len = 30 + name_len + extra_len
+            if len(self._buf) < header_len:
+                return
+
+            name = bytes(self._buf[30:30 + name_len]).decode("utf-8", "replace")
+            del self._buf[:header_len]
+
+            if flags & 0x08 and comp_size == 0:
+                # 크기를 모름 → 이름만 기록하고 다음 시그니처 검색
+                self._on_entry(name, method, _DOCX_APP_XML_MAX + 1)
+                self._searching = True
+                continue
+
+            self._on_entry(name, method, comp_size)
+
+            # 엔트리 데이터: 버퍼에 있는 만큼 소비하고 나머지는 _skip으로
+            take = min(comp_size, len(self._buf))
+            if self._capture is not None:
+                self._capture += self._buf[:take]
+            del self._buf[:take]
+            self._skip = comp_size - take
+            if self._skip:
+                return
+            if self._capture is not None:
+                self._finish_capture()
+
+
+class UploadSniffer:
+    """
+    ✅ 업로드 스트림 검사기 (청크를 디스크에 쓰기 "전에" feed 한다)
+
+    사용:
+        sniffer = UploadSniffer(expected_type=PDF_MIME)
+        for chunk in ...:
+            sniffer.feed(chunk)      # 잘못된 파일이면 여기서 UnsupportedFileType
+            out.write(chunk)
+        result = sniffer.finish()    # SniffResult(detected_type, page_count)
+
+    - expected_type을 주면 형식이 판별되는 순간 비교해서,
+      다르면 나머지를 읽기 전에 ContentTypeMismatch를 던진다.
+    """
+
+    def __init__(
+        self,
+        sniff_limit: Optional[int] = None,
+        expected_type: Optional[str] = None,
+    ) -> None:
+        self.sniff_limit = settings.UPLOAD_SNIFF_LIMIT if sniff_limit is None else sniff_limit
+        self.expected_type = expected_type
+        self._head = b""
+        self._seen = 0
+        self._pdf: Optional[_PdfScanner] = None
+        self._zip: Optional[_ZipScanner] = None
+        self.detected_type: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self._seen += len(chunk)
+
+        # 1) 형식 판별 전: 앞부분 몇 바이트로 컨테이너 종류를 고른다
+        if self._pdf is None and self._zip is None:
+            self._head += chunk
+            if len(self._head) < len(_PDF_MAGIC):
+                return
+            if self._head.startswith(_PDF_MAGIC):
+                self._pdf = _PdfScanner()
+                self._detected(PDF_MIME)
+            elif self._head.startswith(_ZIP_LOCAL):
+                self._zip = _ZipScanner()
+            else:
+                raise UnsupportedFileType("File content is not a PDF or DOCX document.")
+            chunk, self._head = self._head, b""
+
+        # 2) 형식별 스캐너에 흘려보내기
+        if self._pdf is not None:
+            self._pdf.feed(chunk)
+            return
+
+        self._zip.feed(chunk)
+        if self.detected_type is None:
+            if self._zip.is_docx:
+                self._detected(DOCX_MIME)
+            elif self._zip.done or self._seen > self.sniff_limit:
+                # 엔트리 목록을 다 봤거나 충분히 봤는데도 DOCX 구조가 아니다
+                raise UnsupportedFileType("ZIP file is not a DOCX document.")
+
+    def _detected(self, mime: str) -> None:
+        if self.expected_type is not None and mime != self.expected_type:
+            raise ContentTypeMismatch("File content does not match its declared content type.")
+        self.detected_type = mime
+
+    def finish(self) -> SniffResult:
+        """스트림 끝. 끝까지 판별이 안 됐으면(너무 짧은 파일 등) 거부."""
+        if self.detected_type is None:
+            raise UnsupportedFileType("File content is not a PDF or DOCX document.")
+        if self._pdf is not None:
+            return SniffResult(self.detected_type, self._pdf.finish())
+        return SniffResult(self.detected_type, self._zip.pages)
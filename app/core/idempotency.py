@@ -0,0 +1,350 @@
+"""
+app/core/idempotency.py
+
+✅ Idempotency-Key 미들웨어 (재시도 요청 중복 실행 방지)
+
+왜 필요한가?
+- 네트워크가 불안정한 클라이언트는 응답을 못 받으면 같은 요청을 다시 보낸다.
+  - POST /documents/upload → 같은 문서가 여러 개 생기고 파일/쿼터를 두 번 쓴다.
+  - POST /auth/register   → 매번 bcrypt 해싱(수백 ms CPU)을 다시 한다.
+- 클라이언트가 요청마다 고유한 Idempotency-Key 헤더를 붙이면,
+  서버는 "첫 번째 응답"을 저장해 두고 같은 키의 재시도에는 핸들러를 다시 실행하지 않고
+  저장된 응답을 그대로 돌려준다(Idempotent-Replayed: true).
+
+동작:
+1) 대상 경로(IDEMPOTENCY_PATHS)의 POST + Idempotency-Key 헤더가 있을 때만 동작
+2) 키 범위 = (사용자, 메서드, 경로, 키)
+   - 사용자: Bearer 토큰의 sub (서명/만료 + 폐기 목록 확인, DB 조회 없음) / 없으면 "anon"
+   - 유효하지 않거나 로그아웃으로 폐기된 토큰도 "anon"
+     → 폐기된 토큰으로는 그 사용자가 저장해 둔 응답을 재생할 수 없다.
+   → 다른 사용자가 같은 키를 써도 남의 응답을 받지 않는다.
+3) 저장된 응답이 있으면 → 요청 바디 지문(sha256)을 비교해서
+   - 같으면 바로 재생
+   - 다르면 422 (같은 키를 다른 요청에 재사용한 클라이언트 버그 → 엉뚱한 응답을 주지 않음)
+   - multipart 바디는 boundary 문자열을 빼고 해시한다
+     (재시도 때 클라이언트가 boundary를 새로 만들어도 같은 요청으로 본다)
+4) 같은 키의 요청이 처리 중이면 → 끝날 때까지 기다렸다가 그 응답을 재생
+   (동시에 몰린 재시도는 핸들러 1번으로 합쳐진다)
+5) 처음 온 요청 → 핸들러 실행, 응답을 클라이언트로 보내면서 같이 저장
+   - 5xx 응답은 저장하지 않는다(일시 오류는 재시도하면 다시 실행되어야 함)
+
+저장소:
+- 프로세스 메모리 TTL 저장소. 개수(MAX_ENTRIES)와 총 바이트(MAX_BYTES) 둘 다 상한이 있어서
+  재시도 폭주에도 메모리가 일정 이상 늘지 않는다(오래된 것부터 버림).
+- 워커(프로세스)마다 따로 가진다. 같은 키의 재시도가 다른 워커로 가면 중복 제거가 안 되므로
+  여러 워커로 운영할 때는 앞단에서 sticky 라우팅을 하거나 저장소를 공유 저장소로 바꿔야 한다.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import security
+from app.core.config import settings
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+_MAX_KEY_LENGTH = 255
+
+StoreKey = Tuple[str, str, str, str]   # (user, method, path, key)
+
+
+@dataclass
+class StoredResponse:
+    """저장된 첫 번째 응답"""
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    fingerprint: str = ""      # 첫 요청 바디 지문 (BodyFingerprint)
+    expires_at: float = 0.0
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.size = len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+
+class IdempotencyStore:
+    """
+    ✅ TTL + 개수/바이트 상한이 있는 응답 저장소
+
+    - OrderedDict 순서 = 저장 순서(TTL이 모두 같으므로 곧 만료 순서)
+    - 상한을 넘으면 가장 오래된 것부터 버린다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.ttl_seconds = settings.IDEMPOTENCY_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_entries = settings.IDEMPOTENCY_MAX_ENTRIES if max_entries is None else max_entries
+        self.max_bytes = settings.IDEMPOTENCY_MAX_BYTES if max_bytes is None else max_bytes
+        self._data: "OrderedDict[StoreKey, StoredResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def _drop_oldest(self) -> None:
+        _, old = self._data.popitem(last=False)
+        self._bytes -= old.size
+
+    def _expire(self, now: float) -> None:
+        while self._data:
+            oldest = next(iter(self._data.values()))
+            if oldest.expires_at > now:
+                break
+            self._drop_oldest()
+
+    def get(self, key: StoreKey) -> Optional[StoredResponse]:
+        with self._lock:
+            self._expire(time.monotonic())
+            return self._data.get(key)
+
+    def put(self, key: StoreKey, response: StoredResponse) -> bool:
+        """저장 성공 여부 (응답 하나가 MAX_BYTES보다 크면 저장하지 않음)"""
+        if response.size > self.max_bytes:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            response.expires_at = now + self.ttl_seconds
+            self._data[key] = response
+            self._bytes += response.size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop_oldest()
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+
+# 프로세스 전역 1개
+idempotency_store = IdempotencyStore()
+
+
+def _user_scope(headers: Dict[bytes, bytes]) -> str:
+    """
+    Bearer 토큰의 sub (유효하지 않거나 폐기됐으면 anon → 어차피 핸들러가 401을 준다)
+
+    - 폐기 확인은 get_current_user와 같은 메모리 denylist (DB 조회 없음)
+    """
+    auth = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = auth.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        subject = security.decode_access_token(token.strip())
+        if subject is not None:
+            return f"user:{subject}"
+    return "anon"
+
+
+class BodyFingerprint:
+    """
+    요청 바디 지문 (청크 단위로 feed, 바디를 메모리에 모으지 않는다)
+
+    - multipart/form-data면 boundary 문자열을 지우고 해시한다.
+      청크 경계에 걸친 boundary도 지우도록 끝 (len(boundary) - 1) 바이트는 다음 청크까지 들고 있는다.
+    """
+
+    def __init__(self, content_type: str) -> None:
+        media_type, _, params = content_type.partition(";")
+        self._hasher = hashlib.sha256(media_type.strip().lower().encode() + b"\n")
+        self._boundary = b""
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "boundary" and value:
+                self._boundary = value.strip('"').encode("latin-1")
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> None:
+        if not self._boundary:
+            self._hasher.update(chunk)
+            return
+        data = (self._tail + chunk).replace(self._boundary, b"")
+        keep = len(self._boundary) - 1
+        self._hasher.update(data[:-keep] if keep else data)
+        self._tail = data[-keep:] if keep else b""
+
+    def hexdigest(self) -> str:
+        self._hasher.update(self._tail)
+        self._tail = b""
+        return self._hasher.hexdigest()
+
+
+async def _fingerprint_body(scope: Scope, receive: Receive) -> str:
+    """재생 여부를 판단하기 위해 이 요청의 바디를 끝까지 읽어서 지문만 남긴다"""
+    fingerprint = BodyFingerprint(Headers(scope=scope).get("content-type", ""))
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        fingerprint.feed(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return fingerprint.hexdigest()
+
+
+async def _send_json(send: Send, status_code: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _replay(send: Send, stored: StoredResponse) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": stored.status,
+        "headers": stored.headers + [(REPLAYED_HEADER, b"true")],
+    })
+    await send({"type": "http.response.body", "body": stored.body})
+
+
+class IdempotencyMiddleware:
+    """
+    ✅ Idempotency-Key 처리 ASGI 미들웨어
+
+    - 압축 미들웨어보다 안쪽에 둔다 → 압축 전 응답을 저장하고,
+      재생할 때마다 클라이언트 Accept-Encoding에 맞게 다시 압축된다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        store: Optional[IdempotencyStore] = None,
+        paths: Optional[List[str]] = None,
+    ) -> None:
+        self.app = app
+        self.store = store or idempotency_store
+        self.paths = frozenset(settings.IDEMPOTENCY_PATHS if paths is None else paths)
+        self.wait_seconds = settings.IDEMPOTENCY_WAIT_SECONDS
+        # 처리 중인 키 → 끝나면 set 되는 Event (이벤트 루프 스레드에서만 접근)
+        self._in_flight: Dict[StoreKey, asyncio.Event] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        raw_key = headers.get(IDEMPOTENCY_HEADER)
+        if raw_key is None:
+            await self.app(scope, receive, send)
+            return
+
+        idem_key = raw_key.decode("latin-1").strip()
+        if not idem_key or len(idem_key) > _MAX_KEY_LENGTH:
+            await _send_json(send, 400, f"Idempotency-Key must be 1-{_MAX_KEY_LENGTH} characters")
+            return
+
+        key: StoreKey = (_user_scope(headers), scope["method"], scope["path"], idem_key)
+
+        # 1) 저장된 응답 / 처리 중인 같은 요청 확인
+        # - 바디는 "재생할지 결정할 때"만 읽는다. 처리 중인 요청을 기다린 뒤 저장된 게 없으면
+        #   이 요청이 바디를 그대로 가지고 핸들러를 실행해야 하기 때문
+        while True:
+            stored = self.store.get(key)
+            if stored is not None:
+                if await _fingerprint_body(scope, receive) != stored.fingerprint:
+                    await _send_json(
+                        send, 422, "Idempotency-Key was already used with a different request"
+                    )
+                    return
+                await _replay(send, stored)
+                return
+            event = self._in_flight.get(key)
+            if event is None:
+                break
+            try:
+                await asyncio.wait_for(event.wait(), timeout=self.wait_seconds)
+            except asyncio.TimeoutError:
+                await _send_json(send, 409, "A request with this Idempotency-Key is still in progress")
+                return
+            # 먼저 온 요청이 5xx/예외로 끝났으면 저장된 게 없다 → 이 요청이 실행한다
+
+        # 2) 이 요청이 대표로 실행
+        event = asyncio.Event()
+        self._in_flight[key] = event
+        try:
+            await self._run_and_store(key, scope, receive, send)
+        finally:
+            del self._in_flight[key]
+            event.set()
+
+    async def _run_and_store(self, key: StoreKey, scope: Scope, receive: Receive, send: Send) -> None:
+        status_code = 500
+        response_headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        size = 0
+        storable = True
+        complete = False
+        fingerprint = BodyFingerprint(Headers(scope=scope).get("content-type", ""))
+        body_read = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_read
+            message = await receive()
+            if message["type"] == "http.request":
+                fingerprint.feed(message.get("body", b""))
+                if not message.get("more_body", False):
+                    body_read = True
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_headers, size, storable, complete
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = list(message.get("headers", []))
+                storable = status_code < 500
+            elif message["type"] == "http.response.body" and storable:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > self.store.max_bytes:
+                    storable = False
+                    chunks.clear()
+                else:
+                    chunks.append(body)
+                if not message.get("more_body", False):
+                    complete = True
+            await send(message)
+
+        await self.app(scope, receive_wrapper, send_wrapper)
+
+        # 바디를 끝까지 읽지 않은 응답은 지문이 불완전하므로 저장하지 않는다
+        if storable and complete and body_read:
+            self.store.put(
+                key,
+                StoredResponse(
+                    status_code, response_headers, b"".join(chunks), fingerprint.hexdigest()
+                ),
+            )
@@ -0,0 +1,498 @@
+"""
+app/core/logging.py
+
+✅ 구조화(JSON) 로그 + 비동기 배치 출력 (docs/concepts/05-errors-logging-observability.md)
+
+왜 필요한가?
+- 장애 때 "어떤 요청이, 누가, 얼마나 걸려서, 어디서 실패했나"를 찾으려면
+  request_id / user_id / 상태코드 / 소요시간이 한 줄에 구조화돼 있어야 한다.
+- 그런데 요청 처리 스레드에서 바로 stdout/파일에 쓰면
+  I/O 대기(특히 파일 flush, 파이프가 막힌 stdout)가 그대로 응답 지연이 된다.
+
+구조:
+    logger.info(...) ──▶ QueueHandler (요청 스레드: 컨텍스트만 붙이고 큐에 넣기)
+                           │  큐가 가득 차면 버린다(블로킹 X, dropped 카운트)
+                           ▼
+                     LogPipeline 스레드 ──▶ JSON 직렬화 + 배치로 모아서
+                                            stdout / 파일 sink에 한 번에 write
+    (같은 레코드) ──▶ RingBufferHandler (최근 레코드 N개, DEBUG 포함)
+                       → 요청이 5xx/예외로 끝나면 같은 request_id의 직전 기록을
+                         "request.error_context" 로 함께 남긴다.
+
+요청 로그(RequestLoggingMiddleware):
+- X-Request-ID: 들어온 값이 있으면 사용, 없으면 생성 → 응답 헤더/모든 로그에 같은 값
+- 트래픽이 많은 경로는 LOG_SAMPLE_RATES 비율로만 남긴다.
+  단, 에러(5xx)와 느린 요청(LOG_SLOW_MS 이상)은 항상 남긴다.
+  샘플링으로 빠진 요청도 링 버퍼에는 남는다.
+
+사용:
+    from app.core.logging import get_logger, log_event
+    logger = get_logger("auth")
+    log_event(logger, "auth.login", user_id=1)
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import traceback
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, TextIO
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+ROOT_LOGGER = "documind"
+REQUEST_ID_HEADER = b"x-request-id"
+
+# 요청 컨텍스트 (미들웨어가 요청마다 새 dict를 넣는다)
+# - dict를 "수정"하는 방식이라 스레드풀에서 실행되는 sync 의존성(get_current_user)이
+#   user_id를 채워도 미들웨어에서 보인다(ContextVar 값 자체는 복사되지만 dict는 공유).
+_request_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "documind_request_context", default=None
+)
+
+
+def get_request_id() -> Optional[str]:
+    ctx = _request_context.get()
+    return ctx["request_id"] if ctx else None
+
+
+def bind_user(user_id: int) -> None:
+    """현재 요청 로그에 user_id를 붙인다(인증 성공 시 호출)."""
+    ctx = _request_context.get()
+    if ctx is not None:
+        ctx["user_id"] = user_id
+
+
+def get_logger(name: str) -> logging.Logger:
+    """documind.<name> 로거 (핸들러는 documind 루트에만 붙어 있다)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """
+    ✅ 구조화 이벤트 1건 기록
+
+    - 레벨이 꺼져 있으면 dict도 만들지 않고 바로 끝난다.
+    - fields는 JSON 필드로 그대로 들어간다(민감정보 금지: 비밀번호/토큰/이메일 원문 등).
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"fields": fields})
+
+
+# ------------------------------------------------------------
+# 포맷터 / 핸들러
+# ------------------------------------------------------------
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 1개 → JSON 한 줄"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            data["request_id"] = request_id
+        user_id = getattr(record, "user_id", None)
+        if user_id is not None:
+            data["user_id"] = user_id
+        fields = getattr(record, "fields", None)
+        if fields:
+            data.update(fields)
+        if record.exc_info:
+            data["exc"] = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+class _ContextFilter(logging.Filter):
+    """요청 스레드에서(큐에 넣기 전에) request_id/user_id를 레코드에 복사"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        ctx = _request_context.get()
+        if ctx is not None:
+            record.request_id = ctx["request_id"]
+            record.user_id = ctx.get("user_id")
+        return True
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    큐가 가득 차면 기다리지 않고 버린다(로그 때문에 요청이 막히지 않게).
+
+    - prepare(): 예외 스택은 요청 스레드에서 문자열로 만들어 둔다
+      (traceback 객체를 다른 스레드로 넘기지 않음)
+    """
+
+    def __init__(self, q: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+            record.exc_info = None
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    ✅ 최근 레코드 N개 보관 (포맷하지 않고 참조만 → append 1번)
+
+    - 출력 레벨(LOG_LEVEL)보다 낮은 DEBUG 기록과 샘플링으로 빠진 요청 로그도 여기엔 남는다.
+    - 에러가 나면 context_for(request_id)로 같은 요청의 직전 기록을 꺼낸다.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(logging.DEBUG)
+        self.records: Deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def context_for(self, request_id: str) -> List[Dict[str, Any]]:
+        return [
+            {
+                "ts": round(r.created, 6),
+                "level": r.levelname.lower(),
+                "logger": r.name,
+                "event": r.getMessage(),
+                **(getattr(r, "fields", None) or {}),
+            }
+            for r in list(self.records)
+            if getattr(r, "request_id", None) == request_id
+        ]
+
+
+# ------------------------------------------------------------
+# Sink / 파이프라인
+# ------------------------------------------------------------
+
+
+class StreamSink:
+    """
+    스트림 출력 (stream=None 이면 쓸 때마다 현재 sys.stdout)
+
+    - sys.stdout이 나중에 교체돼도(테스트 캡처, 리다이렉트) 닫힌 스트림에 쓰지 않는다.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self.stream = stream
+
+    def write_lines(self, lines: List[str]) -> None:
+        stream = self.stream or sys.stdout
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink:
+    """append 모드 파일 (배치마다 write 1번 + flush 1번)"""
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.file = open(path, "a", encoding="utf-8")
+
+    def write_lines(self, lines: List[str]) -> None:
+        self.file.write("\n".join(lines) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class LogPipeline:
+    """
+    ✅ 큐를 비우는 백그라운드 스레드
+
+    - batch_size개가 모이거나 flush_interval초가 지나면 sink마다 write 1번
+    - stop(): 남은 레코드를 모두 쓰고 종료
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        sinks: List[Any],
+        *,
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+    ) -> None:
+        self.sinks = sinks
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.formatter = JsonFormatter()
+        self.written = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="documind-log", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self.queue.put(self._STOP)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def _write(self, batch: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(self.formatter.format(record))
+            except Exception:  # 레코드 1개 문제로 배치를 잃지 않는다
+                lines.append(json.dumps({"event": "log.format_error", "logger": record.name}))
+        for sink in self.sinks:
+            try:
+                sink.write_lines(lines)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+        self.written += len(lines)
+
+    def _run(self) -> None:
+        batch: List[logging.LogRecord] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            timeout = max(deadline - time.monotonic(), 0.0)
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                if batch:
+                    self._write(batch)
+                return
+            if item is not None:
+                batch.append(item)
+
+            if len(batch) >= self.batch_size or (batch and time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+
+# ------------------------------------------------------------
+# 설정
+# ------------------------------------------------------------
+
+
+_pipeline: Optional[LogPipeline] = None
+_queue_handler: Optional[_DroppingQueueHandler] = None
+ring_buffer = RingBufferHandler(settings.LOG_RING_SIZE)
+
+
+def _build_sinks() -> List[Any]:
+    sinks: List[Any] = []
+    if settings.LOG_STDOUT:
+        sinks.append(StreamSink())
+    if settings.LOG_FILE:
+        sinks.append(FileSink(settings.LOG_FILE))
+    return sinks
+
+
+def _start_pipeline() -> None:
+    global _pipeline
+    _pipeline = LogPipeline(
+        _build_sinks(),
+        queue_size=settings.LOG_QUEUE_SIZE,
+        batch_size=settings.LOG_BATCH_SIZE,
+        flush_interval=settings.LOG_FLUSH_INTERVAL,
+    )
+    _pipeline.start()
+    if _queue_handler is not None:
+        _queue_handler.queue = _pipeline.queue
+
+
+def _restart_after_fork() -> None:
+    """gunicorn preload: 마스터에서 만든 스레드는 fork된 워커에 없다 → 워커에서 다시 시작"""
+    if _pipeline is not None:
+        _start_pipeline()
+
+
+def configure_logging() -> None:
+    """
+    ✅ documind 로거에 큐 핸들러 + 링 버퍼를 붙이고 출력 스레드를 시작한다. (여러 번 호출해도 1번만)
+
+    - documind 로거 레벨은 DEBUG(링 버퍼용), 실제 출력은 LOG_LEVEL 이상만
+    - propagate=False: uvicorn/root 핸들러로 중복 출력하지 않는다.
+    """
+    global _queue_handler
+    if _pipeline is not None or not settings.LOG_ENABLED:
+        return
+
+    _start_pipeline()
+
+    # 핸들러 필터는 하위 로거(documind.auth 등)에서 올라온 레코드에도 적용된다.
+    context_filter = _ContextFilter()
+    _queue_handler = _DroppingQueueHandler(_pipeline.queue)
+    _queue_handler.setLevel(settings.LOG_LEVEL.upper())
+    _queue_handler.addFilter(context_filter)
+    ring_buffer.addFilter(context_filter)
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(logging.DEBUG)
+    root.propagate = False
+    root.addHandler(_queue_handler)
+    root.addHandler(ring_buffer)
+
+    atexit.register(shutdown_logging)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def add_sink(sink: Any) -> None:
+    """출력 대상 추가 (write_lines(lines) / close() 를 가진 객체)"""
+    if _pipeline is not None:
+        _pipeline.sinks.append(sink)
+
+
+def remove_sink(sink: Any) -> None:
+    if _pipeline is not None and sink in _pipeline.sinks:
+        _pipeline.sinks.remove(sink)
+
+
+def shutdown_logging() -> None:
+    """남은 로그를 모두 쓰고 파이프라인 종료"""
+    if _pipeline is not None:
+        _pipeline.stop()
+        for sink in _pipeline.sinks:
+            sink.close()
+
+
+def log_stats() -> Dict[str, int]:
+    """파이프라인 통계 (큐 대기/기록/버린 개수)"""
+    return {
+        "queued": _pipeline.queue.qsize() if _pipeline else 0,
+        "written": _pipeline.written if _pipeline else 0,
+        "dropped": _queue_handler.dropped if _queue_handler else 0,
+    }
+
+
+# ------------------------------------------------------------
+# 요청 로그 미들웨어
+# ------------------------------------------------------------
+
+
+access_logger = get_logger("access")
+
+
+def _sample_rate(path: str) -> float:
+    """가장 긴 prefix가 일치하는 경로의 샘플링 비율 (없으면 1.0 = 전부)"""
+    best, rate = -1, 1.0
+    for prefix, value in settings.LOG_SAMPLE_RATES.items():
+        if path.startswith(prefix) and len(prefix) > best:
+            best, rate = len(prefix), value
+    return rate
+
+
+class RequestLoggingMiddleware:
+    """
+    ✅ request_id 부여 + 요청 1건당 구조화 로그 1줄 ("request")
+
+    필드: method, path, status, elapsed_ms, user_id(인증된 경우), client
+    - 가장 바깥에 둬서 다른 미들웨어 로그에도 같은 request_id가 붙게 한다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = dict(scope["headers"]).get(REQUEST_ID_HEADER, b"").decode("latin-1")
+        request_id = incoming[:64] if incoming else uuid.uuid4().hex
+        ctx: Dict[str, Any] = {"request_id": request_id, "user_id": None}
+        token = _request_context.set(ctx)
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (REQUEST_ID_HEADER, request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        failed = False
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            failed = True
+            access_logger.exception("request.exception")
+            raise
+        finally:
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+            self._log(scope, status_code, elapsed_ms, failed or status_code >= 500, request_id)
+            _request_context.reset(token)
+
+    def _log(self, scope: Scope, status_code: int, elapsed_ms: float, error: bool, request_id: str) -> None:
+        path = scope["path"]
+        keep = (
+            error
+            or elapsed_ms >= settings.LOG_SLOW_MS
+            or random.random() < _sample_rate(path)
+        )
+        client = scope.get("client")
+        fields = {
+            "method": scope["method"],
+            "path": path,
+            "status": status_code,
+            "elapsed_ms": elapsed_ms,
+            "client": client[0] if client else None,
+        }
+        if error:
+            level = logging.ERROR
+        elif keep:
+            level = logging.INFO
+        else:
+            level = logging.DEBUG   # 샘플링으로 빠진 요청 → 링 버퍼에만
+        log_event(access_logger, "request", level, **fields)
+
+        if error:
+            log_event(
+                access_logger,
+                "request.error_context",
+                logging.ERROR,
+                records=ring_buffer.context_for(request_id),
+            )
@@ -0,0 +1,491 @@
+"""
+app/core/profiling.py
+
+✅ 요청 단위 온디맨드 프로파일링 미들웨어
+
+왜 필요한가?
+- 운영에서 특정 엔드포인트(/documents/upload, /auth/login 등)가 느릴 때
+  재배포 없이 "그 요청 하나"의 핫패스를 보고 싶다.
+
+동작:
+1) 프로파일 대상 요청 고르기 (둘 중 하나)
+   - 관리자 서명 헤더:  X-Profile-Token: <만료epoch>.<HMAC-SHA256(secret, "만료:경로")>
+     → make_profile_token() 또는 `python -m app.core.profiling /documents/upload` 로 발급
+   - 샘플링: PROFILING_SAMPLE_RATE 확률 (PROFILING_PATHS로 경로 제한 가능)
+2) 그 요청 동안
+   - 샘플링 프로파일러: 별도 스레드가 PROFILING_INTERVAL_MS마다
+     "지금 이 요청의 일을 하고 있는 스레드"의 스택만 찍는다.
+     (sync 엔드포인트는 스레드풀에서 돌기 때문에 cProfile(현재 스레드만)로는 안 잡힌다)
+     - 프로파일 중인 동안만 스레드풀 호출(anyio.to_thread.run_sync)을 감싸서, 호출 안에서
+       contextvar로 "프로파일 대상 요청"인지 확인하고 실행 중인 동안만 그 스레드 id를 등록한다.
+       → 같은 스레드풀에서 동시에 돈 다른 요청은 섞이지 않는다.
+       → 요청이 끝나면 원래 함수로 되돌린다(평소에는 감싸지 않음).
+     - 이벤트 루프 스레드(async 코드)는 모든 요청이 같이 쓰므로 샘플하지 않는다.
+   - SQL: 엔진 이벤트로 실행된 SQL 문장과 소요 시간 기록 (파라미터는 민감정보라 저장 X)
+3) 결과 파일 (PROFILING_DIR, 최근 PROFILING_MAX_FILES 개 요청만 유지)
+   - <이름>.speedscope.json : https://www.speedscope.app 에서 열기
+   - <이름>.pstats          : python -m pstats / snakeviz 로 열기 (샘플 기반 추정치)
+   - <이름>.sql.json        : 요청 정보 + SQL 목록/시간
+
+오버헤드:
+- PROFILING_ENABLED=False면 main.py가 미들웨어 자체를 등록하지 않고
+  SQL 이벤트 리스너도 붙이지 않는다 → 0.
+- 켜져 있어도 대상이 아닌 요청은 헤더 확인 + 난수 1번이다.
+- 동시에 1개 요청만 프로파일한다(샘플러가 겹치면 서로의 결과를 오염시키므로).
+"""
+
+import contextvars
+import hashlib
+import hmac
+import json
+import marshal
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import anyio
+import anyio.to_thread
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+PROFILE_HEADER = "x-profile-token"
+
+# (파일, 함수 시작 줄, 함수명)
+FrameKey = Tuple[str, int, str]
+
+# 대기 중인 스레드(스레드풀 유휴 워커, 이벤트 루프 select 등)의 샘플은 버린다.
+_IDLE_LEAF_FILES = ("threading.py", "selectors.py", "queue.py")
+
+# 결과 파일 접미사 (stem + 접미사). stem(경로 slug)에 "."이 있어도 묶음을 정확히 나누기 위함
+_PROFILE_SUFFIXES = (".speedscope.json", ".pstats", ".sql.json")
+
+# 현재 요청의 SQL 기록 리스트 (프로파일 대상 요청에서만 설정됨)
+# - contextvar는 스레드풀(run_in_threadpool)로도 복사되므로 sync 엔드포인트의 쿼리도 잡힌다.
+_sql_log: contextvars.ContextVar[Optional[List[Dict[str, Any]]]] = contextvars.ContextVar(
+    "documind_profile_sql", default=None
+)
+
+
+class ProfileTarget:
+    """
+    프로파일 대상 요청의 일을 "지금" 하고 있는 스레드 id 집합
+
+    - 스레드풀 호출이 시작될 때 enter, 끝날 때 exit (같은 스레드 중첩 호출은 횟수로 센다)
+    - 샘플러 스레드가 threads()로 읽는다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active: Dict[int, int] = {}
+
+    def enter(self) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            self._active[ident] = self._active.get(ident, 0) + 1
+
+    def exit(self) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            remaining = self._active.get(ident, 0) - 1
+            if remaining > 0:
+                self._active[ident] = remaining
+            else:
+                self._active.pop(ident, None)
+
+    def threads(self) -> List[int]:
+        with self._lock:
+            return list(self._active)
+
+
+# 현재 요청의 프로파일 대상 표시 (프로파일 대상 요청에서만 설정됨, 스레드풀로도 복사된다)
+_profile_target: contextvars.ContextVar[Optional[ProfileTarget]] = contextvars.ContextVar(
+    "documind_profile_target", default=None
+)
+
+
+# ------------------------------------------------------------
+# 관리자 서명 토큰
+# ------------------------------------------------------------
+
+
+def _sign(secret: str, expires: int, path: str) -> str:
+    message = f"{expires}:{path}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def make_profile_token(path: str, ttl_seconds: int = 300, secret: Optional[str] = None) -> str:
+    """✅ path 요청 1개를 프로파일하게 하는 헤더 값 발급 (ttl 동안 유효)"""
+    secret = secret or settings.PROFILING_SECRET
+    expires = int(time.time()) + ttl_seconds
+    return f"{expires}.{_sign(secret, expires, path)}"
+
+
+def verify_profile_token(token: str, path: str, secret: Optional[str] = None) -> bool:
+    """서명/만료/경로 검증. 시크릿이 비어 있으면 헤더 트리거는 항상 거부."""
+    secret = secret or settings.PROFILING_SECRET
+    if not secret:
+        return False
+    expires_text, _, signature = token.partition(".")
+    try:
+        expires = int(expires_text)
+    except ValueError:
+        return False
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(signature, _sign(secret, expires, path))
+
+
+# ------------------------------------------------------------
+# SQL 캡처 (SQLAlchemy 엔진 이벤트)
+# ------------------------------------------------------------
+
+
+def install_sql_capture(engine: Engine) -> None:
+    """
+    ✅ 엔진에 SQL 타이밍 리스너를 붙인다. (프로파일링이 켜졌을 때 1번만)
+
+    - 프로파일 대상이 아닌 요청에서는 contextvar 조회 1번으로 끝난다.
+    """
+    if getattr(engine, "_documind_sql_capture", False):
+        return
+    engine._documind_sql_capture = True
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _sql_log.get() is not None:
+            conn.info.setdefault("documind_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        log = _sql_log.get()
+        if log is None:
+            return
+        starts = conn.info.get("documind_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        log.append({
+            "statement": statement,
+            "executemany": executemany,
+            "ms": round(elapsed * 1000, 3),
+        })
+
+
+# ------------------------------------------------------------
+# 스레드풀 추적
+# ------------------------------------------------------------
+
+
+_tracking_lock = threading.Lock()
+_tracking_users = 0
+_original_run_sync = None
+
+
+def _tracked_run_sync(func, *args, **kwargs):
+    """anyio.to_thread.run_sync 대체: 워커 스레드 "안에서" contextvar를 읽고 대상이면 스레드 등록"""
+
+    def tracked(*call_args):
+        target = _profile_target.get()
+        if target is None:
+            return func(*call_args)
+        target.enter()
+        try:
+            return func(*call_args)
+        finally:
+            target.exit()
+
+    return _original_run_sync(tracked, *args, **kwargs)
+
+
+def start_thread_tracking() -> None:
+    """
+    ✅ 프로파일 중인 요청이 있는 동안만 anyio.to_thread.run_sync 를 감싼다.
+
+    - Starlette/FastAPI의 run_in_threadpool(sync 엔드포인트/의존성)은 모두 이 함수를 거친다.
+    - 프로파일 중이 아닐 때는 원래 함수 그대로 → 다른 요청/테스트에 영향 없음
+    - 여러 미들웨어 인스턴스가 겹쳐도 되도록 횟수를 센다(마지막 stop에서 원래대로).
+    """
+    global _tracking_users, _original_run_sync
+    with _tracking_lock:
+        if _tracking_users == 0:
+            _original_run_sync = anyio.to_thread.run_sync
+            anyio.to_thread.run_sync = _tracked_run_sync
+        _tracking_users += 1
+
+
+def stop_thread_tracking() -> None:
+    global _tracking_users, _original_run_sync
+    with _tracking_lock:
+        _tracking_users -= 1
+        if _tracking_users == 0:
+            anyio.to_thread.run_sync = _original_run_sync
+            _original_run_sync = None
+
+
+# ------------------------------------------------------------
+# 샘플링 프로파일러
+# ------------------------------------------------------------
+
+
+class StackSampler(threading.Thread):
+    """
+    ✅ interval 마다 대상 요청의 스레드(target.threads())만 콜스택을 찍는 스레드
+
+    samples[thread_id] = [스택(루트→리프 FrameKey 튜플), ...]
+    """
+
+    def __init__(self, interval: float, target: ProfileTarget) -> None:
+        super().__init__(name="documind-profiler", daemon=True)
+        self.interval = interval
+        self.target = target
+        self.samples: Dict[int, List[Tuple[FrameKey, ...]]] = defaultdict(list)
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            wanted = self.target.threads()
+            if not wanted:
+                continue
+            frames = sys._current_frames()
+            for thread_id in wanted:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                leaf = frame.f_code.co_filename
+                if leaf.endswith(_IDLE_LEAF_FILES):
+                    continue
+                stack: List[FrameKey] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples[thread_id].append(tuple(stack))
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def to_speedscope(samples: Dict[int, List[Tuple[FrameKey, ...]]], interval_ms: float, name: str) -> Dict:
+    """샘플 → speedscope "sampled" 포맷 (스레드마다 프로파일 1개)"""
+    frames: List[Dict[str, Any]] = []
+    index: Dict[FrameKey, int] = {}
+    profiles = []
+
+    for thread_id, stacks in samples.items():
+        encoded = []
+        for stack in stacks:
+            row = []
+            for key in stack:
+                if key not in index:
+                    index[key] = len(frames)
+                    frames.append({"name": key[2], "file": key[0], "line": key[1]})
+                row.append(index[key])
+            encoded.append(row)
+        profiles.append({
+            "type": "sampled",
+            "name": f"thread {thread_id}",
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": len(encoded) * interval_ms,
+            "samples": encoded,
+            "weights": [interval_ms] * len(encoded),
+        })
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "documind",
+        "shared": {"frames": frames},
+        "profiles": profiles,
+    }
+
+
+def to_pstats(samples: Dict[int, List[Tuple[FrameKey, ...]]], interval_s: float) -> Dict:
+    """
+    샘플 → pstats(marshal) 딕셔너리
+
+    형식: {func: (cc, nc, tt, ct, {caller: (cc, nc, tt, ct)})}
+    - tt(자기 시간) = 리프로 찍힌 횟수 × 간격
+    - ct(누적 시간) = 스택에 등장한 횟수 × 간격 (재귀는 1번만 셈)
+    - 호출 횟수는 알 수 없으므로 "등장한 샘플 수"로 채운다.
+    """
+    self_count: Dict[FrameKey, int] = defaultdict(int)
+    total_count: Dict[FrameKey, int] = defaultdict(int)
+    edges: Dict[FrameKey, Dict[FrameKey, int]] = defaultdict(lambda: defaultdict(int))
+
+    for stacks in samples.values():
+        for stack in stacks:
+            if not stack:
+                continue
+            self_count[stack[-1]] += 1
+            for key in set(stack):
+                total_count[key] += 1
+            for caller, callee in zip(stack, stack[1:]):
+                edges[callee][caller] += 1
+
+    stats = {}
+    for key, count in total_count.items():
+        callers = {
+            caller: (n, n, 0.0, n * interval_s) for caller, n in edges.get(key, {}).items()
+        }
+        stats[key] = (count, count, self_count.get(key, 0) * interval_s, count * interval_s, callers)
+    return stats
+
+
+# ------------------------------------------------------------
+# 출력 파일 관리
+# ------------------------------------------------------------
+
+
+def _prune(directory: str, max_profiles: int) -> None:
+    """같은 이름(stem)의 파일 묶음을 요청 1개로 보고, 오래된 묶음부터 지운다."""
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for entry in os.scandir(directory):
+        if not entry.is_file():
+            continue
+        for suffix in _PROFILE_SUFFIXES:
+            if entry.name.endswith(suffix):
+                groups[entry.name[: -len(suffix)]].append(entry.path)
+                break
+    if len(groups) <= max_profiles:
+        return
+    ordered = sorted(groups.items(), key=lambda item: min(os.path.getmtime(p) for p in item[1]))
+    for _, paths in ordered[: len(groups) - max_profiles]:
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def write_profile(
+    directory: str,
+    max_profiles: int,
+    meta: Dict[str, Any],
+    samples: Dict[int, List[Tuple[FrameKey, ...]]],
+    interval: float,
+    queries: List[Dict[str, Any]],
+) -> str:
+    """프로파일 결과 3종을 쓰고 디렉터리 크기를 제한한다. 파일 stem 경로 반환."""
+    os.makedirs(directory, exist_ok=True)
+    slug = meta["path"].strip("/").replace("/", "_") or "root"
+    stem = os.path.join(directory, f"{int(time.time() * 1000)}-{slug}-{uuid.uuid4().hex[:8]}")
+
+    with open(f"{stem}.speedscope.json", "w", encoding="utf-8") as f:
+        json.dump(to_speedscope(samples, interval * 1000, f"{meta['method']} {meta['path']}"), f)
+    with open(f"{stem}.pstats", "wb") as f:
+        marshal.dump(to_pstats(samples, interval), f)
+    with open(f"{stem}.sql.json", "w", encoding="utf-8") as f:
+        json.dump({**meta, "query_count": len(queries), "queries": queries}, f, indent=2)
+
+    _prune(directory, max_profiles)
+    return stem
+
+
+# ------------------------------------------------------------
+# 미들웨어
+# ------------------------------------------------------------
+
+
+class ProfilingMiddleware:
+    """
+    ✅ 선택된 요청만 프로파일하는 ASGI 미들웨어
+
+    main.py 에서 settings.PROFILING_ENABLED 일 때만 등록한다.
+    """
+
+    def __init__(self, app: ASGIApp, engine: Optional[Engine] = None) -> None:
+        self.app = app
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.paths = tuple(settings.PROFILING_PATHS)
+        self.interval = settings.PROFILING_INTERVAL_MS / 1000
+        self.directory = settings.PROFILING_DIR
+        self.max_profiles = settings.PROFILING_MAX_FILES
+        self._busy = threading.Lock()
+        if engine is not None:
+            install_sql_capture(engine)
+
+    def _should_profile(self, scope: Scope) -> bool:
+        path = scope["path"]
+        token = Headers(scope=scope).get(PROFILE_HEADER)
+        if token is not None:
+            return verify_profile_token(token, path)
+        if self.sample_rate <= 0:
+            return False
+        if self.paths and not path.startswith(self.paths):
+            return False
+        return random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        # 이미 다른 요청을 프로파일 중이면 이번 요청은 그냥 처리
+        if not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        queries: List[Dict[str, Any]] = []
+        target = ProfileTarget()
+        token = _sql_log.set(queries)
+        target_token = _profile_target.set(target)
+        sampler = StackSampler(self.interval, target)
+        start_thread_tracking()
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            stop_thread_tracking()
+            elapsed = time.perf_counter() - started
+            _sql_log.reset(token)
+            _profile_target.reset(target_token)
+            meta = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "elapsed_ms": round(elapsed * 1000, 3),
+                "sample_interval_ms": self.interval * 1000,
+            }
+            try:
+                # 파일 쓰기는 이벤트 루프를 막지 않도록 스레드에서
+                await anyio.to_thread.run_sync(
+                    write_profile,
+                    self.directory,
+                    self.max_profiles,
+                    meta,
+                    dict(sampler.samples),
+                    self.interval,
+                    queries,
+                )
+            finally:
+                self._busy.release()
+
+
+if __name__ == "__main__":
+    # 관리자용: 헤더 값 발급
+    #   python -m app.core.profiling /documents/upload [ttl초]
+    target = sys.argv[1] if len(sys.argv) > 1 else "/"
+    ttl = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    print(f"X-Profile-Token: {make_profile_token(target, ttl)}")
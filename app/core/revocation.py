@@ -0,0 +1,221 @@
+"""
+app/core/revocation.py
+
+✅ Access Token 폐기 목록(denylist) - 메모리 상주 O(1) 검사
+
+왜 필요한가?
+- Access Token은 stateless라서 "로그아웃한 토큰"을 끊으려면 어딘가에 폐기 목록이 있어야 한다.
+- 그렇다고 요청마다 DB(revoked_tokens)를 조회하면 모든 API에 쿼리 1번이 추가된다.
+
+구조:
+1) BloomFilter  : "확실히 폐기 안 됨"을 빠르게 걸러내는 1차 필터
+                  (대부분의 정상 토큰은 여기서 해시 몇 번으로 끝난다)
+2) 정확한 집합  : jti -> 만료시각(exp). Bloom이 "있을 수도"라고 할 때만 확인
+3) DB 동기화    : 시작 시 revoked_tokens 전체 로드,
+                  이후 REVOCATION_SYNC_SECONDS 마다 "마지막으로 본 id 이후"만 증분 로드
+                  → 여러 워커 프로세스가 있어도 몇 초 안에 폐기가 전파된다.
+                  추가된 지 REVOCATION_SYNC_LAG_SECONDS가 안 된 row에서는 cursor를 멈춘다
+                  (작은 id가 큰 id보다 늦게 commit되면 다음 동기화 때 다시 읽는다).
+
+만료된 jti는 정리(purge)할 때 Bloom을 다시 만든다(Bloom은 삭제가 안 되므로).
+- REVOCATION_PURGE_SECONDS 마다 maybe_sync가 정리한다.
+- 용량을 넘으면 먼저 만료 항목을 버리고, 그래도 넘을 때만 용량을 2배로 늘린다.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repository import token_repository
+
+
+class BloomFilter:
+    """
+    ✅ 아주 작은 Bloom Filter
+
+    - might_contain(x) == False 면 "절대 없음"
+    - might_contain(x) == True  면 "있을 수도 있음"(오탐 가능) → 정확한 집합으로 재확인
+    - 비트 배열 크기/해시 개수는 (예상 개수, 허용 오탐률)로 계산한다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        # 표준 공식: m = -n ln(p) / (ln 2)^2, k = (m / n) ln 2
+        bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_bits = max(bits, 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # 해시 1번(blake2b 128bit)으로 두 값을 얻고 조합해서 k개 위치를 만든다(double hashing)
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def might_contain(self, key: str) -> bool:
+        bits = self._bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+class RevocationList:
+    """
+    ✅ Bloom Filter + 만료시각 있는 정확한 집합
+
+    is_revoked()는 요청마다 호출되므로 DB 접근이 없다.
+    DB 접근은 load()/maybe_sync() 에서만 일어난다.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        sync_seconds: float,
+        *,
+        sync_lag_seconds: float = 0.0,
+        purge_seconds: float = 0.0,
+    ) -> None:
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._sync_seconds = sync_seconds
+        self._sync_lag_seconds = sync_lag_seconds
+        self._purge_seconds = purge_seconds
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._entries: Dict[str, int] = {}   # jti -> exp(epoch 초)
+        self._last_id = 0                    # 마지막으로 반영한 revoked_tokens.id
+        self._last_sync = 0.0
+        self._last_purge = time.monotonic()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # 요청 경로(hot path)
+    # ------------------------------------------------------------
+    def is_revoked(self, jti: str, now: float | None = None) -> bool:
+        """jti가 폐기됐는지 검사 (마이크로초 단위, DB 접근 없음)"""
+        if not self._bloom.might_contain(jti):
+            return False
+        exp = self._entries.get(jti)
+        if exp is None:
+            return False  # Bloom 오탐
+        return exp > (time.time() if now is None else now)
+
+    # ------------------------------------------------------------
+    # 변경
+    # ------------------------------------------------------------
+    def add(self, jti: str, expires_at: int) -> None:
+        """이 프로세스에 즉시 반영 (DB 저장은 호출자가 따로 한다)"""
+        with self._lock:
+            self._add_locked(jti, expires_at)
+
+    def _add_locked(self, jti: str, expires_at: int) -> None:
+        self._entries[jti] = expires_at
+        self._bloom.add(jti)
+        # 예상 용량을 넘으면 오탐률이 올라가므로 (만료 항목을 버린 뒤) Bloom을 다시 만든다.
+        if len(self._entries) > self._capacity:
+            self._rebuild_locked(time.time())
+
+    def _rebuild_locked(self, now: float) -> None:
+        # 만료된 항목을 먼저 버리고, 살아 있는 항목이 그래도 용량을 넘을 때만 키운다.
+        self._entries = {j: e for j, e in self._entries.items() if e > now}
+        while len(self._entries) > self._capacity:
+            self._capacity *= 2
+        bloom = BloomFilter(self._capacity, self._error_rate)
+        for jti in self._entries:
+            bloom.add(jti)
+        self._bloom = bloom
+
+    def _apply_rows(
+        self,
+        rows: Iterable[Tuple[int, str, int, Optional[float]]],
+        visible_before: Optional[float] = None,
+    ) -> None:
+        """
+        row는 전부 반영하고, cursor(_last_id)는 visible_before 전에 추가된 row까지만 전진한다.
+        - 최근 row에서 멈추면 다음 동기화 때 그 뒤를 다시 읽는다(같은 jti 재반영은 무해).
+        """
+        advancing = True
+        for row_id, jti, expires_at, created_at in rows:
+            self._add_locked(jti, expires_at)
+            if advancing and (
+                visible_before is None or created_at is None or created_at <= visible_before
+            ):
+                self._last_id = max(self._last_id, row_id)
+            else:
+                advancing = False
+
+    # ------------------------------------------------------------
+    # DB 동기화
+    # ------------------------------------------------------------
+    def load(self, db: Session) -> None:
+        """
+        ✅ 시작 시 1번: DB에서 전체 재구성
+        - 만료된 row는 DB에서도 지운다.
+        """
+        now = int(time.time())
+        visible_before = time.time() - self._sync_lag_seconds
+        token_repository.purge_expired_revoked(db, now)
+        rows = token_repository.get_revoked_since(db, 0, now)
+        last_id = token_repository.get_max_revoked_id(db, visible_before)
+        with self._lock:
+            self._entries = {}
+            self._last_id = 0
+            self._rebuild_locked(now)
+            self._apply_rows(rows, visible_before)
+            # 만료돼서 안 읽힌 row까지 건너뛴다(최근 row는 제외 → 늦게 commit된 row도 다시 읽힘)
+            self._last_id = max(self._last_id, last_id)
+            self._last_sync = time.monotonic()
+            self._last_purge = time.monotonic()
+
+    def maybe_sync(self, db: Session) -> None:
+        """
+        ✅ 마지막 동기화 후 sync_seconds가 지났을 때만 증분 동기화
+        - 다른 워커 프로세스에서 로그아웃한 토큰을 가져오기 위함
+        - 대부분의 호출은 시간 비교 1번으로 끝난다.
+        - purge_seconds가 지났으면 만료된 jti도 이때 정리한다.
+        """
+        if time.monotonic() - self._last_sync < self._sync_seconds:
+            return
+        with self._lock:
+            if time.monotonic() - self._last_sync < self._sync_seconds:
+                return
+            self._last_sync = time.monotonic()
+            last_id = self._last_id
+        now = time.time()
+        rows = token_repository.get_revoked_since(db, last_id, int(now))
+        with self._lock:
+            self._apply_rows(rows, now - self._sync_lag_seconds)
+            if 0 < self._purge_seconds <= time.monotonic() - self._last_purge:
+                self._rebuild_locked(now)
+                self._last_purge = time.monotonic()
+
+    def purge_expired(self) -> None:
+        """만료된 jti를 메모리에서 제거하고 Bloom 재구성"""
+        with self._lock:
+            self._rebuild_locked(time.time())
+            self._last_purge = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 전역 1개 (프로세스 단위로 공유)
+revocation_list = RevocationList(
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+    sync_seconds=settings.REVOCATION_SYNC_SECONDS,
+    sync_lag_seconds=settings.REVOCATION_SYNC_LAG_SECONDS,
+    purge_seconds=settings.REVOCATION_PURGE_SECONDS,
+)
@@ -4,19 +4,23 @@ app/core/security.py
 ✅ 보안(Security) 유틸 모듈
 - 비밀번호: 해싱(hash) / 검증(verify)
 - JWT: 생성(encode) / 검증+디코딩(decode)
+  - Access Token : 짧은 수명, API 호출용, 폐기 시 denylist(jti)로 차단
+  - Refresh Token: 긴 수명, /auth/refresh 에서 1회용으로 회전(rotation)
 
 JWT 한 줄 요약:
 - 서버가 "이 토큰은 내가 만들었음(위조 아님)"을 서명(signature)으로 증명한다.
 - 서버는 토큰을 검증해서 "누구(sub)인지"를 확인한다.
 """
 
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.revocation import revocation_list
 
 # ✅ 비밀번호 해싱/검증 도구 설정
 # - schemes=["bcrypt"] : bcrypt 알고리즘 사용
@@ -48,64 +52,104 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def create_access_token(
+# ✅ JWT "type" claim 값
+# - access 토큰으로 /auth/refresh 를 호출하거나,
+#   refresh 토큰으로 API를 호출하는 "토큰 혼용"을 막기 위해 구분한다.
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+
+def _encode_token(
     subject: str,
-    expires_delta: Optional[timedelta] = None,
-) -> str:
+    token_type: str,
+    expires_delta: timedelta,
+) -> Tuple[str, str, datetime]:
     """
-    ✅ JWT Access Token 생성
+    ✅ 공통 JWT 생성
 
-    subject:
-    - 토큰 주인(우리는 이메일을 넣는다)
-    - JWT payload의 "sub" 필드로 들어간다.
-
-    expires_delta:
-    - 토큰 만료 시간(예: timedelta(minutes=60))
-    - None이면 settings.ACCESS_TOKEN_EXPIRE_MINUTES 기본값 사용
+    payload:
+    - sub : 토큰 주체(이메일)
+    - exp : 만료 시간
+    - iat : 발급 시간
+    - jti : 토큰 고유 ID (폐기/회전 시 "이 토큰"을 가리키는 키)
+    - type: access / refresh
 
     반환:
-    - JWT 문자열(클라이언트가 Authorization: Bearer <token>으로 보낼 값)
+    - (토큰 문자열, jti, 만료 시각)
     """
+    now = datetime.now(timezone.utc)
+    expire = now + expires_delta
+    jti = uuid.uuid4().hex
 
-    # 1) 만료 시간(exp) 계산 (UTC 기준으로 통일)
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-
-    # 2) JWT payload 구성
-    # - sub: 토큰 주체(누구 토큰인지)
-    # - exp: 만료 시간(이 시간 지나면 jwt.decode에서 자동으로 만료 처리됨)
     payload = {
         "sub": subject,
         "exp": expire,
+        "iat": now,
+        "jti": jti,
+        "type": token_type,
     }
 
-    # 3) payload + 비밀키 + 알고리즘으로 "서명된 토큰 문자열" 생성
+    # payload + 비밀키 + 알고리즘으로 "서명된 토큰 문자열" 생성
     # - settings.JWT_SECRET_KEY가 같아야만 검증이 통과한다.
     token = jwt.encode(
         payload,
         settings.JWT_SECRET_KEY,
         algorithm=settings.JWT_ALGORITHM,
     )
+    return token, jti, expire
 
+
+def create_access_token(
+    subject: str,
+    expires_delta: Optional[timedelta] = None,
+) -> str:
+    """
+    ✅ JWT Access Token 생성
+
+    subject:
+    - 토큰 주인(우리는 이메일을 넣는다)
+    - JWT payload의 "sub" 필드로 들어간다.
+
+    expires_delta:
+    - 토큰 만료 시간(예: timedelta(minutes=15))
+    - None이면 settings.ACCESS_TOKEN_EXPIRE_MINUTES 기본값 사용
+
+    반환:
+    - JWT 문자열(클라이언트가 Authorization: Bearer <token>으로 보낼 값)
+    """
+    if not expires_delta:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    token, _, _ = _encode_token(subject, ACCESS_TOKEN_TYPE, expires_delta)
     return token
 
 
-def decode_access_token(token: str) -> Optional[str]:
+def create_refresh_token(subject: str) -> Tuple[str, str, datetime]:
     """
-    ✅ JWT 검증 + subject(sub) 추출
+    ✅ JWT Refresh Token 생성
 
-    성공:
-    - 토큰이 유효하면 payload에서 sub(이메일)를 반환
+    - 만료: settings.REFRESH_TOKEN_EXPIRE_DAYS
+    - 반환된 jti/만료시각은 refresh_tokens 테이블에 기록해야 한다.
+      (회전/재사용 탐지는 DB 기록 기준으로 한다)
 
-    실패:
-    - 서명 불일치(위조)
-    - 만료(exp 지남)
-    - 포맷 이상
-    이런 경우 None 반환
+    반환:
+    - (토큰 문자열, jti, 만료 시각)
+    """
+    return _encode_token(
+        subject,
+        REFRESH_TOKEN_TYPE,
+        timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+
+
+def decode_token(token: str, token_type: str) -> Optional[Dict[str, Any]]:
+    """
+    ✅ JWT 검증 + payload 반환 (폐기 여부는 보지 않는다)
+
+    실패(None):
+    - 서명 불일치(위조) / 만료(exp 지남) / 포맷 이상
+    - type이 기대한 값과 다름 (access ↔ refresh 혼용)
+    - sub 또는 jti 없음
     """
     try:
         # jwt.decode는 아래를 한 번에 수행한다:
@@ -116,11 +160,38 @@ def decode_access_token(token: str) -> Optional[str]:
             settings.JWT_SECRET_KEY,
             algorithms=[settings.JWT_ALGORITHM],
         )
-
-        # 우리가 만들 때 sub에 이메일을 넣었으니 꺼내서 반환
-        subject: Optional[str] = payload.get("sub")
-        return subject
-
     except JWTError:
         # JWT 관련 에러는 전부 "유효하지 않은 토큰"으로 취급
         return None
+
+    if payload.get("type") != token_type:
+        return None
+    if not payload.get("sub") or not payload.get("jti"):
+        return None
+    return payload
+
+
+def decode_access_token(token: str) -> Optional[str]:
+    """
+    ✅ Access Token 검증 + subject(sub) 추출
+
+    성공:
+    - 토큰이 유효하고 폐기되지 않았으면 payload에서 sub(이메일)를 반환
+
+    실패:
+    - decode_token 실패 사유 전부
+    - 로그아웃 등으로 폐기된 토큰(jti가 denylist에 있음)
+    이런 경우 None 반환
+
+    폐기 검사는 메모리 상주 denylist(app/core/revocation.py)로 하므로
+    DB 조회가 추가되지 않는다.
+    """
+    payload = decode_token(token, ACCESS_TOKEN_TYPE)
+    if payload is None:
+        return None
+
+    if revocation_list.is_revoked(payload["jti"]):
+        return None
+
+    subject: Optional[str] = payload.get("sub")
+    return subject
@@ -0,0 +1,113 @@
+"""
+app/core/uploads.py
+
+✅ 업로드 파일 저장 유틸 (스트리밍 1-pass)
+
+업로드 파일을 청크 단위로 한 번만 읽으면서 아래를 동시에 처리한다.
+- 디스크에 쓰기
+- 매직 바이트 검사 + 페이지 수 (app/core/file_sniff.py)
+- 크기(size_bytes) / SHA-256 해시 계산 (중복 탐지/용량 집계용)
+
+같은 검사를 "이미 저장된 파일"에도 돌릴 수 있게 inspect_file도 제공한다.
+(마이그레이션 백필: app/db/migrate.py)
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+
+from app.core.config import settings
+from app.core.file_sniff import UnsupportedFileType, UploadSniffer
+
+
+class UploadTooLarge(Exception):
+    """업로드가 허용된 크기(남은 쿼터 등)를 넘었을 때"""
+
+
+@dataclass
+class StoredUpload:
+    """저장(또는 검사)한 파일의 메타데이터"""
+    size_bytes: int
+    sha256: str
+    detected_type: Optional[str]
+    page_count: Optional[int]
+
+
+def write_upload(
+    src: BinaryIO,
+    save_path: str,
+    max_bytes: Optional[int] = None,
+    expected_type: Optional[str] = None,
+) -> StoredUpload:
+    """
+    ✅ src(업로드 파일 객체)를 save_path에 청크 단위로 저장한다.
+
+    - 파일 전체를 메모리에 올리지 않는다(UPLOAD_CHUNK_SIZE 단위).
+    - 검사는 쓰기 루프 안에서 같이 하므로 파일을 두 번 읽지 않는다.
+    - 잘못된 파일이면 판별 시점에 바로 중단하고(UnsupportedFileType),
+      쓰던 파일은 지운다.
+    - max_bytes(예: 남은 쿼터)를 넘는 순간 중단한다(UploadTooLarge).
+    - expected_type(클라이언트가 주장한 MIME)과 실제 형식이 다르면
+      판별되는 청크에서 바로 중단한다(ContentTypeMismatch).
+    """
+    sniffer = UploadSniffer(expected_type=expected_type)
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with open(save_path, "wb") as buffer:
+            while chunk := src.read(settings.UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLarge("Storage quota exceeded")
+                sniffer.feed(chunk)      # ❗ 쓰기 전에 검사 → 거부되면 이 청크는 안 씀
+                hasher.update(chunk)
+                buffer.write(chunk)
+        sniffed = sniffer.finish()
+    except BaseException:
+        if os.path.exists(save_path):
+            os.remove(save_path)
+        raise
+
+    return StoredUpload(
+        size_bytes=size,
+        sha256=hasher.hexdigest(),
+        detected_type=sniffed.detected_type,
+        page_count=sniffed.page_count,
+    )
+
+
+def inspect_file(path: str) -> StoredUpload:
+    """
+    ✅ 이미 저장된 파일을 1번 읽어서 크기/해시/형식/페이지 수를 계산한다.
+
+    - 업로드 때와 달리 형식 판별에 실패해도 예외를 던지지 않고
+      detected_type/page_count를 None으로 둔다(해시/크기는 항상 계산).
+    """
+    sniffer: Optional[UploadSniffer] = UploadSniffer()
+    hasher = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as src:
+        while chunk := src.read(settings.UPLOAD_CHUNK_SIZE):
+            if sniffer is not None:
+                try:
+                    sniffer.feed(chunk)
+                except UnsupportedFileType:
+                    sniffer = None
+            hasher.update(chunk)
+            size += len(chunk)
+
+    detected_type = page_count = None
+    if sniffer is not None:
+        try:
+            sniffed = sniffer.finish()
+            detected_type, page_count = sniffed.detected_type, sniffed.page_count
+        except UnsupportedFileType:
+            pass
+
+    return StoredUpload(
+        size_bytes=size,
+        sha256=hasher.hexdigest(),
+        detected_type=detected_type,
+        page_count=page_count,
+    )
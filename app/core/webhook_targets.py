@@ -0,0 +1,120 @@
+"""
+app/core/webhook_targets.py
+
+✅ 웹훅 전송 대상 검사 (SSRF 방지)
+
+왜 필요한가?
+- 로그인한 사용자는 누구나 웹훅 URL을 등록할 수 있고, 서버가 그 URL로 POST 한다.
+- 검사 없이 보내면 사용자가 서버를 "대신 요청해 주는 프록시"로 쓸 수 있다(SSRF).
+  예: http://127.0.0.1:8000/..., http://10.0.0.5/admin, http://169.254.169.254/ (클라우드 메타데이터)
+
+규칙:
+1) https만 허용 (WEBHOOK_ALLOW_HTTP=True면 http도 - 로컬 개발용)
+2) 호스트를 DNS로 풀어서 나온 주소가 "전부" 공인(global) 주소여야 한다.
+   loopback / RFC1918 사설망 / link-local(169.254.x.x) / CGNAT / 예약 주소면 거부
+   (WEBHOOK_ALLOW_PRIVATE_NETWORKS=True면 검사 생략 - 로컬 개발/테스트용)
+3) 등록할 때와 보낼 때 둘 다 검사한다(등록 후 DNS가 바뀌는 경우).
+4) 보낼 때는 검사한 IP로 직접 연결한다(검사 후 다시 DNS를 풀면 다른 IP가 나올 수 있음).
+   TLS 인증서 검증/SNI/Host 헤더는 원래 호스트 이름으로 한다.
+5) 리다이렉트는 따라가지 않는다(3xx는 전달 실패로 본다) → 리다이렉트로 내부 주소를 가리키는 우회 차단
+"""
+
+import http.client
+import ipaddress
+import socket
+import ssl
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+
+
+class UnsafeWebhookTarget(ValueError):
+    """웹훅 URL이 허용되지 않는 대상(스킴/사설 주소 등)을 가리킬 때"""
+
+
+@dataclass(frozen=True)
+class WebhookTarget:
+    """검사를 통과한 전송 대상 (address = 실제로 연결할 IP)"""
+    scheme: str
+    host: str
+    port: int
+    path: str
+    address: str
+
+
+def _is_public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])   # IPv6 zone id 제거
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def resolve_webhook_target(url: str) -> WebhookTarget:
+    """
+    ✅ URL 검사 + DNS 해석
+
+    Raises:
+        UnsafeWebhookTarget: 허용되지 않는 스킴/호스트/주소
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme != "https" and not (scheme == "http" and settings.WEBHOOK_ALLOW_HTTP):
+        raise UnsafeWebhookTarget("Webhook URL must use https")
+    if not parts.hostname or parts.username or parts.password:
+        raise UnsafeWebhookTarget("Webhook URL must have a host and no credentials")
+
+    try:
+        port = parts.port or (443 if scheme == "https" else 80)
+    except ValueError:
+        raise UnsafeWebhookTarget("Webhook URL has an invalid port")
+
+    try:
+        infos = socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        raise UnsafeWebhookTarget("Webhook host does not resolve")
+    addresses = [info[4][0] for info in infos]
+    if not addresses:
+        raise UnsafeWebhookTarget("Webhook host does not resolve")
+    if not settings.WEBHOOK_ALLOW_PRIVATE_NETWORKS and not all(map(_is_public, addresses)):
+        raise UnsafeWebhookTarget("Webhook host resolves to a non-public address")
+
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return WebhookTarget(scheme, parts.hostname, port, path, addresses[0])
+
+
+class _PinnedHTTPConnection(http.client.HTTPConnection):
+    """검사한 IP로 연결 (Host 헤더는 원래 호스트)"""
+
+    def __init__(self, target: WebhookTarget, timeout: float) -> None:
+        super().__init__(target.host, target.port, timeout=timeout)
+        self._address = target.address
+
+    def connect(self) -> None:
+        self.sock = socket.create_connection((self._address, self.port), self.timeout)
+
+
+class _PinnedHTTPSConnection(http.client.HTTPSConnection):
+    """검사한 IP로 연결 + 인증서/SNI는 원래 호스트 이름으로 검증"""
+
+    def __init__(self, target: WebhookTarget, timeout: float) -> None:
+        self._ssl_context = ssl.create_default_context()
+        super().__init__(target.host, target.port, timeout=timeout, context=self._ssl_context)
+        self._address = target.address
+
+    def connect(self) -> None:
+        sock = socket.create_connection((self._address, self.port), self.timeout)
+        self.sock = self._ssl_context.wrap_socket(sock, server_hostname=self.host)
+
+
+def open_connection(target: WebhookTarget, timeout: float) -> http.client.HTTPConnection:
+    """
+    대상 IP에 고정된 연결을 만든다.
+
+    - http.client는 리다이렉트를 따라가지 않는다(3xx 상태 코드를 그대로 돌려줌).
+    """
+    if target.scheme == "https":
+        return _PinnedHTTPSConnection(target, timeout)
+    return _PinnedHTTPConnection(target, timeout)
@@ -0,0 +1,200 @@
+"""
+app/db/migrate.py
+
+✅ 가벼운 스키마 마이그레이션 + 백필(backfill) 도구
+
+왜 필요한가?
+- Base.metadata.create_all 은 "없는 테이블"만 만든다.
+  이미 있는 테이블에 컬럼/인덱스가 추가되면 반영하지 못한다.
+- 새 컬럼(size_bytes, sha256, created_at 등)은 기존 row에서 비어 있으므로
+  app/uploads 의 실제 파일을 읽어서 채워야 한다.
+
+하는 일:
+1) upgrade_schema(engine)
+   - 모델에는 있는데 DB 테이블에 없는 컬럼 → ALTER TABLE ADD COLUMN
+   - 모델에는 있는데 DB에 없는 인덱스 → CREATE INDEX
+   - 앱 시작 시(app/main.py) 자동 실행된다. 이미 맞으면 아무것도 안 한다.
+2) backfill_documents()
+   - sha256이 비어 있는 documents row를 id 순서로 batch_size개씩 처리
+   - 파일 읽기/해시 계산은 트랜잭션 "밖"에서 하고,
+     UPDATE는 배치마다 짧은 트랜잭션으로 커밋한다.
+     → 긴 락을 잡지 않으므로 서비스 중에도 돌릴 수 있다.
+   - 배치 사이에 pause 초만큼 쉬어서 I/O/락 경합을 양보한다.
+
+실행:
+    python -m app.db.migrate                 # 스키마만 맞추기
+    python -m app.db.migrate --backfill      # + 기존 row 백필
+    python -m app.db.migrate --backfill --batch-size 200 --pause 0.1
+"""
+
+import argparse
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, inspect, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.uploads import inspect_file
+from app.db.database import Base, SessionLocal, engine as default_engine
+from app.models.document import Document
+
+logger = logging.getLogger("documind.migrate")
+
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """
+    ✅ 누락된 컬럼/인덱스를 추가한다. (idempotent)
+
+    - 컬럼 추가는 ADD COLUMN만 한다(타입 변경/삭제는 하지 않음).
+    - NOT NULL 컬럼은 server_default가 있어야 기존 row에 값이 채워진다.
+
+    Returns:
+        실행한 변경 설명 목록 (로그/테스트용)
+    """
+    changes: List[str] = []
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue  # create_all이 만든다
+
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                ddl = f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'
+                if column.server_default is not None:
+                    ddl += f" DEFAULT '{column.server_default.arg}'"
+                    if not column.nullable:
+                        ddl += " NOT NULL"
+                conn.execute(text(ddl))
+                changes.append(f"add column {table.name}.{column.name}")
+
+            existing_indexes = {i["name"] for i in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(bind=conn, checkfirst=True)
+                    changes.append(f"create index {index.name}")
+
+    for change in changes:
+        logger.info("schema: %s", change)
+    return changes
+
+
+def _pending_batch(db: Session, after_id: int, batch_size: int) -> List[Dict]:
+    rows = (
+        db.query(Document.id, Document.file_path)
+        .filter(Document.sha256.is_(None), Document.deleted_at.is_(None), Document.id > after_id)
+        .order_by(Document.id)
+        .limit(batch_size)
+        .all()
+    )
+    return [{"id": row.id, "file_path": row.file_path} for row in rows]
+
+
+def backfill_documents(
+    batch_size: int = 500,
+    pause: float = 0.05,
+    session_factory=SessionLocal,
+    max_batches: Optional[int] = None,
+) -> int:
+    """
+    ✅ 기존 documents row의 size_bytes/sha256/created_at/형식 정보를 파일에서 채운다.
+
+    - 파일이 없으면 status="missing" 으로 표시한다(다시 처리하지 않도록 sha256도 빈 문자열).
+    - 중간에 멈춰도 다시 실행하면 남은 row부터 이어서 처리한다.
+
+    Returns:
+        실제로 갱신한 row 수 (그 사이 다른 실행/삭제가 처리해서 건너뛴 row는 빼고)
+    """
+    updated = 0
+    last_id = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        # 1) 대상 id 목록만 짧게 읽고 세션(트랜잭션)을 바로 닫는다.
+        with session_factory() as db:
+            batch = _pending_batch(db, last_id, batch_size)
+        if not batch:
+            break
+
+        # 2) 파일 I/O는 트랜잭션 밖에서
+        values = []
+        for row in batch:
+            path = row["file_path"]
+            if not os.path.exists(path):
+                values.append({"id": row["id"], "sha256": "", "status": "missing"})
+                continue
+            info = inspect_file(path)
+            values.append({
+                "id": row["id"],
+                "size_bytes": info.size_bytes,
+                "sha256": info.sha256,
+                "detected_type": info.detected_type,
+                "page_count": info.page_count,
+                "created_at": datetime.fromtimestamp(os.path.getmtime(path), tz=timezone.utc),
+                "status": "ready",
+            })
+
+        # 3) 짧은 쓰기 트랜잭션 (아직 비어 있는 컬럼만 채운다)
+        # - row마다 "sha256 IS NULL AND 삭제 안 됨" 조건부 UPDATE 1문장
+        #   → 그 사이 삭제되었거나 다른 백필이 처리한 row는 0행이라 세지 않는다.
+        with session_factory() as db:
+            for value in values:
+                document_id = value.pop("id")
+                columns = {
+                    # sha256/status는 항상, 나머지는 비어 있을 때만 채운다
+                    key: v if key in ("sha256", "status") else func.coalesce(getattr(Document, key), v)
+                    for key, v in value.items()
+                }
+                result = db.execute(
+                    update(Document)
+                    .where(
+                        Document.id == document_id,
+                        Document.sha256.is_(None),
+                        Document.deleted_at.is_(None),
+                    )
+                    .values(**columns)
+                )
+                updated += result.rowcount
+            db.commit()
+
+        last_id = batch[-1]["id"]
+        batches += 1
+        logger.info("backfill: %s rows done (last id %s)", updated, last_id)
+
+        if pause:
+            time.sleep(pause)
+
+    return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.db.migrate")
+    parser.add_argument("--backfill", action="store_true", help="기존 documents row 백필")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.05, help="배치 사이 대기(초)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    # 모델을 import해야 Base.metadata에 테이블이 등록된다.
+    from app.models import artifact, outbox, sharing, token, user  # noqa: F401
+
+    Base.metadata.create_all(bind=default_engine)
+    upgrade_schema(default_engine)
+
+    if args.backfill:
+        total = backfill_documents(batch_size=args.batch_size, pause=args.pause)
+        logger.info("backfill finished: %s rows", total)
+
+
+if __name__ == "__main__":
+    main()
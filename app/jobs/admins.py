@@ -0,0 +1,54 @@
+"""
+app/jobs/admins.py
+
+✅ 관리자 권한 지정/해제 CLI
+
+왜 필요한가?
+- 관리자 권한을 "이 이메일로 가입하면 관리자" 식으로 주면
+  이메일 인증이 없는 상태에서는 그 주소를 먼저 가입한 사람이 관리자가 된다.
+- 그래서 가입으로는 관리자가 될 수 없고, 서버에 접근할 수 있는 운영자가
+  이미 가입한 계정을 이 명령으로 지정한다.
+
+실행:
+    python -m app.jobs.admins grant admin@example.com [더 많은 이메일...]
+    python -m app.jobs.admins revoke admin@example.com
+"""
+
+import argparse
+import logging
+import sys
+from typing import List
+
+from app.db.database import SessionLocal
+from app.repository.user_repository import set_admin
+
+logger = logging.getLogger("documind.jobs.admins")
+
+
+def run(action: str, emails: List[str]) -> List[str]:
+    """권한 변경 1회. 찾지 못한 이메일 목록 반환"""
+    with SessionLocal() as db:
+        missing = set_admin(db, emails, is_admin=(action == "grant"))
+    for email in missing:
+        logger.warning("admins: no user with email %s", email)
+    logger.info("admins: %s %s user(s)", action, len(set(emails)) - len(missing))
+    return missing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.jobs.admins")
+    parser.add_argument("action", choices=["grant", "revoke"])
+    parser.add_argument("emails", nargs="+")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    # 모델을 import해야 관계/테이블 메타데이터가 준비된다.
+    import app.main  # noqa: F401
+
+    if run(args.action, args.emails):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+app/jobs/gc.py
+
+✅ 삭제 문서 GC(garbage collection): 파일/row 회수
+
+왜 필요한가?
+- DELETE /documents/{id} 는 deleted_at만 채우고 바로 응답한다(soft delete).
+  큰 파일을 요청 안에서 지우면 응답이 느려지고, 한꺼번에 지우면 디스크 I/O가 튄다.
+- 그래서 실제 파일(app/uploads)과 row는 이 작업이 나중에 천천히 치운다.
+
+하는 일(1회 실행 = collect_once):
+1) 삭제된 지 GC_GRACE_SECONDS가 지난 문서를 오래된 삭제부터 GC_BATCH_SIZE개 고른다.
+2) 문서마다
+   - 같은 파일 경로를 쓰는 다른 row가 없을 때만 파일을 지운다.
+   - 파일이 이미 없으면 지운 것으로 본다. 다른 OSError면 row를 남겨서 다음 실행 때 재시도.
+   - 파일을 치운 문서의 row를 지운다(배치마다 commit).
+3) 이 배치 문서들의 내용 해시(sha256)로 만든 파생 산출물 중
+   "같은 내용의 살아 있는 문서가 없고, 유예 기간 동안 쓰이지 않은 것"을 지운다.
+   - 삭제 조건(NOT EXISTS 살아 있는 문서)을 DELETE 문 안에서 다시 확인한다.
+     → 그 사이 같은 내용이 다시 업로드됐으면 0행이 되어 파일도 남는다.
+4) 속도 제한
+   - 초당 GC_MAX_BYTES_PER_SECOND 바이트를 넘지 않도록 파일 삭제 사이에 쉰다.
+   - 배치 사이 GC_BATCH_PAUSE_SECONDS 만큼 쉰다.
+
+실행:
+    python -m app.jobs.gc                 # 1번 실행 (남은 게 없을 때까지)
+    python -m app.jobs.gc --interval 600  # 10분마다 반복
+
+여러 워커가 중복 실행하지 않도록 API 프로세스가 아니라
+cron/별도 프로세스에서 1개만 돌리는 것을 권장한다.
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger, log_event
+from app.db.database import SessionLocal
+from app.repository import artifact_repository, document_repository
+
+logger = get_logger("jobs.gc")
+
+
+class Throttle:
+    """
+    초당 바이트 상한 (0 이하면 제한 없음)
+
+    - 지금까지 지운 바이트를 상한으로 나눈 "최소 경과 시간"보다 빨리 왔으면 그만큼 쉰다.
+    """
+
+    def __init__(
+        self,
+        bytes_per_second: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.bytes_per_second = bytes_per_second
+        self._clock = clock
+        self._sleep = sleep
+        self._started = clock()
+        self._bytes = 0
+
+    def consume(self, size: int) -> None:
+        if self.bytes_per_second <= 0:
+            return
+        self._bytes += size
+        wait = self._bytes / self.bytes_per_second - (self._clock() - self._started)
+        if wait > 0:
+            self._sleep(wait)
+
+
+def _remove_file(path: str) -> bool:
+    """파일 삭제. 이미 없으면 True, 지우지 못했으면 False"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return True
+    except OSError as exc:
+        logger.warning("gc: cannot remove %s: %s", path, exc)
+        return False
+    return True
+
+
+def _collect_batch(now: datetime, throttle: Throttle, stats: Dict[str, int]) -> int:
+    """배치 1개 처리. 고른 문서 수 반환 (0이면 남은 게 없음)"""
+    with SessionLocal() as db:
+        documents = document_repository.get_expired_deleted_documents(
+            db,
+            before=now - timedelta(seconds=settings.GC_GRACE_SECONDS),
+            limit=settings.GC_BATCH_SIZE,
+        )
+        shas = set()
+        for document in documents:
+            if document_repository.count_file_references(
+                db, document.file_path, exclude_id=document.id
+            ) == 0:
+                if not _remove_file(document.file_path):
+                    stats["failed"] += 1
+                    continue
+                stats["bytes"] += document.size_bytes or 0
+                throttle.consume(document.size_bytes or 0)
+            if document.sha256:
+                shas.add(document.sha256)
+            document_repository.purge_document(db, document)
+            stats["documents"] += 1
+        db.commit()
+
+        idle_before = now.timestamp() - settings.GC_GRACE_SECONDS
+        for artifact in artifact_repository.orphaned_artifacts(db, shas, idle_before):
+            file_path, size = artifact.file_path, artifact.size_bytes
+            if artifact_repository.delete_if_orphaned(db, artifact.id, idle_before):
+                _remove_file(file_path)
+                throttle.consume(size)
+                stats["artifacts"] += 1
+    return len(documents)
+
+
+def collect_once(
+    now: Optional[datetime] = None,
+    *,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Dict[str, int]:
+    """
+    GC 1회. 통계 반환
+    {"documents": 지운 row 수, "bytes": 회수한 업로드 바이트, "artifacts": 지운 산출물 수, "failed": 파일 삭제 실패 수}
+    """
+    now = datetime.now(timezone.utc) if now is None else now
+    throttle = Throttle(settings.GC_MAX_BYTES_PER_SECOND, sleep=sleep)
+    stats = {"documents": 0, "bytes": 0, "artifacts": 0, "failed": 0}
+
+    batches = 0
+    while True:
+        purged_before = stats["documents"]
+        selected = _collect_batch(now, throttle, stats)
+        batches += 1
+        # 다 치웠거나 / 이번 배치에서 하나도 못 지웠거나(실패만 남음) / 배치 수 상한
+        if (
+            selected < settings.GC_BATCH_SIZE
+            or stats["documents"] == purged_before
+            or 0 < settings.GC_MAX_BATCHES <= batches
+        ):
+            break
+        if settings.GC_BATCH_PAUSE_SECONDS > 0:
+            sleep(settings.GC_BATCH_PAUSE_SECONDS)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.jobs.gc")
+    parser.add_argument("--interval", type=float, default=0, help="반복 주기(초), 0이면 1번만")
+    args = parser.parse_args()
+
+    # 모델을 import해야 관계/테이블 메타데이터가 준비된다(로그 설정도 여기서).
+    import app.main  # noqa: F401
+
+    while True:
+        stats = collect_once()
+        if stats["documents"] or stats["failed"]:
+            log_event(logger, "gc.run", **stats)
+        if args.interval <= 0:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+app/jobs/outbox_dispatcher.py
+
+✅ Outbox → 웹훅 전달 디스패처
+
+하는 일(1회 실행 = dispatch_once):
+1) 보낼 차례인 구독을 고른다 (활성 + 백오프 시각 지남 + cursor 이후 이벤트 있음)
+2) 구독마다 cursor 이후 이벤트를 최대 WEBHOOK_BATCH_SIZE개 묶어서 POST 1번
+   - 만들어진 지 OUTBOX_CURSOR_LAG_SECONDS가 안 된 이벤트는 다음 실행으로 미룬다
+     (commit이 늦은 작은 id를 cursor가 건너뛰지 않도록)
+   - 대상 URL은 보낼 때마다 다시 검사한다(https + 공인 주소, 리다이렉트 안 따라감)
+   - 서로 다른 구독자는 스레드 풀로 동시에 보낸다(느린 구독자가 다른 구독자를 막지 않음)
+   - 한 구독자에게는 한 번에 배치 1개만 보낸다 → 구독자별 순서 보장
+3) 2xx면 cursor 전진, 아니면 cursor 그대로 + 지수 백오프로 재시도 예약
+4) 보관 기간이 지난 이벤트 정리
+
+전달 보장: at-least-once
+- 응답을 못 받고 끊기면 같은 배치를 다시 보낼 수 있다.
+  수신 측은 이벤트 id로 중복을 걸러야 한다.
+
+요청 형식:
+    POST <url>
+    Content-Type: application/json
+    X-DocuMind-Signature: sha256=<HMAC-SHA256(secret, body) hex>
+    {"subscription_id": 1, "events": [{"id": 10, "type": "document.created", ...}]}
+
+실행:
+    python -m app.jobs.outbox_dispatcher               # 1번 실행
+    python -m app.jobs.outbox_dispatcher --interval 1  # 1초마다 반복
+"""
+
+import argparse
+import hashlib
+import hmac
+import http.client
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.webhook_targets import UnsafeWebhookTarget, open_connection, resolve_webhook_target
+from app.db.database import SessionLocal
+from app.repository import outbox_repository
+
+logger = logging.getLogger("documind.jobs.outbox_dispatcher")
+
+# (url, body, headers, timeout) -> HTTP status (연결 실패는 0)
+Sender = Callable[[str, bytes, Dict[str, str], float], int]
+
+
+@dataclass
+class _Delivery:
+    subscription_id: int
+    url: str
+    body: bytes
+    headers: Dict[str, str]
+    last_event_id: int
+    event_count: int
+    status: int = 0
+
+
+def sign(secret: str, body: bytes) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def post_json(url: str, body: bytes, headers: Dict[str, str], timeout: float) -> int:
+    """
+    http.client로 POST (외부 의존성 없음). 연결 실패/타임아웃/허용되지 않는 대상은 0
+
+    - 보낼 때마다 대상을 다시 검사하고(등록 후 DNS가 바뀌었을 수 있음) 검사한 IP로 연결한다.
+    - 리다이렉트는 따라가지 않는다 → 3xx는 그대로 실패로 기록된다.
+    """
+    try:
+        target = resolve_webhook_target(url)
+    except UnsafeWebhookTarget as exc:
+        logger.warning("webhook %s rejected: %s", url, exc)
+        return 0
+    connection = open_connection(target, timeout)
+    try:
+        connection.request("POST", target.path, body=body, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    except (http.client.HTTPException, OSError) as exc:
+        logger.warning("webhook %s unreachable: %s", url, exc)
+        return 0
+    finally:
+        connection.close()
+
+
+def _build_deliveries(now: float) -> List[_Delivery]:
+    deliveries = []
+    with SessionLocal() as db:
+        for subscription in outbox_repository.get_due_subscriptions(db, now):
+            events = outbox_repository.get_events_after(
+                db,
+                subscription.owner_id,
+                subscription.last_event_id,
+                limit=settings.WEBHOOK_BATCH_SIZE,
+                visible_before=outbox_repository.visible_before(now),
+            )
+            if not events:
+                continue
+            body = json.dumps(
+                {
+                    "subscription_id": subscription.id,
+                    "events": [
+                        {
+                            "id": event.id,
+                            "type": event.event_type,
+                            "document_id": event.document_id,
+                            "created_at": event.created_at,
+                            "data": json.loads(event.payload),
+                        }
+                        for event in events
+                    ],
+                },
+                separators=(",", ":"),
+            ).encode()
+            deliveries.append(
+                _Delivery(
+                    subscription_id=subscription.id,
+                    url=subscription.url,
+                    body=body,
+                    headers={
+                        "Content-Type": "application/json",
+                        "X-DocuMind-Signature": sign(subscription.secret, body),
+                    },
+                    last_event_id=events[-1].id,
+                    event_count=len(events),
+                )
+            )
+    return deliveries
+
+
+def dispatch_once(now: Optional[float] = None, send: Sender = post_json) -> Dict[str, int]:
+    """
+    디스패치 1회. 통계 반환 {"delivered": 성공 배치 수, "failed": 실패 배치 수, "events": 전달한 이벤트 수}
+
+    - DB 세션은 "읽기"와 "결과 기록" 때만 짧게 연다(HTTP 대기 중에는 커넥션을 잡지 않음).
+    """
+    now = time.time() if now is None else now
+    deliveries = _build_deliveries(now)
+
+    # 1) HTTP 전송 (구독자끼리 병렬)
+    if deliveries:
+        workers = max(1, min(settings.WEBHOOK_CONCURRENCY, len(deliveries)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            statuses = pool.map(
+                lambda d: send(d.url, d.body, d.headers, settings.WEBHOOK_TIMEOUT_SECONDS),
+                deliveries,
+            )
+            for delivery, status in zip(deliveries, statuses):
+                delivery.status = status
+
+    # 2) 결과 기록 (성공 → cursor 전진 / 실패 → 백오프)
+    stats = {"delivered": 0, "failed": 0, "events": 0}
+    with SessionLocal() as db:
+        for delivery in deliveries:
+            subscription = outbox_repository.get_subscription(db, delivery.subscription_id)
+            if subscription is None:
+                continue  # 그 사이 구독 삭제됨
+            if 200 <= delivery.status < 300:
+                outbox_repository.mark_delivered(db, subscription, delivery.last_event_id)
+                stats["delivered"] += 1
+                stats["events"] += delivery.event_count
+            else:
+                outbox_repository.mark_failed(db, subscription, now)
+                stats["failed"] += 1
+                logger.warning(
+                    "webhook delivery failed: subscription=%s status=%s failures=%s",
+                    subscription.id, delivery.status, subscription.failures,
+                )
+
+        # 3) 오래된 이벤트 정리
+        outbox_repository.purge_events(
+            db, older_than=now - settings.OUTBOX_RETENTION_DAYS * 86400
+        )
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.jobs.outbox_dispatcher")
+    parser.add_argument("--interval", type=float, default=0, help="반복 주기(초), 0이면 1번만")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    # 모델을 import해야 관계/테이블 메타데이터가 준비된다.
+    import app.main  # noqa: F401
+
+    while True:
+        stats = dispatch_once()
+        if stats["delivered"] or stats["failed"]:
+            logger.info("outbox dispatch: %s", stats)
+        if args.interval <= 0:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+app/jobs/reconcile_usage.py
+
+✅ 사용량 카운터 보정(reconciliation) 주기 작업
+
+왜 필요한가?
+- users.storage_bytes_used / document_count 는 업로드/삭제 때 증분으로만 갱신된다.
+- 수동 DB 작업, 중간 실패, 버그 등으로 실제 documents와 어긋날(drift) 수 있다.
+- 이 작업이 주기적으로 실제 집계값과 비교해서 바로잡는다.
+
+실행:
+    python -m app.jobs.reconcile_usage                 # 1번 실행
+    python -m app.jobs.reconcile_usage --interval 3600 # 1시간마다 반복
+
+여러 워커가 중복 실행하지 않도록 API 프로세스가 아니라
+cron/별도 프로세스에서 1개만 돌리는 것을 권장한다.
+"""
+
+import argparse
+import logging
+import time
+
+from app.db.database import SessionLocal
+from app.repository.usage_repository import reconcile_usage
+
+logger = logging.getLogger("documind.jobs.reconcile_usage")
+
+
+def run_once(batch_size: int = 500) -> int:
+    """보정 1회 실행. 고친 사용자 수 반환"""
+    with SessionLocal() as db:
+        fixed = reconcile_usage(db, batch_size=batch_size)
+    logger.info("usage reconciliation: %s users corrected", fixed)
+    return fixed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.jobs.reconcile_usage")
+    parser.add_argument("--interval", type=float, default=0, help="반복 주기(초), 0이면 1번만")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    # 모델을 import해야 관계/테이블 메타데이터가 준비된다.
+    import app.main  # noqa: F401
+
+    while True:
+        run_once(args.batch_size)
+        if args.interval <= 0:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,27 +5,63 @@ app/main.py
 
 여기서 하는 일:
 1) FastAPI app 생성
-2) 라우터 붙이기(/auth, /documents)
+2) 라우터 붙이기(/auth, /documents, /sharing)
 3) ORM 모델 등록 + 테이블 생성
+4) 미들웨어 등록(Idempotency-Key, 응답 압축, 워커 통계, 요청 로그 등)
+
+실행:
+- 개발: uvicorn app.main:app --reload
+- 운영: python -m app  (멀티 프로세스 런처, app/__main__.py 참고)
 """
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 
-from app.db.database import engine, Base
+from app.core.artifacts import artifact_cache
+from app.core.auth_dep import get_current_admin
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.logging import RequestLoggingMiddleware, configure_logging
+from app.core.profiling import ProfilingMiddleware
+from app.core.revocation import revocation_list
+from app.core.worker_stats import WorkerStatsMiddleware, worker_stats
+from app.db.database import engine, Base, SessionLocal
+from app.db.migrate import upgrade_schema
+from app.models.user import User
 
 # ✅ 아래 import가 매우 중요!
 # Base.metadata.create_all이 "테이블 만들기"를 하려면,
 # 먼저 User/Document 모델이 import되어 Base.metadata에 등록되어 있어야 한다.
-from app.models import user, document  # noqa: F401
+from app.models import user, document, token, sharing, outbox, artifact  # noqa: F401
 
 from app.api.v1.auth import router as auth_router
 from app.api.v1.documents import router as documents_router
+from app.api.v1.events import router as events_router
+from app.api.v1.sharing import router as sharing_router
+from app.repository import artifact_repository
+from app.repository.access_repository import sync_owner_access
+
+
+# ✅ 구조화 로그: 큐 + 백그라운드 출력 스레드 시작 (app/core/logging.py)
+configure_logging()
 
 
 # ✅ 개발 편의용: 앱 시작 시 테이블 자동 생성
 # (실무에서는 Alembic 마이그레이션을 쓰는 게 정석)
 Base.metadata.create_all(bind=engine)
 
+# ✅ 기존 테이블에 새로 생긴 컬럼/인덱스 추가 (이미 맞으면 아무것도 안 함)
+# - 기존 row 백필은 별도 실행: python -m app.db.migrate --backfill
+upgrade_schema(engine)
+
+
+# ✅ 폐기 토큰 denylist를 DB에서 메모리로 올린다.
+# - 이후 요청마다 DB 조회 없이 폐기 여부를 검사할 수 있다.
+# ✅ 접근 인덱스 도입 전에 올라온 문서의 소유자 행을 채운다(이미 맞으면 0행).
+with SessionLocal() as _db:
+    revocation_list.load(_db)
+    sync_owner_access(_db)
+
 
 # ✅ FastAPI 앱 생성
 app = FastAPI(
@@ -34,9 +70,33 @@ app = FastAPI(
 )
 
 
+# ✅ Idempotency-Key: 재시도 요청은 저장된 첫 응답으로 재생
+# - 가장 안쪽(먼저 등록)에 둬서 압축 전 응답을 저장한다.
+if settings.IDEMPOTENCY_ENABLED:
+    app.add_middleware(IdempotencyMiddleware)
+
+# ✅ 응답 압축 미들웨어
+# - 설정으로 끌 수 있다(예: 앞단 Nginx가 압축을 담당하는 경우)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# ✅ 온디맨드 프로파일링 (꺼져 있으면 등록 자체를 안 함 → 오버헤드 0)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, engine=engine)
+
+# ✅ 워커별 요청 통계 (가장 바깥에 둬서 압축 시간까지 포함해 측정)
+app.add_middleware(WorkerStatsMiddleware)
+
+# ✅ request_id + 요청 로그 (가장 바깥: 안쪽 미들웨어/핸들러 로그에도 같은 request_id)
+if settings.LOG_ENABLED:
+    app.add_middleware(RequestLoggingMiddleware)
+
+
 # ✅ 라우터 등록
 app.include_router(auth_router, prefix="/auth", tags=["Auth"])
 app.include_router(documents_router, prefix="/documents", tags=["Documents"])
+app.include_router(events_router, prefix="/documents", tags=["Events"])
+app.include_router(sharing_router, prefix="/sharing", tags=["Sharing"])
 
 
 @app.get("/")
@@ -46,3 +106,29 @@ def root():
     - 서버가 살아있는지 확인하는 기본 엔드포인트
     """
     return {"message": "DocuMind API is running"}
+
+
+@app.get("/stats/worker")
+def worker_stats_view(_admin: User = Depends(get_current_admin)):
+    """
+    ✅ 이 요청을 처리한 워커 프로세스의 통계 (관리자만)
+    - 여러 번 호출하면 워커마다(pid) 다른 값이 나온다.
+    - 워커 간 requests 분포로 부하 분산/스케일링 상태를 확인한다.
+    - pid/상태 코드 분포 같은 프로세스 내부 정보라서 관리자만 본다.
+    """
+    return worker_stats.snapshot()
+
+
+@app.get("/stats/artifacts")
+def artifact_stats_view():
+    """
+    ✅ 파생 산출물 캐시 통계
+    - process: 이 워커의 히트/미스, 히트율, 아낀 바이트/계산 시간
+    - store  : DB 기준 전체 항목 수 / 압축 크기 / 원본 크기 / 누적 히트
+    """
+    with SessionLocal() as db:
+        store = artifact_repository.summary(db)
+    return {
+        "process": artifact_cache.stats.snapshot(),
+        "store": {**store, "max_bytes": artifact_cache.max_bytes},
+    }
@@ -0,0 +1,49 @@
+"""
+app/models/artifact.py
+
+파생 산출물(derived artifact) 캐시 인덱스 ORM 모델
+
+- 업로드 문서에서 계산한 결과(텍스트, 미리보기, 임베딩 등)를
+  "문서 row"가 아니라 "파일 내용 해시(sha256)" 기준으로 저장한다.
+  → 같은 파일이 여러 번(여러 사용자가) 올라와도 한 번만 계산한다.
+- 실제 결과는 압축 파일(ARTIFACT_DIR)에, 여기에는 찾기/정리용 메타데이터만 둔다.
+"""
+
+from sqlalchemy import BigInteger, Column, Float, Index, Integer, String, UniqueConstraint
+
+from app.db.database import Base
+
+
+class DerivedArtifact(Base):
+    """
+    derived_artifacts 테이블
+
+    키: (sha256, artifact_type, processor_version)
+    - processor_version: 처리 로직이 바뀌면 버전을 올려서 예전 결과를 쓰지 않게 한다.
+    """
+
+    __tablename__ = "derived_artifacts"
+    __table_args__ = (
+        UniqueConstraint(
+            "sha256", "artifact_type", "processor_version", name="uq_derived_artifacts_key"
+        ),
+        # LRU 정리: 가장 오래 안 쓴 것부터
+        Index("ix_derived_artifacts_last_accessed", "last_accessed_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), nullable=False)
+    artifact_type = Column(String(32), nullable=False)
+    processor_version = Column(String(32), nullable=False)
+
+    # 압축 파일 경로 / 압축 후 크기(디스크 상한 계산) / 원본 크기(절약량 통계)
+    file_path = Column(String, nullable=False)
+    size_bytes = Column(BigInteger, nullable=False)
+    raw_size_bytes = Column(BigInteger, nullable=False)
+
+    # 계산에 걸린 시간(ms) → 히트 때 "아낀 시간" 통계
+    compute_ms = Column(Float, nullable=False, default=0.0)
+
+    created_at = Column(Float, nullable=False)
+    last_accessed_at = Column(Float, nullable=False)
+    hits = Column(Integer, nullable=False, default=0, server_default="0")
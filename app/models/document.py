@@ -9,10 +9,17 @@ documents 테이블 ORM 모델
   (원본 파일명, 서버 저장 경로, MIME 타입, 소유자 등)
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class Document(Base):
     """
     documents 테이블에 매핑되는 ORM 모델
@@ -25,6 +32,18 @@ class Document(Base):
     # 실제 DB 테이블 이름
     __tablename__ = "documents"
 
+    # ------------------------------------------------------------
+    # 복합 인덱스
+    # ------------------------------------------------------------
+    # - (owner_id, created_at): "내 문서 최신순" 조회를 인덱스 범위 스캔 + 정렬 없이 처리
+    # - (owner_id, sha256)    : 같은 사용자 안에서 같은 내용 파일(중복) 탐지
+    # - (deleted_at)          : GC가 "유예 기간이 지난 삭제 문서"를 오래된 순으로 찾을 때
+    __table_args__ = (
+        Index("ix_documents_owner_created", "owner_id", "created_at"),
+        Index("ix_documents_owner_sha256", "owner_id", "sha256"),
+        Index("ix_documents_deleted_at", "deleted_at"),
+    )
+
     # ------------------------------------------------------------
     # 기본키(PK)
     # ------------------------------------------------------------
@@ -61,3 +80,46 @@ class Document(Base):
     # - ForeignKey("users.id") 로 users 테이블의 id와 연결
     # - 로그인 유저 기준 "내 문서 목록" 같은 기능 구현에 핵심
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    # ✅ document.owner 로 소유자 User 객체에 접근 (User.documents 의 반대편)
+    # - 목록에서 owner를 같이 쓸 때는 repository의 load_owner 옵션으로
+    #   한 번에 가져와야 한다(행마다 user 쿼리 1번씩 나가는 N+1 방지).
+    owner = relationship("User", back_populates="documents")
+
+    # ------------------------------------------------------------
+    # 폴더 (선택)
+    # ------------------------------------------------------------
+    # folder_id: 이 문서가 들어 있는 폴더(folders.id). 폴더 공유가 이 문서에도 적용된다.
+    folder_id = Column(Integer, ForeignKey("folders.id"), nullable=True, index=True)
+
+    # ------------------------------------------------------------
+    # 실제 내용으로 판별한 형식 / 페이지 수
+    # ------------------------------------------------------------
+    # detected_type: 매직 바이트로 판별한 MIME 타입 (app/core/file_sniff.py)
+    # page_count   : 업로드 스트림에서 센 페이지 수 (셀 수 없으면 NULL)
+    # - 다운스트림 처리(텍스트 추출 등) 작업량을 미리 알고 스케줄링할 때 쓴다.
+    detected_type = Column(String, nullable=True)
+    page_count = Column(Integer, nullable=True)
+
+    # ------------------------------------------------------------
+    # 크기 / 내용 해시 / 생성 시각 / 상태
+    # ------------------------------------------------------------
+    # size_bytes: 파일 크기 (용량 집계를 파일 stat 없이 하기 위함)
+    # sha256    : 파일 내용 해시 hex (중복 탐지)
+    # created_at: 업로드 시각 (최신순 정렬)
+    # status    : "ready"(정상) / "missing"(백필 때 파일이 없던 row) / "deleted"(삭제됨)
+    # - 컬럼 추가 이전에 만들어진 row는 NULL일 수 있다.
+    #   → python -m app.db.migrate --backfill 로 채운다.
+    size_bytes = Column(BigInteger, nullable=True)
+    sha256 = Column(String(64), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=True, default=_utcnow)
+    status = Column(String(16), nullable=False, default="ready", server_default="ready")
+
+    # ------------------------------------------------------------
+    # 삭제 시각 (soft delete)
+    # ------------------------------------------------------------
+    # deleted_at: DELETE /documents/{id} 시각. NULL이면 살아 있는 문서
+    # - 삭제 요청은 이 값만 채우고 바로 끝난다(파일은 그대로).
+    # - 목록/조회는 deleted_at IS NULL 만 본다.
+    # - 실제 파일과 row는 유예 기간 뒤 GC(app/jobs/gc.py)가 배치로 치운다.
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
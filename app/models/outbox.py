@@ -0,0 +1,64 @@
+"""
+app/models/outbox.py
+
+문서 이벤트 알림(Outbox / Webhook) 관련 ORM 모델
+
+- outbox_events         : 문서 이벤트 기록 (문서 변경과 "같은 트랜잭션"에서 INSERT)
+- webhook_subscriptions : 이벤트를 받을 URL + 구독자별 전달 위치(cursor)
+
+왜 outbox인가?
+- 업로드 처리 중에 바로 웹훅을 호출하면
+  (1) 외부 서버가 느리면 업로드 응답이 같이 느려지고
+  (2) DB commit은 됐는데 호출이 실패하거나, 반대로 호출은 했는데 rollback 되는
+      불일치가 생긴다.
+- 그래서 이벤트를 문서와 같은 트랜잭션에 기록만 하고,
+  전달은 별도 디스패처(app/jobs/outbox_dispatcher.py)와 SSE(/documents/events)가 한다.
+"""
+
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, Integer, String, Text
+
+from app.db.database import Base
+
+
+class OutboxEvent(Base):
+    """
+    이벤트 1건 (id가 곧 전역 순서)
+
+    - payload: JSON 문자열 (문서 메타데이터 스냅샷)
+    """
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # "이 사용자의 cursor 이후 이벤트" 조회 = 인덱스 범위 스캔
+        Index("ix_outbox_events_owner_id", "owner_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_type = Column(String(64), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    document_id = Column(Integer, nullable=True)
+    payload = Column(Text, nullable=False)
+    # epoch 초 (보관 기간 정리용)
+    created_at = Column(Float, nullable=False, index=True)
+
+
+class WebhookSubscription(Base):
+    """
+    웹훅 구독 1건
+
+    - last_event_id: 이 구독자에게 전달 완료한 마지막 이벤트 id (cursor)
+      → 실패하면 cursor를 그대로 두고 다음에 같은 이벤트부터 다시 보낸다(순서 보장).
+    - failures / next_attempt_at: 연속 실패 횟수와 다음 재시도 시각(지수 백오프)
+    - secret: 본문 HMAC 서명 키 (X-DocuMind-Signature)
+    """
+
+    __tablename__ = "webhook_subscriptions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    url = Column(String, nullable=False)
+    secret = Column(String(64), nullable=False)
+    last_event_id = Column(Integer, nullable=False, default=0, server_default="0")
+    failures = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(Float, nullable=False, default=0.0, server_default="0")
+    active = Column(Boolean, nullable=False, default=True, server_default="1")
@@ -0,0 +1,118 @@
+"""
+app/models/sharing.py
+
+공유(Sharing) / 접근 권한(ACL) 관련 ORM 모델
+
+테이블
+- folders          : 문서를 묶는 폴더 (폴더째로 공유할 수 있다)
+- user_groups      : 사용자 그룹 (팀 등)
+- group_members    : 그룹 구성원 (사용자 또는 하위 그룹 → 중첩 가능)
+- shares           : "문서/폴더 → 사용자/그룹" 공유 규칙 (원본 데이터)
+- document_access  : (user_id, document_id) 접근 인덱스 (파생 데이터)
+
+왜 document_access를 따로 두나?
+- "내가 볼 수 있는 문서"를 매번 shares + 그룹 중첩을 따라가며 조인하면
+  목록 조회가 그룹 깊이/공유 수에 비례해 느려진다.
+- 그래서 공유 규칙이 바뀔 때 영향받는 문서만 다시 계산해서
+  (user_id, document_id) 행으로 펼쳐 둔다(materialized).
+  → 조회는 PK(user_id, document_id) 인덱스 범위 스캔 1번.
+- 이 테이블은 shares/group_members에서 언제든 다시 만들 수 있다
+  (app/repository/access_repository.py 의 rebuild_access_index).
+"""
+
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer, String
+
+from app.db.database import Base
+
+
+class Folder(Base):
+    """폴더 (소유자만 문서를 넣고 뺄 수 있다)"""
+
+    __tablename__ = "folders"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+
+class Group(Base):
+    """사용자 그룹 (만든 사람이 구성원을 관리한다)"""
+
+    __tablename__ = "user_groups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+
+class GroupMember(Base):
+    """
+    그룹 구성원 1건
+
+    - user_id / member_group_id 중 정확히 하나만 채운다.
+    - member_group_id 가 있으면 "그 그룹의 구성원 전체"가 이 그룹 구성원이 된다(중첩).
+    """
+
+    __tablename__ = "group_members"
+    __table_args__ = (
+        CheckConstraint(
+            "(user_id IS NULL) <> (member_group_id IS NULL)",
+            name="ck_group_members_one_target",
+        ),
+        # 하위 그룹이 바뀌었을 때 "이 그룹을 포함하는 상위 그룹" 역추적용
+        Index("ix_group_members_member_group", "member_group_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    group_id = Column(Integer, ForeignKey("user_groups.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    member_group_id = Column(Integer, ForeignKey("user_groups.id"), nullable=True)
+
+
+class Share(Base):
+    """
+    공유 규칙 1건: (문서 또는 폴더) → (사용자 또는 그룹)
+
+    - document_id / folder_id 중 하나, user_id / group_id 중 하나를 채운다.
+    - 폴더 공유는 폴더 안의 모든 문서(나중에 들어오는 문서 포함)에 적용된다.
+    """
+
+    __tablename__ = "shares"
+    __table_args__ = (
+        CheckConstraint(
+            "(document_id IS NULL) <> (folder_id IS NULL)",
+            name="ck_shares_one_resource",
+        ),
+        CheckConstraint(
+            "(user_id IS NULL) <> (group_id IS NULL)",
+            name="ck_shares_one_grantee",
+        ),
+        Index("ix_shares_document", "document_id"),
+        Index("ix_shares_folder", "folder_id"),
+        Index("ix_shares_group", "group_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    document_id = Column(Integer, ForeignKey("documents.id"), nullable=True)
+    folder_id = Column(Integer, ForeignKey("folders.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    group_id = Column(Integer, ForeignKey("user_groups.id"), nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+
+class DocumentAccess(Base):
+    """
+    접근 인덱스 1행 = "user_id 가 document_id 를 볼 수 있다"
+
+    - PK 순서가 (user_id, document_id) 라서 "내가 볼 수 있는 문서"가 범위 스캔이다.
+    - 소유자 본인 행도 들어 있다(업로드 시 함께 기록).
+    """
+
+    __tablename__ = "document_access"
+    __table_args__ = (
+        # 문서 쪽에서 "누가 볼 수 있나" diff 계산용
+        Index("ix_document_access_document", "document_id"),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    document_id = Column(Integer, ForeignKey("documents.id"), primary_key=True)
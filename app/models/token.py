@@ -0,0 +1,69 @@
+"""
+app/models/token.py
+
+토큰 수명주기(재발급/폐기) 관련 ORM 모델
+
+- refresh_tokens : 발급한 Refresh Token 기록 (회전/재사용 탐지용)
+- revoked_tokens : 만료 전에 폐기된 Access Token의 jti 목록 (denylist)
+
+Access Token 자체는 DB에 저장하지 않는다(stateless).
+"폐기된 것"만 저장하고, 요청마다 DB를 보는 대신
+메모리(app/core/revocation.py)에 올려서 검사한다.
+"""
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+
+from app.db.database import Base
+
+
+class RefreshToken(Base):
+    """
+    refresh_tokens 테이블
+
+    - Refresh Token 1개 = row 1개 (JWT의 jti로 식별)
+    - 재발급(/auth/refresh) 때마다 기존 row는 revoked_at이 채워지고
+      replaced_by에 새 토큰 jti가 기록된다(Rotation).
+    - 이미 폐기된 refresh로 재발급을 시도하면 "탈취"로 보고
+      해당 사용자의 모든 refresh를 폐기한다.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    # JWT의 jti(고유 ID)
+    jti = Column(String, primary_key=True)
+
+    # 토큰 주인 (users.id) - 사용자 단위 일괄 폐기 시 조회하므로 인덱스
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    # 만료 시각 (청소용; 실제 만료 검증은 JWT exp로 한다)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    # 폐기 시각 (None이면 아직 유효)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+
+    # 회전으로 이 토큰을 대체한 새 refresh 토큰의 jti
+    replaced_by = Column(String, nullable=True)
+
+
+class RevokedToken(Base):
+    """
+    revoked_tokens 테이블 (Access Token denylist)
+
+    - 로그아웃 등으로 "만료 전에" 끊어야 하는 Access Token의 jti를 저장한다.
+    - id는 자동 증가라서, 다른 프로세스가 "마지막으로 본 id 이후"만
+      가져가는 증분 동기화에 쓴다.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True)
+
+    jti = Column(String, unique=True, nullable=False)
+
+    # JWT exp와 같은 형식(UNIX epoch 초). 이 시각이 지나면 어차피 토큰이 만료되므로
+    # denylist에서 지워도 된다.
+    expires_at = Column(Integer, nullable=False, index=True)
+
+    # 추가 시각(epoch 초). 증분 동기화가 "아직 commit 전일 수 있는 최근 row"에서
+    # cursor를 멈추는 데 쓴다. (이 컬럼이 생기기 전 row는 NULL = 오래된 것으로 본다)
+    created_at = Column(Float, nullable=True)
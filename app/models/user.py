@@ -11,7 +11,8 @@ app/models/user.py
 - 비밀번호는 절대 평문 저장 금지 → 해시(hashed)로만 저장
 """
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import BigInteger, Boolean, Column, Integer, String
+from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 
@@ -44,3 +45,38 @@ class User(Base):
     # - 회원가입 시: 평문 → 해싱 → 저장
     # - 로그인 시: 평문 입력 → 해시 비교(verify)
     hashed_password = Column(String, nullable=False)
+
+    # ------------------------------------------------------------
+    # catalog_version
+    # ------------------------------------------------------------
+    # ✅ "내 문서 목록"이 바뀔 때마다 1씩 증가하는 버전 번호
+    # - create_document 등 문서 변경 작업이 같은 트랜잭션 안에서 올린다.
+    # - /documents/me 는 이 값으로 ETag를 만들어서
+    #   변경이 없으면 문서 쿼리 없이 304 Not Modified를 돌려준다.
+    # - get_current_user가 User를 이미 읽어오므로 추가 쿼리 비용이 없다.
+    catalog_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # ------------------------------------------------------------
+    # 사용량 카운터 (쿼터)
+    # ------------------------------------------------------------
+    # ✅ 업로드/삭제 때 같은 트랜잭션에서 증분으로 갱신한다.
+    # - 사용량 조회가 O(1): 파일 stat/문서 집계가 필요 없다.
+    # - 어긋나면 주기 작업(app/jobs/reconcile_usage.py)이 바로잡는다.
+    storage_bytes_used = Column(BigInteger, nullable=False, default=0, server_default="0")
+    document_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # ------------------------------------------------------------
+    # is_admin
+    # ------------------------------------------------------------
+    # ✅ 관리자 여부 (관리자 전용 API: GET /documents 등)
+    # - 가입으로는 True가 되지 않는다. 이미 있는 계정을 운영자가 CLI로 지정한다.
+    #   python -m app.jobs.admins grant admin@example.com
+    is_admin = Column(Boolean, nullable=False, default=False, server_default="0")
+
+    # ------------------------------------------------------------
+    # 관계(relationship)
+    # ------------------------------------------------------------
+    # ✅ user.documents 로 이 사용자의 문서 목록에 접근
+    # - 기본은 lazy 로딩. 여러 사용자를 한 번에 다룰 때는 repository에서
+    #   selectinload/joinedload 옵션을 명시해서 N+1 쿼리를 막는다.
+    documents = relationship("Document", back_populates="owner")
@@ -0,0 +1,320 @@
+"""
+app/repository/access_repository.py
+
+문서 접근 인덱스(document_access) Repository
+
+역할
+- shares / group_members(원본 규칙)로부터 "누가 어떤 문서를 볼 수 있나"를 계산해서
+  document_access (user_id, document_id) 행으로 유지한다.
+- 갱신은 "영향받는 문서만" 다시 계산하고, 기존 행과 diff 해서
+  추가/삭제할 행만 INSERT/DELETE 한다. (commit은 호출자가 한다)
+- 조회(get_accessible_documents)는 ACL 조인 없이 인덱스 범위 스캔 1번이다.
+
+접근 규칙(문서 d 기준)
+- d의 소유자
+- d에 직접 공유된 사용자 / 그룹 구성원
+- d가 들어 있는 폴더에 공유된 사용자 / 그룹 구성원
+- 그룹 구성원은 하위 그룹을 끝까지 펼친다(중첩, 순환이 있어도 안전)
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import and_, exists, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.sharing import DocumentAccess, GroupMember, Share
+
+
+# ------------------------------------------------------------
+# 그룹 그래프 탐색
+# ------------------------------------------------------------
+
+
+def expand_groups(db: Session, group_ids: Iterable[int]) -> Dict[int, Set[int]]:
+    """
+    그룹별 "최종 구성원(사용자)" 집합을 구한다.
+
+    - 하위 그룹을 단계별로 한 번에(IN) 읽는다 → 쿼리 수 = 중첩 깊이
+    - 순환(A ⊃ B ⊃ A)이 있어도 방문 체크로 끝난다.
+
+    Returns:
+        {group_id: {user_id, ...}}  (요청한 그룹만)
+    """
+    roots = set(group_ids)
+    direct_users: Dict[int, Set[int]] = defaultdict(set)
+    children: Dict[int, Set[int]] = defaultdict(set)
+
+    # 1) 도달 가능한 그룹의 직접 구성원/하위 그룹을 BFS로 모은다.
+    seen: Set[int] = set()
+    frontier = set(roots)
+    while frontier:
+        seen |= frontier
+        rows = (
+            db.query(GroupMember.group_id, GroupMember.user_id, GroupMember.member_group_id)
+            .filter(GroupMember.group_id.in_(frontier))
+            .all()
+        )
+        frontier = set()
+        for group_id, user_id, member_group_id in rows:
+            if user_id is not None:
+                direct_users[group_id].add(user_id)
+            else:
+                children[group_id].add(member_group_id)
+                if member_group_id not in seen:
+                    frontier.add(member_group_id)
+
+    # 2) 메모리에서 그룹별로 펼친다.
+    result: Dict[int, Set[int]] = {}
+    for root in roots:
+        users: Set[int] = set()
+        stack, visited = [root], {root}
+        while stack:
+            group_id = stack.pop()
+            users |= direct_users[group_id]
+            for child in children[group_id] - visited:
+                visited.add(child)
+                stack.append(child)
+        result[root] = users
+    return result
+
+
+def ancestor_groups(db: Session, group_ids: Iterable[int]) -> Set[int]:
+    """
+    주어진 그룹과, 그 그룹을 (직접/간접) 구성원으로 포함하는 모든 상위 그룹.
+
+    - 그룹 구성원이 바뀌면 이 그룹들에 걸린 공유가 전부 영향을 받는다.
+    """
+    result = set(group_ids)
+    frontier = set(result)
+    while frontier:
+        parents = {
+            row.group_id
+            for row in db.query(GroupMember.group_id)
+            .filter(GroupMember.member_group_id.in_(frontier))
+            .all()
+        }
+        frontier = parents - result
+        result |= frontier
+    return result
+
+
+# ------------------------------------------------------------
+# 접근 집합 계산 + 증분 반영
+# ------------------------------------------------------------
+
+
+def compute_access(db: Session, document_ids: Iterable[int]) -> Dict[int, Set[int]]:
+    """
+    문서별로 접근 가능한 사용자 집합을 원본 규칙에서 계산한다. (DB에 쓰지 않음)
+
+    Returns:
+        {document_id: {user_id, ...}}  (존재하지 않거나 삭제된 문서는 빠진다)
+    """
+    ids = set(document_ids)
+    if not ids:
+        return {}
+
+    docs = (
+        db.query(Document.id, Document.owner_id, Document.folder_id)
+        .filter(Document.id.in_(ids), Document.deleted_at.is_(None))
+        .all()
+    )
+    access: Dict[int, Set[int]] = {doc.id: {doc.owner_id} for doc in docs}
+    docs_by_folder: Dict[int, List[int]] = defaultdict(list)
+    for doc in docs:
+        if doc.folder_id is not None:
+            docs_by_folder[doc.folder_id].append(doc.id)
+
+    conditions = [Share.document_id.in_(access.keys())]
+    if docs_by_folder:
+        conditions.append(Share.folder_id.in_(docs_by_folder.keys()))
+    shares = db.query(Share).filter(or_(*conditions)).all()
+
+    members = expand_groups(db, {s.group_id for s in shares if s.group_id is not None})
+
+    for share in shares:
+        grantees = {share.user_id} if share.user_id is not None else members[share.group_id]
+        targets = (
+            [share.document_id] if share.document_id is not None
+            else docs_by_folder[share.folder_id]
+        )
+        for document_id in targets:
+            if document_id in access:
+                access[document_id] |= grantees
+    return access
+
+
+def refresh_documents(db: Session, document_ids: Iterable[int]) -> Tuple[int, int]:
+    """
+    ✅ 문서들의 접근 인덱스를 다시 계산해서 바뀐 행만 반영한다. (commit은 호출자가 한다)
+
+    - 공유 추가/삭제, 폴더 이동, 그룹 구성원 변경 뒤에 "영향받는 문서"로 호출한다.
+    - 인덱스 전체를 다시 만들지 않는다.
+
+    Returns:
+        (추가한 행 수, 삭제한 행 수)
+    """
+    ids = set(document_ids)
+    if not ids:
+        return 0, 0
+
+    wanted = {
+        (user_id, document_id)
+        for document_id, users in compute_access(db, ids).items()
+        for user_id in users
+    }
+    current = {
+        (row.user_id, row.document_id)
+        for row in db.query(DocumentAccess.user_id, DocumentAccess.document_id)
+        .filter(DocumentAccess.document_id.in_(ids))
+        .all()
+    }
+
+    to_add = wanted - current
+    to_remove = current - wanted
+    if to_add:
+        db.bulk_insert_mappings(
+            DocumentAccess,
+            [{"user_id": u, "document_id": d} for u, d in to_add],
+        )
+    if to_remove:
+        db.query(DocumentAccess).filter(
+            tuple_(DocumentAccess.user_id, DocumentAccess.document_id).in_(to_remove)
+        ).delete(synchronize_session=False)
+    return len(to_add), len(to_remove)
+
+
+def documents_for_folders(db: Session, folder_ids: Iterable[int]) -> Set[int]:
+    """폴더들에 들어 있는 문서 id"""
+    ids = set(folder_ids)
+    if not ids:
+        return set()
+    return {
+        row.id
+        for row in db.query(Document.id)
+        .filter(Document.folder_id.in_(ids), Document.deleted_at.is_(None))
+        .all()
+    }
+
+
+def documents_for_groups(db: Session, group_ids: Iterable[int]) -> Set[int]:
+    """
+    그룹(및 그 상위 그룹)에 걸린 공유가 닿는 문서 id
+
+    - 그룹 구성원이 바뀌었을 때 다시 계산할 문서 범위
+    """
+    groups = ancestor_groups(db, group_ids)
+    shares = (
+        db.query(Share.document_id, Share.folder_id)
+        .filter(Share.group_id.in_(groups))
+        .all()
+    )
+    documents = {s.document_id for s in shares if s.document_id is not None}
+    documents |= documents_for_folders(
+        db, {s.folder_id for s in shares if s.folder_id is not None}
+    )
+    return documents
+
+
+def grant_owner(db: Session, user_id: int, document_id: int) -> None:
+    """업로드 직후 소유자 행 추가 (새 문서는 아직 공유가 없으므로 이것으로 충분)"""
+    db.add(DocumentAccess(user_id=user_id, document_id=document_id))
+
+
+def remove_documents(db: Session, document_ids: Iterable[int]) -> None:
+    """
+    삭제된 문서의 접근 인덱스 행과 문서 단위 공유 규칙을 지운다. (commit은 호출자가 한다)
+
+    - 폴더 공유는 폴더에 걸린 규칙이므로 그대로 둔다(삭제 문서는 compute_access에서 빠진다).
+    """
+    ids = list(set(document_ids))
+    if not ids:
+        return
+    db.query(DocumentAccess).filter(DocumentAccess.document_id.in_(ids)).delete(
+        synchronize_session=False
+    )
+    db.query(Share).filter(Share.document_id.in_(ids)).delete(synchronize_session=False)
+
+
+def sync_owner_access(db: Session) -> int:
+    """
+    소유자 행이 빠진 문서(접근 인덱스 도입 전에 올라온 문서)를 채운다.
+
+    - INSERT ... SELECT ... WHERE NOT EXISTS 한 문장으로 처리한다.
+    - 앱 시작 시 호출된다. 이미 맞으면 0행.
+    """
+    missing = select(Document.owner_id, Document.id).where(
+        Document.deleted_at.is_(None),
+        ~exists().where(
+            and_(
+                DocumentAccess.user_id == Document.owner_id,
+                DocumentAccess.document_id == Document.id,
+            )
+        )
+    )
+    result = db.execute(
+        DocumentAccess.__table__.insert().from_select(["user_id", "document_id"], missing)
+    )
+    db.commit()
+    return result.rowcount or 0
+
+
+def rebuild_access_index(db: Session, batch_size: int = 500) -> Tuple[int, int]:
+    """
+    접근 인덱스를 원본 규칙에서 전부 다시 계산한다. (점검/복구용)
+
+    - 문서 id 순서로 batch_size개씩 refresh_documents → 배치마다 commit
+
+    Returns:
+        (추가한 행 수, 삭제한 행 수) 합계
+    """
+    added = removed = 0
+    last_id = 0
+    while True:
+        ids = [
+            row.id
+            for row in db.query(Document.id)
+            .filter(Document.id > last_id)
+            .order_by(Document.id)
+            .limit(batch_size)
+            .all()
+        ]
+        if not ids:
+            break
+        a, r = refresh_documents(db, ids)
+        db.commit()
+        added, removed, last_id = added + a, removed + r, ids[-1]
+    return added, removed
+
+
+# ------------------------------------------------------------
+# 조회
+# ------------------------------------------------------------
+
+
+def can_access(db: Session, user_id: int, document_id: int) -> bool:
+    """PK 조회 1번"""
+    return db.get(DocumentAccess, (user_id, document_id)) is not None
+
+
+def get_accessible_documents(
+    db: Session, user_id: int, *, limit: int = 100, offset: int = 0
+) -> List[Document]:
+    """
+    ✅ 내가 볼 수 있는 문서(내 문서 + 공유받은 문서) 목록
+
+    - document_access PK(user_id, document_id) 범위 스캔 → documents PK 조인
+    - 그룹 중첩 깊이/공유 규칙 수와 상관없이 같은 쿼리 1번
+    - 정렬: 문서 id 역순(최근 업로드 순, 인덱스 순서 그대로)
+    """
+    return (
+        db.query(Document)
+        .join(DocumentAccess, DocumentAccess.document_id == Document.id)
+        .filter(DocumentAccess.user_id == user_id)
+        .order_by(DocumentAccess.document_id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
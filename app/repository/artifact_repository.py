@@ -0,0 +1,140 @@
+"""
+app/repository/artifact_repository.py
+
+파생 산출물 캐시 인덱스(derived_artifacts) Repository
+
+- 파일 읽기/쓰기/압축은 app/core/artifacts.py 가 하고, 여기는 DB만 다룬다.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, exists, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.artifact import DerivedArtifact
+from app.models.document import Document
+
+
+def get_artifact(
+    db: Session, sha256: str, artifact_type: str, processor_version: str
+) -> Optional[DerivedArtifact]:
+    """유니크 키 조회 1번"""
+    return (
+        db.query(DerivedArtifact)
+        .filter(
+            DerivedArtifact.sha256 == sha256,
+            DerivedArtifact.artifact_type == artifact_type,
+            DerivedArtifact.processor_version == processor_version,
+        )
+        .first()
+    )
+
+
+def touch_artifact(db: Session, artifact_id: int, now: float) -> None:
+    """히트 기록: 마지막 사용 시각 갱신 + hits + 1 (DB에서 계산, commit 포함)"""
+    db.query(DerivedArtifact).filter(DerivedArtifact.id == artifact_id).update(
+        {
+            DerivedArtifact.last_accessed_at: now,
+            DerivedArtifact.hits: DerivedArtifact.hits + 1,
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def add_artifact(db: Session, artifact: DerivedArtifact) -> bool:
+    """
+    인덱스 추가 (commit 포함)
+
+    Returns:
+        False = 같은 키가 이미 있다(다른 요청/워커가 먼저 저장)
+                경로가 키로 정해지고 내용도 같으므로 호출자는 파일을 그대로 둔다
+                (지우면 먼저 저장한 쪽의 인덱스가 없는 파일을 가리키게 된다)
+    """
+    db.add(artifact)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+    return True
+
+
+def delete_artifact(db: Session, artifact: DerivedArtifact) -> None:
+    db.delete(artifact)
+    db.commit()
+
+
+def total_size(db: Session) -> int:
+    return db.query(func.coalesce(func.sum(DerivedArtifact.size_bytes), 0)).scalar()
+
+
+def least_recently_used(db: Session, limit: int = 100) -> List[DerivedArtifact]:
+    return (
+        db.query(DerivedArtifact)
+        .order_by(DerivedArtifact.last_accessed_at, DerivedArtifact.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def _no_live_document():
+    """같은 내용(sha256)의 살아 있는 문서가 없다 (NOT EXISTS)"""
+    return ~exists().where(
+        and_(Document.sha256 == DerivedArtifact.sha256, Document.deleted_at.is_(None))
+    )
+
+
+def orphaned_artifacts(
+    db: Session, sha256s: Iterable[str], idle_before: float
+) -> List[DerivedArtifact]:
+    """
+    주어진 내용 해시 중 살아 있는 문서가 하나도 없고, idle_before 이후 쓰인 적 없는 산출물
+
+    - GC 후보 조회용. 실제 삭제는 delete_if_orphaned 가 조건을 다시 확인하면서 한다.
+    """
+    shas = list(set(sha256s))
+    if not shas:
+        return []
+    return (
+        db.query(DerivedArtifact)
+        .filter(
+            DerivedArtifact.sha256.in_(shas),
+            DerivedArtifact.last_accessed_at <= idle_before,
+            _no_live_document(),
+        )
+        .all()
+    )
+
+
+def delete_if_orphaned(db: Session, artifact_id: int, idle_before: float) -> bool:
+    """
+    ✅ 아직도 고아인 경우에만 인덱스 행을 지운다. (DELETE ... WHERE NOT EXISTS, commit 포함)
+
+    - 후보를 고른 뒤 같은 내용이 다시 업로드됐으면(살아 있는 문서가 생겼으면)
+      조건이 거짓이 되어 0행 → 호출자는 파일을 지우지 않는다.
+    - 확인과 삭제가 한 문장이라 그 사이에 끼어들 틈이 없다.
+    """
+    deleted = (
+        db.query(DerivedArtifact)
+        .filter(
+            DerivedArtifact.id == artifact_id,
+            DerivedArtifact.last_accessed_at <= idle_before,
+            _no_live_document(),
+        )
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted == 1
+
+
+def summary(db: Session) -> Dict[str, int]:
+    """저장된 항목 수 / 압축 크기 / 원본 크기 / 누적 히트"""
+    entries, size, raw, hits = db.query(
+        func.count(DerivedArtifact.id),
+        func.coalesce(func.sum(DerivedArtifact.size_bytes), 0),
+        func.coalesce(func.sum(DerivedArtifact.raw_size_bytes), 0),
+        func.coalesce(func.sum(DerivedArtifact.hits), 0),
+    ).one()
+    return {"entries": entries, "bytes": size, "raw_bytes": raw, "hits": hits}
@@ -9,10 +9,33 @@ Document 관련 DB 작업을 담당하는 Repository 모듈
   (예: 파일 저장, 권한 체크, 요청/응답 포맷 등은 다른 레이어에서 처리)
 """
 
-from typing import List
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.core.config import settings
 
 from app.models.document import Document
+from app.models.user import User
+from app.repository import access_repository, outbox_repository, usage_repository
+
+
+def bump_catalog_version(db: Session, owner_id: int) -> None:
+    """
+    소유자의 문서 카탈로그 버전을 1 올린다. (UPDATE, commit은 호출자가 한다)
+
+    - 문서를 추가/수정/삭제하는 모든 함수는 같은 트랜잭션 안에서 이걸 호출해야 한다.
+    - 그래야 /documents/me 의 ETag가 바뀌어서 클라이언트가 새 목록을 받는다.
+    - "catalog_version = catalog_version + 1" 을 DB에서 계산하므로
+      동시에 여러 요청이 와도 증가분이 유실되지 않는다.
+    """
+    db.query(User).filter(User.id == owner_id).update(
+        {User.catalog_version: User.catalog_version + 1},
+        synchronize_session=False,
+    )
 
 
 def create_document(
@@ -22,6 +45,10 @@ def create_document(
     file_path: str,
     content_type: str,
     owner_id: int,
+    detected_type: Optional[str] = None,
+    page_count: Optional[int] = None,
+    size_bytes: Optional[int] = None,
+    sha256: Optional[str] = None,
 ) -> Document:
     """
     문서 메타데이터를 DB에 저장한다. (INSERT)
@@ -32,10 +59,17 @@ def create_document(
         file_path: 서버에 저장된 상대 경로 (예: "uploads/uuid.pdf")
         content_type: MIME 타입 (예: "application/pdf")
         owner_id: 소유자 users.id (외래키)
+        detected_type: 매직 바이트로 판별한 MIME 타입
+        page_count: 페이지 수 (모르면 None)
+        size_bytes: 파일 크기(바이트)
+        sha256: 파일 내용 SHA-256 (hex)
 
     Returns:
         저장된 Document ORM 객체
         - commit 이후 생성된 id 등이 반영된 상태로 반환됨
+
+    Raises:
+        QuotaExceededError: 쿼터 초과 (이 경우 rollback 되어 아무것도 저장되지 않음)
     """
 
     # 1) ORM 객체 생성 (아직 DB에 INSERT 된 상태는 아님)
@@ -44,13 +78,37 @@ def create_document(
         file_path=file_path,
         content_type=content_type,
         owner_id=owner_id,
+        detected_type=detected_type,
+        page_count=page_count,
+        size_bytes=size_bytes,
+        sha256=sha256,
     )
 
     # 2) 세션에 추가 → commit 시점에 INSERT가 실제 실행됨
     db.add(db_document)
+
+    # 3) 같은 트랜잭션에서 사용량 카운터 증가(쿼터 검사 포함)
+    #    + 카탈로그 버전 증가(목록 캐시/ETag 무효화)
+    #    + 접근 인덱스에 소유자 행 추가(/documents/accessible)
+    #    + outbox 이벤트 기록(웹훅/SSE 알림) → 문서와 이벤트가 함께 commit/rollback
+    try:
+        usage_repository.add_usage(db, owner_id, size_bytes or 0)
+    except usage_repository.QuotaExceededError:
+        db.rollback()
+        raise
+    bump_catalog_version(db, owner_id)
+    db.flush()   # document id 확정
+    access_repository.grant_owner(db, owner_id, db_document.id)
+    outbox_repository.add_event(
+        db,
+        outbox_repository.DOCUMENT_CREATED,
+        owner_id=owner_id,
+        document_id=db_document.id,
+        payload=outbox_repository.document_payload(db_document),
+    )
     db.commit()
 
-    # 3) DB에서 생성된 값(자동 증가 id 등)을 객체에 다시 채움
+    # 4) DB에서 생성된 값(자동 증가 id 등)을 객체에 다시 채움
     # - commit 후 refresh를 하면 최신 상태가 보장됨
     db.refresh(db_document)
 
@@ -66,8 +124,209 @@ def get_documents_by_owner(db: Session, owner_id: int) -> List[Document]:
         owner_id: 조회할 사용자 ID (users.id)
 
     Returns:
-        해당 사용자가 소유한 Document 리스트
+        해당 사용자가 소유한 Document 리스트 (최신 업로드 순)
+    """
+
+    # owner_id가 일치하는 (삭제되지 않은) 문서만 최신순으로 조회
+    # - (owner_id, created_at) 인덱스를 타므로 정렬을 위한 별도 작업이 없다.
+    return (
+        db.query(Document)
+        .filter(Document.owner_id == owner_id, Document.deleted_at.is_(None))
+        .order_by(Document.created_at.desc(), Document.id.desc())
+        .all()
+    )
+
+
+def get_document(db: Session, document_id: int, *, include_deleted: bool = False) -> Document | None:
+    """문서 1건 조회 (PK). 삭제된 문서는 include_deleted=True일 때만"""
+    document = db.get(Document, document_id)
+    if document is not None and document.deleted_at is not None and not include_deleted:
+        return None
+    return document
+
+
+def get_document_by_sha256(db: Session, owner_id: int, sha256: str) -> Document | None:
+    """
+    같은 사용자가 같은 내용(SHA-256)의 문서를 이미 올렸는지 조회한다. (중복 탐지)
+
+    - (owner_id, sha256) 인덱스로 찾으므로 파일을 읽거나 테이블을 훑지 않는다.
+    """
+    return (
+        db.query(Document)
+        .filter(
+            Document.owner_id == owner_id,
+            Document.sha256 == sha256,
+            Document.deleted_at.is_(None),
+        )
+        .first()
+    )
+
+
+def _owner_loader(strategy: Optional[str]) -> Optional[LoaderOption]:
+    """
+    Document.owner 로딩 옵션을 만든다.
+
+    - "joined"  : documents JOIN users 로 한 번에
+    - "selectin": documents 조회 후 users WHERE id IN (...) 한 번 더
+    - None/"none": owner를 미리 읽지 않음(접근하면 lazy 쿼리 발생)
+    """
+    if strategy == "joined":
+        return joinedload(Document.owner)
+    if strategy == "selectin":
+        return selectinload(Document.owner)
+    if strategy in (None, "none"):
+        return None
+    raise ValueError(f"Unknown owner load strategy: {strategy}")
+
+
+def get_documents_for_owners(
+    db: Session,
+    owner_ids: Iterable[int],
+    *,
+    load_owner: Optional[str] = None,
+) -> List[Document]:
+    """
+    여러 사용자의 문서를 한 번의 쿼리로 조회한다. (WHERE owner_id IN (...))
+
+    Args:
+        db: SQLAlchemy Session
+        owner_ids: 조회할 사용자 ID 목록
+        load_owner: owner(User) 함께 로딩 방식 ("joined" / "selectin" / None)
+
+    Returns:
+        Document 리스트 (owner_id, 최신순)
+    """
+    ids = list(set(owner_ids))
+    if not ids:
+        return []
+
+    query = db.query(Document).filter(Document.owner_id.in_(ids), Document.deleted_at.is_(None))
+    option = _owner_loader(load_owner)
+    if option is not None:
+        query = query.options(option)
+    return query.order_by(
+        Document.owner_id, Document.created_at.desc(), Document.id.desc()
+    ).all()
+
+
+def list_documents(
+    db: Session,
+    *,
+    owner_ids: Optional[Iterable[int]] = None,
+    limit: int = 100,
+    offset: int = 0,
+    load_owner: Optional[str] = None,
+) -> List[Document]:
     """
+    전체(관리자용) 문서 목록을 페이지 단위로 조회한다.
+
+    - owner가 필요한 화면이므로 기본으로 settings.DOCUMENT_OWNER_LOAD_STRATEGY 방식으로
+      owner를 함께 읽는다 → 문서 개수와 상관없이 쿼리 수가 고정된다(1~2번).
+
+    Args:
+        owner_ids: 특정 사용자들로 제한 (None이면 전체)
+        limit/offset: 페이지
+        load_owner: owner 로딩 방식 (None이면 설정값)
+    """
+    query = db.query(Document).filter(Document.deleted_at.is_(None))
+    if owner_ids is not None:
+        query = query.filter(Document.owner_id.in_(list(set(owner_ids))))
+
+    option = _owner_loader(load_owner or settings.DOCUMENT_OWNER_LOAD_STRATEGY)
+    if option is not None:
+        query = query.options(option)
+
+    return (
+        query.order_by(Document.created_at.desc(), Document.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+
+
+def soft_delete_documents(db: Session, owner_id: int, document_ids: Iterable[int]) -> List[int]:
+    """
+    ✅ 내 문서들을 삭제 표시한다. (UPDATE, commit 포함)
+
+    - 파일은 건드리지 않는다 → 파일 크기와 상관없이 바로 끝난다.
+      실제 파일/row 정리는 GC(app/jobs/gc.py)가 유예 기간 뒤에 배치로 한다.
+    - 한 트랜잭션 안에서:
+      1) deleted_at/status 설정 (내 것이면서 아직 살아 있는 문서만)
+      2) 사용량 카운터 감소 → 쿼터가 바로 돌아온다
+      3) 카탈로그 버전 증가 → /documents/me ETag가 바뀐다
+      4) 접근 인덱스/공유 규칙 제거 → 공유받은 사람 목록에서도 사라진다
+      5) document.deleted 이벤트 기록
+
+    Returns:
+        실제로 삭제 표시한 문서 id (없거나/남의 것이거나/이미 삭제된 id는 빠진다)
+    """
+    ids = set(document_ids)
+    if not ids:
+        return []
+
+    documents = (
+        db.query(Document)
+        .filter(
+            Document.id.in_(ids),
+            Document.owner_id == owner_id,
+            Document.deleted_at.is_(None),
+        )
+        .order_by(Document.id)
+        .all()
+    )
+    if not documents:
+        return []
+
+    now = datetime.now(timezone.utc)
+    for document in documents:
+        document.deleted_at = now
+        document.status = "deleted"
+
+    deleted_ids = [document.id for document in documents]
+    usage_repository.remove_usage(
+        db,
+        owner_id,
+        sum(document.size_bytes or 0 for document in documents),
+        documents=len(documents),
+    )
+    bump_catalog_version(db, owner_id)
+    access_repository.remove_documents(db, deleted_ids)
+    for document in documents:
+        outbox_repository.add_event(
+            db,
+            outbox_repository.DOCUMENT_DELETED,
+            owner_id=owner_id,
+            document_id=document.id,
+            payload={"id": document.id, "filename": document.filename},
+        )
+    db.commit()
+    return deleted_ids
+
+
+def get_expired_deleted_documents(db: Session, before: datetime, limit: int) -> List[Document]:
+    """
+    삭제된 지 유예 기간이 지난 문서 (GC 대상, 오래된 삭제부터)
+
+    - (deleted_at) 인덱스 범위 스캔
+    """
+    return (
+        db.query(Document)
+        .filter(Document.deleted_at.isnot(None), Document.deleted_at <= before)
+        .order_by(Document.deleted_at, Document.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def count_file_references(db: Session, file_path: str, *, exclude_id: int) -> int:
+    """같은 파일 경로를 쓰는 다른 row 수 (0이어야 파일을 지울 수 있다)"""
+    return (
+        db.query(func.count(Document.id))
+        .filter(Document.file_path == file_path, Document.id != exclude_id)
+        .scalar()
+    )
+
 
-    # owner_id가 일치하는 문서만 필터링해서 전부 조회
-    return db.query(Document).filter(Document.owner_id == owner_id).all()
+def purge_document(db: Session, document: Document) -> None:
+    """삭제 표시된 문서 row를 실제로 지운다. (GC가 파일을 치운 뒤 호출, commit은 호출자가 한다)"""
+    db.delete(document)
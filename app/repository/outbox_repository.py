@@ -0,0 +1,213 @@
+"""
+app/repository/outbox_repository.py
+
+Outbox 이벤트 / 웹훅 구독 Repository
+
+역할
+- add_event: 문서 변경 트랜잭션 안에서 이벤트 INSERT (commit은 호출자)
+- 구독자별 cursor 이후 이벤트 조회(배치), 전달 성공/실패 기록
+"""
+
+import json
+import secrets
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.document import Document
+from app.models.outbox import OutboxEvent, WebhookSubscription
+
+DOCUMENT_CREATED = "document.created"
+DOCUMENT_DELETED = "document.deleted"
+
+
+def document_payload(document: Document) -> Dict[str, Any]:
+    """이벤트에 담을 문서 메타데이터 (파일 경로 같은 내부 정보는 제외)"""
+    return {
+        "id": document.id,
+        "filename": document.filename,
+        "content_type": document.content_type,
+        "size_bytes": document.size_bytes,
+        "sha256": document.sha256,
+        "page_count": document.page_count,
+        "created_at": document.created_at.isoformat() if document.created_at else None,
+    }
+
+
+def add_event(
+    db: Session,
+    event_type: str,
+    *,
+    owner_id: int,
+    document_id: Optional[int] = None,
+    payload: Optional[Dict[str, Any]] = None,
+) -> OutboxEvent:
+    """
+    이벤트를 기록한다. (commit은 호출자가 한다)
+
+    - 문서 변경과 같은 트랜잭션에서 호출해야 "저장됐는데 알림이 없다/알림은 갔는데
+      저장이 안 됐다" 같은 불일치가 생기지 않는다.
+    """
+    event = OutboxEvent(
+        event_type=event_type,
+        owner_id=owner_id,
+        document_id=document_id,
+        payload=json.dumps(payload or {}, separators=(",", ":")),
+        created_at=time.time(),
+    )
+    db.add(event)
+    return event
+
+
+def get_events_after(
+    db: Session,
+    owner_id: int,
+    after_id: int,
+    limit: int = 100,
+    *,
+    visible_before: Optional[float] = None,
+) -> List[OutboxEvent]:
+    """
+    cursor(after_id) 이후 이벤트를 id 순서로 최대 limit개
+
+    - visible_before: 이 시각 이후에 만들어진 이벤트에서 멈춘다(그 앞까지만 반환).
+      id는 INSERT 때 정해지고 commit은 나중이라, 방금 만든 이벤트보다 작은 id가
+      아직 commit 전일 수 있다. cursor는 id로만 전진하므로 그런 id를 건너뛰지 않도록
+      OUTBOX_CURSOR_LAG_SECONDS 만큼 지난 이벤트까지만 내보낸다.
+      (문서 변경 트랜잭션이 이 시간 안에 commit된다는 전제. SQLite는 쓰기가 직렬화된다)
+    """
+    events = (
+        db.query(OutboxEvent)
+        .filter(OutboxEvent.owner_id == owner_id, OutboxEvent.id > after_id)
+        .order_by(OutboxEvent.id)
+        .limit(limit)
+        .all()
+    )
+    if visible_before is None:
+        return events
+    for index, event in enumerate(events):
+        if event.created_at > visible_before:
+            return events[:index]
+    return events
+
+
+def get_last_event_id(
+    db: Session, owner_id: int, *, visible_before: Optional[float] = None
+) -> int:
+    """
+    지금 시점의 cursor. visible_before를 주면 그 전에 만들어진 이벤트까지만 본다
+    (최근 이벤트 일부를 한 번 더 받을 수는 있어도 건너뛰지는 않는다).
+    """
+    query = db.query(func.max(OutboxEvent.id)).filter(OutboxEvent.owner_id == owner_id)
+    if visible_before is not None:
+        query = query.filter(OutboxEvent.created_at <= visible_before)
+    return query.scalar() or 0
+
+
+def visible_before(now: Optional[float] = None) -> float:
+    """cursor가 읽어도 되는 이벤트의 기준 시각 (now - OUTBOX_CURSOR_LAG_SECONDS)"""
+    return (time.time() if now is None else now) - settings.OUTBOX_CURSOR_LAG_SECONDS
+
+
+def purge_events(db: Session, older_than: float) -> int:
+    """보관 기간이 지난 이벤트 삭제 (commit 포함)"""
+    deleted = (
+        db.query(OutboxEvent)
+        .filter(OutboxEvent.created_at < older_than)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+# ------------------------------------------------------------
+# 웹훅 구독
+# ------------------------------------------------------------
+
+
+def create_subscription(db: Session, *, owner_id: int, url: str) -> WebhookSubscription:
+    """
+    구독 추가. 구독 시점 이후의 이벤트부터 전달한다(과거 이벤트는 보내지 않음).
+    - 아직 commit 전일 수 있는 최근 이벤트는 cursor에 넣지 않는다(get_last_event_id).
+    """
+    subscription = WebhookSubscription(
+        owner_id=owner_id,
+        url=url,
+        secret=secrets.token_hex(32),
+        last_event_id=get_last_event_id(db, owner_id, visible_before=visible_before()),
+    )
+    db.add(subscription)
+    db.commit()
+    db.refresh(subscription)
+    return subscription
+
+
+def get_subscription(db: Session, subscription_id: int) -> Optional[WebhookSubscription]:
+    return db.get(WebhookSubscription, subscription_id)
+
+
+def get_subscriptions_by_owner(db: Session, owner_id: int) -> List[WebhookSubscription]:
+    return (
+        db.query(WebhookSubscription)
+        .filter(WebhookSubscription.owner_id == owner_id)
+        .order_by(WebhookSubscription.id)
+        .all()
+    )
+
+
+def delete_subscription(db: Session, subscription: WebhookSubscription) -> None:
+    db.delete(subscription)
+    db.commit()
+
+
+def get_due_subscriptions(db: Session, now: float, limit: int = 100) -> List[WebhookSubscription]:
+    """
+    지금 보낼 차례인 구독 (활성 + 백오프 시각 지남 + 아직 안 보낸 이벤트가 있음)
+    """
+    pending = (
+        db.query(OutboxEvent.id)
+        .filter(
+            OutboxEvent.owner_id == WebhookSubscription.owner_id,
+            OutboxEvent.id > WebhookSubscription.last_event_id,
+        )
+        .exists()
+    )
+    return (
+        db.query(WebhookSubscription)
+        .filter(
+            WebhookSubscription.active.is_(True),
+            WebhookSubscription.next_attempt_at <= now,
+            pending,
+        )
+        .order_by(WebhookSubscription.next_attempt_at, WebhookSubscription.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def mark_delivered(db: Session, subscription: WebhookSubscription, last_event_id: int) -> None:
+    """전달 성공 → cursor 전진, 실패 카운터 초기화 (commit 포함)"""
+    subscription.last_event_id = last_event_id
+    subscription.failures = 0
+    subscription.next_attempt_at = 0.0
+    db.commit()
+
+
+def mark_failed(db: Session, subscription: WebhookSubscription, now: float) -> None:
+    """
+    전달 실패 → cursor는 그대로, 다음 시도를 지수 백오프로 미룬다 (commit 포함)
+
+    - 연속 실패가 WEBHOOK_MAX_FAILURES 를 넘으면 구독을 비활성화한다(0이면 무제한).
+    """
+    subscription.failures += 1
+    delay = min(
+        settings.WEBHOOK_RETRY_BASE_SECONDS * (2 ** (subscription.failures - 1)),
+        settings.WEBHOOK_RETRY_MAX_SECONDS,
+    )
+    subscription.next_attempt_at = now + delay
+    if 0 < settings.WEBHOOK_MAX_FAILURES <= subscription.failures:
+        subscription.active = False
+    db.commit()
@@ -0,0 +1,170 @@
+"""
+app/repository/sharing_repository.py
+
+폴더 / 그룹 / 공유 규칙 Repository
+
+역할
+- folders, user_groups, group_members, shares 테이블 CRUD
+- 규칙을 바꾸는 함수는 같은 트랜잭션 안에서 영향받는 문서의 접근 인덱스를
+  증분 갱신한다(access_repository.refresh_documents) → 항상 일관된 상태로 commit
+- 권한 판단(누가 이 폴더/그룹을 바꿀 수 있나)과 HTTP 에러는 라우터가 한다.
+"""
+
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.sharing import Folder, Group, GroupMember, Share
+from app.repository import access_repository
+
+
+class GroupCycleError(ValueError):
+    """그룹을 자기 자신(또는 자신을 포함하는 그룹)의 하위 그룹으로 넣으려 할 때"""
+
+
+# ------------------------------------------------------------
+# 폴더
+# ------------------------------------------------------------
+
+
+def create_folder(db: Session, *, name: str, owner_id: int) -> Folder:
+    folder = Folder(name=name, owner_id=owner_id)
+    db.add(folder)
+    db.commit()
+    db.refresh(folder)
+    return folder
+
+
+def get_folder(db: Session, folder_id: int) -> Optional[Folder]:
+    return db.get(Folder, folder_id)
+
+
+def move_document(db: Session, document: Document, folder_id: Optional[int]) -> Document:
+    """
+    문서를 폴더에 넣거나(folder_id) 폴더에서 뺀다(None).
+
+    - 예전 폴더 공유는 빠지고 새 폴더 공유가 적용되므로 이 문서 1개만 다시 계산한다.
+    """
+    document.folder_id = folder_id
+    db.flush()
+    access_repository.refresh_documents(db, [document.id])
+    db.commit()
+    db.refresh(document)
+    return document
+
+
+# ------------------------------------------------------------
+# 그룹
+# ------------------------------------------------------------
+
+
+def create_group(db: Session, *, name: str, owner_id: int) -> Group:
+    group = Group(name=name, owner_id=owner_id)
+    db.add(group)
+    db.commit()
+    db.refresh(group)
+    return group
+
+
+def get_group(db: Session, group_id: int) -> Optional[Group]:
+    return db.get(Group, group_id)
+
+
+def add_group_member(
+    db: Session,
+    group_id: int,
+    *,
+    user_id: Optional[int] = None,
+    member_group_id: Optional[int] = None,
+) -> GroupMember:
+    """
+    그룹에 사용자 또는 하위 그룹을 추가한다.
+
+    Raises:
+        GroupCycleError: member_group이 group을 (간접적으로라도) 포함하는 경우
+    """
+    if member_group_id is not None and member_group_id in access_repository.ancestor_groups(
+        db, [group_id]
+    ):
+        raise GroupCycleError("Group membership would create a cycle")
+
+    query = db.query(GroupMember).filter(GroupMember.group_id == group_id)
+    if user_id is not None:
+        query = query.filter(GroupMember.user_id == user_id)
+    else:
+        query = query.filter(GroupMember.member_group_id == member_group_id)
+    existing = query.first()
+    if existing is not None:
+        return existing
+
+    member = GroupMember(group_id=group_id, user_id=user_id, member_group_id=member_group_id)
+    db.add(member)
+    db.flush()
+    access_repository.refresh_documents(
+        db, access_repository.documents_for_groups(db, [group_id])
+    )
+    db.commit()
+    db.refresh(member)
+    return member
+
+
+def get_group_member(db: Session, member_id: int) -> Optional[GroupMember]:
+    return db.get(GroupMember, member_id)
+
+
+def remove_group_member(db: Session, member: GroupMember) -> None:
+    # 삭제 전에 영향 범위를 구한다(삭제 후에는 상위 그룹 경로가 끊길 수 있음)
+    affected = access_repository.documents_for_groups(db, [member.group_id])
+    db.delete(member)
+    db.flush()
+    access_repository.refresh_documents(db, affected)
+    db.commit()
+
+
+# ------------------------------------------------------------
+# 공유 규칙
+# ------------------------------------------------------------
+
+
+def _share_targets(db: Session, share: Share) -> set:
+    if share.document_id is not None:
+        return {share.document_id}
+    return access_repository.documents_for_folders(db, [share.folder_id])
+
+
+def create_share(
+    db: Session,
+    *,
+    created_by: int,
+    document_id: Optional[int] = None,
+    folder_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    group_id: Optional[int] = None,
+) -> Share:
+    """공유 규칙 추가 + 대상 문서(문서 1개 또는 폴더 안 문서들) 접근 인덱스 갱신"""
+    share = Share(
+        created_by=created_by,
+        document_id=document_id,
+        folder_id=folder_id,
+        user_id=user_id,
+        group_id=group_id,
+    )
+    db.add(share)
+    db.flush()
+    access_repository.refresh_documents(db, _share_targets(db, share))
+    db.commit()
+    db.refresh(share)
+    return share
+
+
+def get_share(db: Session, share_id: int) -> Optional[Share]:
+    return db.get(Share, share_id)
+
+
+def delete_share(db: Session, share: Share) -> None:
+    targets = _share_targets(db, share)
+    db.delete(share)
+    db.flush()
+    access_repository.refresh_documents(db, targets)
+    db.commit()
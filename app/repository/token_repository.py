@@ -0,0 +1,142 @@
+"""
+app/repository/token_repository.py
+
+Refresh Token / 폐기 토큰(denylist) DB 접근 Repository
+
+역할
+- refresh_tokens, revoked_tokens 테이블 조회/저장만 담당한다.
+- "재사용이면 401" 같은 판단은 라우터에서 한다.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.models.token import RefreshToken, RevokedToken
+
+
+def add_refresh_token(
+    db: Session,
+    *,
+    jti: str,
+    user_id: int,
+    expires_at: datetime,
+) -> RefreshToken:
+    """
+    새 Refresh Token 기록을 세션에 추가한다. (commit은 호출자가 한다)
+
+    - 회전(rotation) 시 "이전 토큰 폐기 + 새 토큰 추가"를
+      한 트랜잭션으로 묶기 위해 여기서는 commit하지 않는다.
+    """
+    token = RefreshToken(jti=jti, user_id=user_id, expires_at=expires_at)
+    db.add(token)
+    return token
+
+
+def get_refresh_token(db: Session, jti: str) -> RefreshToken | None:
+    """jti로 Refresh Token 기록 1개 조회 (PK 조회)"""
+    return db.get(RefreshToken, jti)
+
+
+def rotate_refresh_token(db: Session, jti: str, replaced_by: str) -> bool:
+    """
+    ✅ 아직 유효한 Refresh Token만 폐기 + 후계 jti 기록 (조건부 UPDATE 1문장, commit은 호출자가 한다)
+
+    - "폐기 여부 확인"과 "폐기"를 한 문장으로 해서, 같은 refresh로 동시에 두 번 회전해도
+      한 요청만 1행을 바꾼다.
+
+    Returns:
+        False = 이미 다른 요청이 폐기함(재사용) → 호출자가 전체 폐기 처리
+    """
+    updated = (
+        db.query(RefreshToken)
+        .filter(RefreshToken.jti == jti, RefreshToken.revoked_at.is_(None))
+        .update(
+            {
+                RefreshToken.revoked_at: datetime.now(timezone.utc),
+                RefreshToken.replaced_by: replaced_by,
+            },
+            synchronize_session=False,
+        )
+    )
+    return updated == 1
+
+
+def revoke_user_refresh_tokens(db: Session, user_id: int) -> int:
+    """
+    사용자의 아직 유효한 Refresh Token을 전부 폐기한다. (commit은 호출자가 한다)
+
+    Returns:
+        폐기된 row 수
+    """
+    return (
+        db.query(RefreshToken)
+        .filter(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .update(
+            {RefreshToken.revoked_at: datetime.now(timezone.utc)},
+            synchronize_session=False,
+        )
+    )
+
+
+def add_revoked_token(db: Session, *, jti: str, expires_at: int) -> None:
+    """
+    Access Token jti를 denylist에 추가한다. (commit은 호출자가 한다)
+
+    - 같은 토큰으로 로그아웃을 두 번 해도 에러가 나지 않게 이미 있으면 건너뛴다.
+    """
+    exists = db.query(RevokedToken.id).filter(RevokedToken.jti == jti).first()
+    if exists is None:
+        db.add(RevokedToken(jti=jti, expires_at=expires_at, created_at=time.time()))
+
+
+def get_revoked_since(
+    db: Session, last_id: int, now: int
+) -> List[Tuple[int, str, int, Optional[float]]]:
+    """
+    id > last_id 인(= 마지막 동기화 이후 추가된) 아직 만료 안 된 폐기 토큰 목록
+
+    Returns:
+        (id, jti, expires_at, created_at) 튜플 리스트 (id 오름차순)
+    """
+    rows = (
+        db.query(
+            RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at, RevokedToken.created_at
+        )
+        .filter(RevokedToken.id > last_id, RevokedToken.expires_at > now)
+        .order_by(RevokedToken.id)
+        .all()
+    )
+    return [tuple(row) for row in rows]
+
+
+def get_max_revoked_id(db: Session, visible_before: Optional[float] = None) -> int:
+    """
+    revoked_tokens의 최대 id (비어 있으면 0)
+
+    - visible_before를 주면 그 전에 추가된 row만 본다(아직 commit 전일 수 있는 최근 row 제외).
+    """
+    query = db.query(func.max(RevokedToken.id))
+    if visible_before is not None:
+        query = query.filter(
+            or_(RevokedToken.created_at.is_(None), RevokedToken.created_at <= visible_before)
+        )
+    return query.scalar() or 0
+
+
+def purge_expired_revoked(db: Session, now: int) -> int:
+    """
+    이미 만료된 폐기 토큰 row를 삭제한다. (commit 포함)
+
+    - 만료된 토큰은 jwt.decode 단계에서 이미 거부되므로 denylist에 둘 이유가 없다.
+    """
+    deleted = (
+        db.query(RevokedToken)
+        .filter(RevokedToken.expires_at <= now)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
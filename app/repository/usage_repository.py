@@ -0,0 +1,131 @@
+"""
+app/repository/usage_repository.py
+
+사용자별 저장 용량/문서 수 카운터 Repository
+
+역할
+- users.storage_bytes_used / users.document_count 를 "증분"으로 갱신한다.
+  (사용량을 알기 위해 파일을 stat 하거나 documents를 집계하지 않는다)
+- 쿼터 초과 여부는 UPDATE의 WHERE 조건으로 원자적으로 판단한다.
+- 카운터가 실제 documents와 어긋났을 때(drift) 바로잡는 reconcile_usage 제공
+"""
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.document import Document
+from app.models.user import User
+
+
+class QuotaExceededError(Exception):
+    """저장 용량 또는 문서 개수 쿼터를 넘는 변경을 시도했을 때"""
+
+
+def add_usage(db: Session, owner_id: int, size_bytes: int, documents: int = 1) -> None:
+    """
+    사용량 카운터를 증가시킨다. (commit은 호출자가 한다)
+
+    - "현재값 + 증가분 <= 쿼터" 를 WHERE에 넣어서 DB가 한 번에 판단한다.
+      → 동시에 업로드가 여러 개 와도 쿼터를 넘길 수 없다.
+    - 조건을 만족하지 못해 갱신된 row가 0이면 QuotaExceededError
+      (호출자는 rollback 해야 한다)
+    - 쿼터 설정값이 0이면 무제한
+    """
+    query = db.query(User).filter(User.id == owner_id)
+    if settings.USER_STORAGE_QUOTA_BYTES > 0:
+        query = query.filter(
+            User.storage_bytes_used + size_bytes <= settings.USER_STORAGE_QUOTA_BYTES
+        )
+    if settings.USER_DOCUMENT_QUOTA > 0:
+        query = query.filter(User.document_count + documents <= settings.USER_DOCUMENT_QUOTA)
+
+    updated = query.update(
+        {
+            User.storage_bytes_used: User.storage_bytes_used + size_bytes,
+            User.document_count: User.document_count + documents,
+        },
+        synchronize_session=False,
+    )
+    if updated == 0:
+        raise QuotaExceededError("Storage quota exceeded")
+
+
+def remove_usage(db: Session, owner_id: int, size_bytes: int, documents: int = 1) -> None:
+    """
+    사용량 카운터를 감소시킨다. (삭제 시, commit은 호출자가 한다)
+
+    - drift가 있어도 음수가 되지 않게 0에서 멈춘다.
+    """
+    new_bytes = User.storage_bytes_used - size_bytes
+    new_count = User.document_count - documents
+    db.query(User).filter(User.id == owner_id).update(
+        {
+            User.storage_bytes_used: case((new_bytes < 0, 0), else_=new_bytes),
+            User.document_count: case((new_count < 0, 0), else_=new_count),
+        },
+        synchronize_session=False,
+    )
+
+
+def remaining_bytes(user: User) -> int | None:
+    """남은 저장 용량(바이트). 무제한이면 None"""
+    if settings.USER_STORAGE_QUOTA_BYTES <= 0:
+        return None
+    return max(settings.USER_STORAGE_QUOTA_BYTES - (user.storage_bytes_used or 0), 0)
+
+
+def reconcile_usage(db: Session, batch_size: int = 500) -> int:
+    """
+    카운터를 실제 documents 집계값으로 바로잡는다. (commit 포함)
+
+    - 사용자 id 범위를 batch_size씩 나눠서 처리하고 배치마다 commit한다.
+      (한 번에 전체 users를 잠그지 않기 위함)
+    - 배치마다 상관 서브쿼리 UPDATE 1문장:
+        UPDATE users SET storage_bytes_used = (SELECT SUM ...), document_count = (SELECT COUNT ...)
+        WHERE id IN (...) AND (값이 다른 경우)
+      집계와 쓰기가 한 문장이라, 그 사이 커밋된 업로드/삭제의 증분을 덮어쓰지 않는다.
+    - 집계는 (owner_id, ...) 인덱스를 타고, 삭제된(soft delete) 문서는 빼고 센다.
+
+    Returns:
+        값이 어긋나서 고친 사용자 수
+    """
+    live = (Document.owner_id == User.id) & Document.deleted_at.is_(None)
+    actual_bytes = (
+        select(func.coalesce(func.sum(Document.size_bytes), 0)).where(live).scalar_subquery()
+    )
+    actual_count = select(func.count(Document.id)).where(live).scalar_subquery()
+
+    fixed = 0
+    last_id = 0
+
+    while True:
+        ids = [
+            row.id
+            for row in db.query(User.id)
+            .filter(User.id > last_id)
+            .order_by(User.id)
+            .limit(batch_size)
+            .all()
+        ]
+        if not ids:
+            break
+
+        result = db.execute(
+            update(User)
+            .where(
+                User.id.in_(ids),
+                or_(
+                    User.storage_bytes_used != actual_bytes,
+                    User.document_count != actual_count,
+                ),
+            )
+            .values(storage_bytes_used=actual_bytes, document_count=actual_count)
+            .execution_options(synchronize_session=False)
+        )
+        fixed += result.rowcount or 0
+
+        db.commit()
+        last_id = ids[-1]
+
+    return fixed
@@ -13,6 +13,8 @@ User 테이블(DB) 접근 전담 Repository
 - 테스트하기 쉬움(라우터 없이 DB 함수만 단독 테스트 가능)
 """
 
+from typing import Dict, Iterable, List
+
 from sqlalchemy.orm import Session
 
 from app.models.user import User
@@ -57,6 +59,7 @@ def create_user(db: Session, email: str, password: str) -> User:
     hashed_pw = hash_password(password)
 
     # 2) ORM 객체 생성 (아직 DB에 반영되기 전)
+    # - 가입으로는 관리자가 될 수 없다(관리자 지정은 python -m app.jobs.admins)
     user = User(email=email, hashed_password=hashed_pw)
 
     # 3) 세션에 추가 → commit 시점에 INSERT 실행
@@ -67,3 +70,41 @@ def create_user(db: Session, email: str, password: str) -> User:
     db.refresh(user)
 
     return user
+
+
+def get_users_by_ids(db: Session, user_ids: Iterable[int]) -> Dict[int, User]:
+    """
+    여러 사용자를 한 번의 쿼리로 조회한다. (WHERE id IN (...))
+
+    - 목록을 돌면서 get_user_by_id를 반복 호출하는 N+1 패턴 대신 사용한다.
+
+    Returns:
+        {user_id: User} (없는 id는 빠짐)
+    """
+    ids = set(user_ids)
+    if not ids:
+        return {}
+    return {user.id: user for user in db.query(User).filter(User.id.in_(ids)).all()}
+
+
+def set_admin(db: Session, emails: Iterable[str], is_admin: bool = True) -> List[str]:
+    """
+    이미 가입한 사용자들의 관리자 권한을 바꾼다. (UPDATE, commit 포함)
+
+    - 운영자가 CLI(app/jobs/admins.py)로만 호출한다. HTTP로는 노출하지 않는다.
+
+    Returns:
+        찾지 못한(가입하지 않은) 이메일 목록
+    """
+    wanted = set(emails)
+    if not wanted:
+        return []
+    found = {
+        row.email for row in db.query(User.email).filter(User.email.in_(wanted)).all()
+    }
+    if found:
+        db.query(User).filter(User.email.in_(found)).update(
+            {User.is_admin: is_admin}, synchronize_session=False
+        )
+    db.commit()
+    return sorted(wanted - found)
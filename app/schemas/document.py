@@ -9,7 +9,12 @@ app/schemas/document.py
   Pydantic이 자동으로 이 스키마 형태로 변환할 수 있게 설정한다.
 """
 
-from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.user import UserResponse
 
 
 class DocumentResponse(BaseModel):
@@ -35,3 +40,42 @@ class DocumentResponse(BaseModel):
 
     # 문서 소유자(User.id)
     owner_id: int
+
+    # 실제 바이트로 판별한 MIME 타입 / 페이지 수(모르면 null)
+    detected_type: Optional[str] = None
+    page_count: Optional[int] = None
+
+    # 파일 크기(바이트) / 내용 SHA-256 / 업로드 시각 / 상태
+    size_bytes: Optional[int] = None
+    sha256: Optional[str] = None
+    created_at: Optional[datetime] = None
+    status: str = "ready"
+
+
+class AdminDocumentResponse(DocumentResponse):
+    """
+    ✅ 관리자 문서 목록 응답 모델 (소유자 정보 포함)
+
+    - owner는 repository에서 joinedload/selectinload로 미리 읽어둔 값을 쓴다.
+    """
+    owner: UserResponse
+
+
+class DocumentBulkDelete(BaseModel):
+    """
+    ✅ 여러 문서 삭제 요청 (POST /documents/bulk-delete)
+
+    - 한 번에 최대 500개 (트랜잭션 1개로 처리)
+    """
+    ids: List[int] = Field(..., min_length=1, max_length=500)
+
+
+class DocumentBulkDeleteResponse(BaseModel):
+    """
+    ✅ 여러 문서 삭제 결과
+
+    - deleted  : 이번에 삭제한 문서 id
+    - not_found: 없거나 / 내 문서가 아니거나 / 이미 삭제된 id
+    """
+    deleted: List[int]
+    not_found: List[int]
@@ -0,0 +1,37 @@
+"""
+app/schemas/event.py
+
+✅ 문서 이벤트(웹훅 구독) API 스키마(Pydantic)
+"""
+
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict
+
+
+class WebhookCreate(BaseModel):
+    """웹훅 구독 요청 바디"""
+    url: AnyHttpUrl
+
+
+class WebhookResponse(BaseModel):
+    """
+    웹훅 구독 정보
+
+    - last_event_id: 전달 완료한 마지막 이벤트 id
+    - failures: 연속 실패 횟수 (active=False면 실패가 너무 많아 중지된 상태)
+    """
+    id: int
+    url: str
+    last_event_id: int
+    failures: int
+    active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WebhookCreatedResponse(WebhookResponse):
+    """
+    구독 생성 응답 (secret은 이때 한 번만 내려준다)
+
+    - 수신 측은 X-DocuMind-Signature == "sha256=" + HMAC-SHA256(secret, body) 로 검증
+    """
+    secret: str
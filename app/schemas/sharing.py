@@ -0,0 +1,95 @@
+"""
+app/schemas/sharing.py
+
+✅ 폴더/그룹/공유 API 스키마(Pydantic)
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+
+class FolderCreate(BaseModel):
+    name: str
+
+
+class FolderResponse(BaseModel):
+    id: int
+    name: str
+    owner_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DocumentMove(BaseModel):
+    """문서 폴더 이동 요청 (folder_id=None 이면 폴더에서 뺀다)"""
+    folder_id: Optional[int] = None
+
+
+class GroupCreate(BaseModel):
+    name: str
+
+
+class GroupResponse(BaseModel):
+    id: int
+    name: str
+    owner_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class GroupMemberCreate(BaseModel):
+    """
+    그룹 구성원 추가 요청
+
+    - user_id(사용자) / group_id(하위 그룹) 중 정확히 하나
+    """
+    user_id: Optional[int] = None
+    group_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def _one_member(self) -> "GroupMemberCreate":
+        if (self.user_id is None) == (self.group_id is None):
+            raise ValueError("Exactly one of user_id or group_id is required")
+        return self
+
+
+class GroupMemberResponse(BaseModel):
+    id: int
+    group_id: int
+    user_id: Optional[int] = None
+    member_group_id: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ShareCreate(BaseModel):
+    """
+    공유 요청
+
+    - 대상: document_id / folder_id 중 정확히 하나
+    - 받는 쪽: user_id / group_id 중 정확히 하나
+    """
+    document_id: Optional[int] = None
+    folder_id: Optional[int] = None
+    user_id: Optional[int] = None
+    group_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def _one_each(self) -> "ShareCreate":
+        if (self.document_id is None) == (self.folder_id is None):
+            raise ValueError("Exactly one of document_id or folder_id is required")
+        if (self.user_id is None) == (self.group_id is None):
+            raise ValueError("Exactly one of user_id or group_id is required")
+        return self
+
+
+class ShareResponse(BaseModel):
+    id: int
+    document_id: Optional[int] = None
+    folder_id: Optional[int] = None
+    user_id: Optional[int] = None
+    group_id: Optional[int] = None
+    created_by: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,38 @@
+"""
+app/schemas/token.py
+
+✅ 토큰 발급/재발급/로그아웃 API 스키마(Pydantic)
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TokenResponse(BaseModel):
+    """
+    로그인/재발급 응답 스키마
+
+    - access_token : API 호출용 (짧은 수명)
+    - refresh_token: 재발급용 (1회용, 쓰면 새 토큰으로 교체됨)
+    - expires_in   : access_token 만료까지 남은 초
+    """
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+    expires_in: int
+
+
+class RefreshRequest(BaseModel):
+    """/auth/refresh 요청 바디"""
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """
+    /auth/logout 요청 바디(선택)
+
+    - refresh_token을 같이 보내면 그 refresh도 폐기한다.
+    - 안 보내면 현재 access token만 폐기한다.
+    """
+    refresh_token: Optional[str] = None
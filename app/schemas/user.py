@@ -38,3 +38,15 @@ class UserResponse(BaseModel):
     # ✅ Pydantic v2: ORM 객체(SQLAlchemy 모델)를 그대로 넣어도
     # 이 스키마로 변환할 수 있게 해주는 옵션
     model_config = ConfigDict(from_attributes=True)
+
+
+class UsageResponse(BaseModel):
+    """
+    사용량/쿼터 응답 스키마 (/auth/me/usage)
+
+    - *_quota 가 None이면 무제한
+    """
+    storage_bytes_used: int
+    document_count: int
+    storage_quota_bytes: int | None
+    document_quota: int | None
@@ -0,0 +1,81 @@
+"""
+benchmarks/bench_compression.py
+
+✅ 응답 압축 벤치마크: "전송 바이트 vs CPU" 트레이드오프 확인용
+
+실행:
+    python benchmarks/bench_compression.py [문서 개수]
+
+측정 항목(코덱/레벨별):
+- size      : 압축 후 바이트 수 (= 네트워크로 나가는 양)
+- ratio     : 원본 대비 비율
+- comp_us   : 1회 압축 CPU 시간(마이크로초)
+- per_1k_ms : 요청 1,000번 동안 드는 압축 CPU 시간
+              - per-request : 매 요청마다 압축 (미들웨어만 쓸 때)
+              - cached      : PrecompressedBody로 1번만 압축 후 재사용 (/documents/me)
+"""
+
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# 프로젝트 루트를 import 경로에 추가 (tests/conftest.py 와 같은 방식)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core.compression import CODECS, PrecompressedBody  # noqa: E402
+
+
+def make_listing(count: int) -> bytes:
+    """/documents/me 응답과 비슷한 모양의 JSON 생성"""
+    docs = [
+        {
+            "id": i,
+            "filename": f"report-{i}.pdf",
+            "file_path": f"app/uploads/{uuid.uuid4()}.pdf",
+            "content_type": "application/pdf",
+            "owner_id": 1,
+        }
+        for i in range(count)
+    ]
+    return json.dumps(docs).encode()
+
+
+def time_per_call(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    raw = make_listing(count)
+    repeat = 50
+
+    print(f"documents={count} raw_bytes={len(raw)} codecs={list(CODECS)}")
+    print(f"{'codec':<8}{'size':>10}{'ratio':>8}{'comp_us':>10}"
+          f"{'per-request/1k(ms)':>22}{'cached/1k(ms)':>16}")
+
+    for name, codec in CODECS.items():
+        compressed = codec.compress(raw)
+        per_call = time_per_call(lambda: codec.compress(raw), repeat)
+
+        # 캐시 경로: 1번 압축 + 999번 재사용 (재사용은 dict 조회 수준)
+        body = PrecompressedBody(raw)
+        start = time.perf_counter()
+        for _ in range(1000):
+            body.encoded(name)
+        cached_total = time.perf_counter() - start
+
+        print(
+            f"{name:<8}{len(compressed):>10}{len(compressed) / len(raw):>8.3f}"
+            f"{per_call * 1e6:>10.0f}{per_call * 1000 * 1000:>22.1f}"
+            f"{cached_total * 1000:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
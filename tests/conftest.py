@@ -1,10 +1,162 @@
 """
 ✅ pytest가 tests 폴더에서 실행되어도
 프로젝트 루트(C:/project)를 import 경로(sys.path)에 추가해주는 설정 파일
+
++ 여러 테스트 파일이 같이 쓰는 fixture
+- client        : app.main 의 TestClient (세션에 1개)
+- count_queries : 블록 안 SQL 문 수 세기
+- register_user : 새 사용자 가입 + 로그인
+- new_pdf / upload : 매번 내용이 다른 PDF, 업로드 요청
 """
 
+import os
 import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
+
+# ✅ 테스트 중에는 JSON 요청 로그를 stdout에 쏟지 않는다(로그 테스트는 sink를 직접 검사)
+os.environ.setdefault("LOG_STDOUT", "false")
+
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import pytest
+from sqlalchemy import event
+
+PASSWORD = "NoMooHyunFeelingIsGood"
+
+
+class QueryCounter:
+    """블록 안에서 실행된 SQL 문 목록 (count로 개수 확인)"""
+
+    def __init__(self) -> None:
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def _count_queries(engine=None):
+    from app.db.database import engine as default_engine
+
+    engine = engine or default_engine
+    counter = QueryCounter()
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+@pytest.fixture
+def count_queries():
+    """
+    ✅ 쿼리 수 검증 헬퍼 (N+1 회귀 방지)
+
+        with count_queries() as q:
+            client.get(...)
+        assert q.count <= 3
+    """
+    return _count_queries
+
+
+# ------------------------------------------------------------
+# API 클라이언트 / 사용자 / 업로드
+# ------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def client():
+    """app.main 의 TestClient (모듈마다 따로 만들지 않는다)"""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    return TestClient(app)
+
+
+@dataclass
+class RegisteredUser:
+    """가입 + 로그인한 테스트 사용자 (tokens = /auth/login 응답)"""
+    id: int
+    email: str
+    tokens: Dict[str, str] = field(repr=False)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens['access_token']}"}
+
+
+@pytest.fixture
+def register_user(client):
+    """
+    ✅ 매번 새 이메일로 가입 + 로그인
+
+        owner = register_user()
+        client.get("/documents/me", headers=owner.headers)
+
+    - admin=True 면 운영자 CLI(app.jobs.admins)로 관리자 권한을 준다.
+    """
+
+    def _register(admin: bool = False) -> RegisteredUser:
+        from app.jobs.admins import run as run_admins
+
+        email = f"user-{uuid.uuid4()}@example.com"
+        registered = client.post("/auth/register", json={"email": email, "password": PASSWORD})
+        assert registered.status_code == 201, registered.text
+        if admin:
+            assert run_admins("grant", [email]) == []
+        login = client.post("/auth/login", json={"email": email, "password": PASSWORD})
+        assert login.status_code == 200, login.text
+        return RegisteredUser(id=registered.json()["id"], email=email, tokens=login.json())
+
+    return _register
+
+
+@pytest.fixture
+def new_pdf():
+    """매번 내용(sha256)이 다른 PDF → 다른 테스트의 산출물/중복 제거와 섞이지 않는다"""
+
+    def _new_pdf() -> bytes:
+        return f"%PDF-1.4\n% {uuid.uuid4()}\n1 0 obj << /Type /Page >> endobj\n%%EOF\n".encode()
+
+    return _new_pdf
+
+
+@pytest.fixture
+def upload(client, new_pdf):
+    """
+    ✅ POST /documents/upload (응답 반환)
+
+    - data를 안 주면 new_pdf()
+    - status_code가 있으면 응답 코드를 확인한다(None이면 확인 안 함).
+    """
+
+    def _upload(
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        *,
+        filename: str = "a.pdf",
+        content_type: str = "application/pdf",
+        status_code: Optional[int] = 201,
+    ):
+        result = client.post(
+            "/documents/upload",
+            headers=headers,
+            files={"file": (filename, new_pdf() if data is None else data, content_type)},
+        )
+        if status_code is not None:
+            assert result.status_code == status_code, result.text
+        return result
+
+    return _upload
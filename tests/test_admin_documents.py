@@ -0,0 +1,73 @@
+"""
+tests/test_admin_documents.py
+
+✅ 관리자 문서 목록 테스트
+- 관리자가 아니면 403 (가입만으로는 관리자가 될 수 없다)
+- 관리자 지정은 CLI(app.jobs.admins)로 이미 가입한 계정에 한다.
+- owner 이메일이 함께 내려온다.
+- 소유자/문서 수가 늘어도 쿼리 수가 그대로다(N+1 없음).
+"""
+
+from app.db.database import SessionLocal
+from app.jobs.admins import run as run_admins
+from app.repository.document_repository import get_documents_for_owners
+
+
+def _owners_with_documents(register_user, upload, n: int):
+    owners = []
+    for _ in range(n):
+        owner = register_user()
+        for _ in range(2):
+            upload(owner.headers)
+        owners.append(owner)
+    return owners
+
+
+def test_admin_listing_requires_admin(client, register_user):
+    headers = register_user().headers
+    assert client.get("/documents", headers=headers).status_code == 403
+
+
+def test_admin_is_granted_only_by_cli(client, register_user):
+    user = register_user()
+    assert client.get("/documents", headers=user.headers).status_code == 403
+
+    assert run_admins("grant", [user.email, "nobody@example.com"]) == ["nobody@example.com"]
+    assert client.get("/documents", headers=user.headers).status_code == 200
+
+    run_admins("revoke", [user.email])
+    assert client.get("/documents", headers=user.headers).status_code == 403
+
+
+def test_admin_listing_has_bounded_query_count(client, register_user, upload, count_queries):
+    admin_headers = register_user(admin=True).headers
+    few = _owners_with_documents(register_user, upload, 1)
+    many = _owners_with_documents(register_user, upload, 4)
+
+    def _list(owners):
+        params = [("owner_id", owner.id) for owner in owners]
+        with count_queries() as q:
+            result = client.get("/documents", headers=admin_headers, params=params)
+        assert result.status_code == 200, result.text
+        return result.json(), q.count
+
+    docs, few_count = _list(few)
+    assert len(docs) == 2
+    assert {d["owner"]["email"] for d in docs} == {few[0].email}
+
+    docs, many_count = _list(many)
+    assert len(docs) == 8
+    assert {d["owner"]["email"] for d in docs} == {owner.email for owner in many}
+    assert many_count == few_count
+
+
+def test_get_documents_for_owners_single_query(register_user, upload, count_queries):
+    owners = _owners_with_documents(register_user, upload, 3)
+    with SessionLocal() as db, count_queries() as q:
+        docs = get_documents_for_owners(
+            db, [owner.id for owner in owners], load_owner="selectin"
+        )
+        emails = {doc.owner.email for doc in docs}
+    assert len(docs) == 6
+    assert emails == {owner.email for owner in owners}
+    assert q.count == 2   # documents 1번 + users IN (...) 1번
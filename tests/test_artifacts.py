@@ -0,0 +1,98 @@
+"""
+tests/test_artifacts.py
+
+✅ 파생 산출물 캐시 테스트
+- 같은 내용의 파일을 두 사용자가 올리면 텍스트 추출은 1번만 하고 두 번째는 캐시 히트
+- /documents/{id}/artifacts/text 로 추출 텍스트를 받는다(남의 문서는 404).
+- 압축 크기 상한을 넘으면 오래 안 쓴 것부터 지운다(LRU).
+"""
+
+import io
+import os
+import uuid
+import zipfile
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.artifacts import ArtifactCache, Processor, artifact_cache
+from app.models.artifact import DerivedArtifact
+from app.repository import artifact_repository
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def _docx(text):
+    document_xml = (
+        '<?xml version="1.0"?><w:document><w:body>'
+        f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+        '<w:p><w:r><w:t xml:space="preserve">second &amp; last</w:t></w:r></w:p>'
+        '</w:body></w:document>'
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", document_xml)
+    return buffer.getvalue()
+
+
+def test_identical_uploads_share_artifacts(client, register_user, upload):
+    marker = uuid.uuid4().hex
+    data = _docx(f"hello {marker}")
+    before = artifact_cache.stats.snapshot()
+
+    docx = {"filename": "a.docx", "content_type": DOCX_MIME}
+    first_user, second_user = register_user().headers, register_user().headers
+    first_id = upload(first_user, data, **docx).json()["id"]      # 백그라운드 처리 → 미스(계산)
+    second_id = upload(second_user, data, **docx).json()["id"]    # 같은 sha256 → 히트
+
+    after = artifact_cache.stats.snapshot()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+    assert after["bytes_saved"] > before["bytes_saved"]
+
+    text = client.get(f"/documents/{second_id}/artifacts/text", headers=second_user)
+    assert text.status_code == 200
+    assert text.text == f"hello {marker}\nsecond & last"
+    assert text.headers["content-type"].startswith("text/plain")
+
+    # 남의 문서 산출물은 볼 수 없다
+    assert client.get(f"/documents/{first_id}/artifacts/text", headers=second_user).status_code == 404
+
+    stats = client.get("/stats/artifacts").json()
+    assert stats["process"]["hit_rate"] > 0
+    assert stats["store"]["entries"] >= 1
+
+
+def test_lru_eviction_respects_byte_cap(tmp_path):
+    # 공용 test.db의 다른 산출물과 섞이지 않도록 별도 SQLite 사용
+    engine = create_engine(f"sqlite:///{tmp_path / 'artifacts.db'}")
+    DerivedArtifact.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+
+    calls = []
+
+    def fake(path):
+        calls.append(path)
+        return uuid.uuid4().hex.encode() * 50
+
+    processor = Processor("test", "1", frozenset(), "text/plain", fake)
+    keys = [f"{i:02d}" + "0" * 62 for i in range(3)]
+    cache = ArtifactCache(root=str(tmp_path / "store"), max_bytes=10**9)
+
+    with Session() as db:
+        for key in keys:
+            cache.get_or_compute(db, processor, key, "src")
+        sizes = [artifact_repository.get_artifact(db, k, "test", "1").size_bytes for k in keys]
+
+        # 0번을 다시 읽어서 최근 사용으로 만든다(계산은 하지 않음)
+        cache.get_or_compute(db, processor, keys[0], "src")
+        assert len(calls) == 3
+
+        # 상한을 "2개분"으로 줄이면 가장 오래 안 쓴 1번만 지워진다
+        cache.max_bytes = sum(sizes) - sizes[1]
+        assert cache.evict(db) == 1
+        remaining = [artifact_repository.get_artifact(db, k, "test", "1") is not None for k in keys]
+        assert remaining == [True, False, True]
+        assert artifact_repository.total_size(db) <= cache.max_bytes
+        assert not os.path.exists(cache.path_for(keys[1], processor))
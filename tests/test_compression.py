@@ -0,0 +1,92 @@
+"""
+tests/test_compression.py
+
+✅ 응답 압축 미들웨어 테스트
+- 큰 JSON 응답은 gzip으로 압축된다.
+- min_size 보다 작은 응답 / allowlist 밖의 Content-Type은 압축하지 않는다.
+- 압축 대상 Content-Type이면 압축하지 않은 응답에도 Vary: Accept-Encoding
+- StreamingResponse는 청크 단위로 압축된다.
+"""
+
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+
+BIG = {"items": [{"id": i, "file_path": f"app/uploads/{i:08d}.pdf"} for i in range(200)]}
+
+demo = FastAPI()
+demo.add_middleware(CompressionMiddleware, min_size=500)
+
+
+@demo.get("/big")
+def big():
+    return JSONResponse(BIG)
+
+
+@demo.get("/small")
+def small():
+    return JSONResponse({"ok": True})
+
+
+@demo.get("/binary")
+def binary():
+    return Response(b"\x00" * 5000, media_type="application/octet-stream")
+
+
+@demo.get("/stream")
+def stream():
+    def lines():
+        for i in range(100):
+            yield f"line {i}\n".encode()
+
+    return StreamingResponse(lines(), media_type="text/plain")
+
+
+client = TestClient(demo)
+
+
+def test_large_json_is_gzipped():
+    result = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert result.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in result.headers["vary"].lower()
+    assert int(result.headers["content-length"]) < len(result.content)
+    assert result.json() == BIG
+
+
+def test_small_and_non_allowlisted_are_not_compressed():
+    assert "content-encoding" not in client.get(
+        "/small", headers={"Accept-Encoding": "gzip"}
+    ).headers
+    assert "content-encoding" not in client.get(
+        "/binary", headers={"Accept-Encoding": "gzip"}
+    ).headers
+    assert "content-encoding" not in client.get(
+        "/big", headers={"Accept-Encoding": "identity"}
+    ).headers
+
+
+def test_vary_is_set_even_when_not_compressed():
+    # 압축 대상 타입이면 압축을 안 했어도 캐시가 인코딩별로 나눠 저장하도록 Vary
+    for path, encoding in (("/big", "identity"), ("/small", "gzip"), ("/big", "")):
+        result = client.get(path, headers={"Accept-Encoding": encoding})
+        assert "content-encoding" not in result.headers
+        assert "accept-encoding" in result.headers["vary"].lower()
+    assert "vary" not in client.get("/binary", headers={"Accept-Encoding": "gzip"}).headers
+
+
+def test_streaming_response_is_compressed_in_chunks():
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as result:
+        assert result.headers["content-encoding"] == "gzip"
+        assert "content-length" not in result.headers
+        raw = b"".join(result.iter_raw())
+    assert gzip.decompress(raw) == b"".join(f"line {i}\n".encode() for i in range(100))
+
+
+def test_negotiate_encoding_respects_q_values():
+    assert negotiate_encoding("gzip;q=0, *;q=0") is None
+    assert negotiate_encoding("br;q=0.5, gzip") == "gzip"
+    assert negotiate_encoding(None) is None
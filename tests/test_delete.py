@@ -0,0 +1,120 @@
+"""
+tests/test_delete.py
+
+✅ 문서 삭제 + GC 테스트
+- DELETE /documents/{id} 는 바로 목록/공유/사용량에서 빠지고 파일은 남는다(soft delete).
+- 여러 개 삭제(POST /documents/bulk-delete)는 남의 문서/없는 id를 not_found로 알려준다.
+- GC는 유예 기간이 지난 삭제 문서의 파일/row를 치우고,
+  같은 내용의 살아 있는 문서가 있으면 파생 산출물은 남긴다.
+- 초당 바이트 상한을 넘지 않도록 쉰다.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.jobs.gc import Throttle, collect_once
+from app.models.artifact import DerivedArtifact
+from app.models.document import Document
+
+
+def _my_ids(client, headers):
+    return {d["id"] for d in client.get("/documents/me", headers=headers).json()}
+
+
+def _after_grace():
+    return datetime.now(timezone.utc) + timedelta(seconds=settings.GC_GRACE_SECONDS + 60)
+
+
+def test_delete_hides_document_and_returns_quota(client, register_user, upload):
+    owner = register_user().headers
+    reader = register_user()
+    keep = upload(owner).json()
+    doc = upload(owner).json()
+    client.post("/sharing/shares", headers=owner, json={"document_id": doc["id"], "user_id": reader.id})
+
+    etag = client.get("/documents/me", headers=owner).headers["etag"]
+    # 공유받은 사람은 지울 수 없다
+    assert client.delete(f"/documents/{doc['id']}", headers=reader.headers).status_code == 403
+
+    assert client.delete(f"/documents/{doc['id']}", headers=owner).status_code == 204
+    assert client.delete(f"/documents/{doc['id']}", headers=owner).status_code == 404
+
+    # 목록(ETag 갱신) / 공유 / 산출물 / 사용량에서 바로 빠진다
+    listed = client.get("/documents/me", headers=owner)
+    assert listed.headers["etag"] != etag
+    assert {d["id"] for d in listed.json()} == {keep["id"]}
+    assert doc["id"] not in {d["id"] for d in client.get("/documents/accessible", headers=reader.headers).json()}
+    assert client.get(f"/documents/{doc['id']}/artifacts/text", headers=owner).status_code == 404
+    usage = client.get("/auth/me/usage", headers=owner).json()
+    assert usage["document_count"] == 1
+    assert usage["storage_bytes_used"] == keep["size_bytes"]
+
+    # 파일은 GC 전까지 그대로
+    assert os.path.exists(doc["file_path"])
+
+
+def test_bulk_delete(client, register_user, upload):
+    owner = register_user().headers
+    other = register_user().headers
+    mine = [upload(owner).json()["id"] for _ in range(3)]
+    theirs = upload(other).json()["id"]
+
+    result = client.post(
+        "/documents/bulk-delete", headers=owner, json={"ids": mine[:2] + [theirs, 987654321]}
+    )
+    assert result.status_code == 200, result.text
+    assert result.json() == {"deleted": mine[:2], "not_found": sorted([theirs, 987654321])}
+
+    assert _my_ids(client, owner) == {mine[2]}
+    assert theirs in _my_ids(client, other)
+
+
+def test_gc_reclaims_files_and_keeps_shared_content(client, register_user, upload, new_pdf):
+    first = register_user().headers
+    second = register_user().headers
+    data = new_pdf()
+    gone = upload(first, data).json()
+    same = upload(second, data).json()    # 같은 내용을 다른 사용자가 올림
+    only = upload(first).json()
+    for doc, headers in ((gone, first), (only, first)):
+        assert client.get(f"/documents/{doc['id']}/artifacts/text", headers=headers).status_code == 200
+
+    assert client.post(
+        "/documents/bulk-delete", headers=first, json={"ids": [gone["id"], only["id"]]}
+    ).json()["deleted"] == [gone["id"], only["id"]]
+
+    # 유예 기간 안에는 아무것도 지우지 않는다
+    collect_once(sleep=lambda seconds: None)
+    assert os.path.exists(gone["file_path"])
+
+    stats = collect_once(_after_grace(), sleep=lambda seconds: None)
+    assert stats["documents"] >= 2
+    assert not os.path.exists(gone["file_path"])
+    assert not os.path.exists(only["file_path"])
+    assert os.path.exists(same["file_path"])
+
+    with SessionLocal() as db:
+        assert db.get(Document, gone["id"]) is None
+        assert db.get(Document, same["id"]) is not None
+        artifact_shas = {a.sha256 for a in db.query(DerivedArtifact.sha256).all()}
+    # 살아 있는 문서가 같은 내용을 쓰고 있으면 산출물은 남고, 아무도 안 쓰면 지워진다
+    assert same["sha256"] in artifact_shas
+    assert only["sha256"] not in artifact_shas
+    assert client.get(f"/documents/{same['id']}/artifacts/text", headers=second).status_code == 200
+
+
+def test_throttle_limits_bytes_per_second():
+    now = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    throttle = Throttle(100, clock=lambda: now[0], sleep=sleep)
+    throttle.consume(50)     # 0.5초 분량
+    throttle.consume(150)    # 누적 2초 분량
+    assert slept == [0.5, 1.5]
+    assert now[0] == 2.0
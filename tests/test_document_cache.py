@@ -0,0 +1,33 @@
+"""
+tests/test_document_cache.py
+
+✅ /documents/me ETag + 조건부 GET 테스트
+- 같은 ETag로 다시 요청하면 304(바디 없음)
+- 업로드로 카탈로그 버전이 바뀌면 ETag가 바뀌고 200 + 새 목록
+"""
+
+PDF_BYTES = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n"
+
+
+def test_documents_me_etag_and_not_modified(client, register_user, upload):
+    headers = register_user().headers
+
+    first = client.get("/documents/me", headers=headers)
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert first.json() == []
+
+    # 같은 ETag → 304, 바디 없음
+    cached = client.get("/documents/me", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    # 업로드 → 버전 증가 → 옛 ETag로 요청해도 200 + 새 목록
+    upload(headers, PDF_BYTES, filename="report.pdf")
+
+    fresh = client.get("/documents/me", headers={**headers, "If-None-Match": etag})
+    assert fresh.status_code == 200, fresh.text
+    assert fresh.headers["etag"] != etag
+    assert [d["filename"] for d in fresh.json()] == ["report.pdf"]
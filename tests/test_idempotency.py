@@ -0,0 +1,135 @@
+"""
+tests/test_idempotency.py
+
+✅ Idempotency-Key 테스트
+- 같은 키로 재시도하면 핸들러를 다시 실행하지 않고 첫 응답을 재생한다.
+- 키는 사용자별로 분리된다. 로그아웃으로 폐기된 토큰으로는 저장된 응답을 재생할 수 없다.
+- 같은 키에 다른 바디를 보내면 422 (multipart boundary 차이는 같은 요청으로 본다)
+- 동시에 들어온 같은 키 요청은 핸들러 1번으로 합쳐진다.
+- 저장소는 개수/바이트 상한을 넘지 않는다.
+"""
+
+import asyncio
+import uuid
+
+from app.core.idempotency import (
+    BodyFingerprint, IdempotencyMiddleware, IdempotencyStore, StoredResponse,
+)
+
+PDF_BYTES = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n"
+
+
+def _keyed(headers, key):
+    return {**headers, "Idempotency-Key": key}
+
+
+def test_upload_retry_is_replayed(client, register_user, upload):
+    headers = register_user().headers
+    key = str(uuid.uuid4())
+
+    first = upload(_keyed(headers, key), PDF_BYTES)
+    retry = upload(_keyed(headers, key), PDF_BYTES)
+    assert retry.json()["id"] == first.json()["id"]
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    assert len(client.get("/documents/me", headers=headers).json()) == 1
+
+    # 다른 사용자가 같은 키를 써도 자기 요청이 실행된다
+    other = register_user().headers
+    assert upload(_keyed(other, key), PDF_BYTES).json()["id"] != first.json()["id"]
+
+
+def test_revoked_token_cannot_replay(client, register_user, upload):
+    headers = register_user().headers
+    key = str(uuid.uuid4())
+    upload(_keyed(headers, key), PDF_BYTES)
+
+    assert client.post("/auth/logout", headers=headers).status_code == 204
+    replay = upload(_keyed(headers, key), PDF_BYTES, status_code=401)
+    assert "idempotent-replayed" not in replay.headers
+
+
+def test_same_key_with_different_body_is_rejected(client, register_user, upload):
+    headers = register_user().headers
+    key = str(uuid.uuid4())
+    upload(_keyed(headers, key), PDF_BYTES)
+
+    upload(
+        _keyed(headers, key), PDF_BYTES + b"% changed\n",
+        filename="b.pdf", status_code=422,
+    )
+    assert len(client.get("/documents/me", headers=headers).json()) == 1
+
+
+def test_register_retry_skips_handler(client):
+    body = {"email": f"user-{uuid.uuid4()}@example.com", "password": "pw-pw-pw"}
+    key = {"Idempotency-Key": str(uuid.uuid4())}
+
+    first = client.post("/auth/register", json=body, headers=key)
+    retry = client.post("/auth/register", json=body, headers=key)
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    # 키 없이 다시 보내면 실제로 실행되어 중복 이메일 400
+    assert client.post("/auth/register", json=body).status_code == 400
+
+
+def test_concurrent_duplicates_are_coalesced():
+    calls = 0
+
+    async def slow_app(scope, receive, send):
+        nonlocal calls
+        calls += 1
+        await receive()
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b"created"})
+
+    middleware = IdempotencyMiddleware(slow_app, store=IdempotencyStore(), paths=["/x"])
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/x",
+        "headers": [(b"idempotency-key", b"k1")],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"same", "more_body": False}
+
+    async def one():
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(scope, receive, send)
+        return messages
+
+    async def main():
+        return await asyncio.gather(*(one() for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert calls == 1
+    assert all(r[-1]["body"] == b"created" for r in results)
+
+
+def test_store_is_bounded():
+    store = IdempotencyStore(ttl_seconds=60, max_entries=3, max_bytes=100)
+    for i in range(10):
+        store.put(("anon", "POST", "/x", str(i)), StoredResponse(200, [], b"x" * 30))
+    assert len(store) == 3
+    assert store.total_bytes <= 100
+    assert store.get(("anon", "POST", "/x", "9")) is not None
+    assert store.get(("anon", "POST", "/x", "0")) is None
+    assert not store.put(("anon", "POST", "/x", "big"), StoredResponse(200, [], b"x" * 200))
+
+
+def test_fingerprint_ignores_multipart_boundary():
+    def digest(boundary, size):
+        body = f"--{boundary}\r\ncontent\r\n--{boundary}--\r\n".encode()
+        fingerprint = BodyFingerprint(f"multipart/form-data; boundary={boundary}")
+        for start in range(0, len(body), size):
+            fingerprint.feed(body[start:start + size])
+        return fingerprint.hexdigest()
+
+    assert digest("aaaa1111", 1) == digest("bbbb2222", 5) == digest("cc", 1024)
+    assert BodyFingerprint("application/json").hexdigest() != BodyFingerprint("text/plain").hexdigest()
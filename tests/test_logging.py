@@ -0,0 +1,135 @@
+"""
+tests/test_logging.py
+
+✅ 구조화 로그 테스트
+- 요청마다 X-Request-ID가 붙고, 같은 id로 JSON 요청 로그/인증 이벤트가 남는다.
+- 샘플링으로 빠진 요청은 출력되지 않고 링 버퍼에만 남는다.
+- 예외가 난 요청은 같은 request_id의 직전 기록(DEBUG 포함)이 함께 남는다.
+- 큐가 가득 차면 요청 스레드를 막지 않고 버린다.
+"""
+
+import json
+import logging
+import queue
+import time
+import uuid
+
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.routing import Route
+
+from app.core import logging as app_logging
+from app.core.config import settings
+
+
+class ListSink:
+    def __init__(self):
+        self.lines = []
+
+    def write_lines(self, lines):
+        self.lines.extend(json.loads(line) for line in lines)
+
+    def close(self):
+        pass
+
+
+def _wait_for(sink, predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        found = [line for line in sink.lines if predicate(line)]
+        if found:
+            return found
+        time.sleep(0.02)
+    return []
+
+
+def test_request_and_auth_events_share_request_id(client):
+    sink = ListSink()
+    app_logging.add_sink(sink)
+    try:
+        email = f"user-{uuid.uuid4()}@example.com"
+        user_id = client.post(
+            "/auth/register", json={"email": email, "password": "pw-pw-pw"}
+        ).json()["id"]
+        result = client.post(
+            "/auth/login",
+            json={"email": email, "password": "pw-pw-pw"},
+            headers={"X-Request-ID": "req-login-1"},
+        )
+        assert result.headers["x-request-id"] == "req-login-1"
+
+        logs = _wait_for(sink, lambda l: l.get("request_id") == "req-login-1" and l["event"] == "request")
+        assert logs, sink.lines
+        request_log = logs[0]
+        assert request_log["path"] == "/auth/login"
+        assert request_log["status"] == 200
+        assert request_log["user_id"] == user_id
+        assert request_log["elapsed_ms"] > 0
+
+        login = [l for l in sink.lines if l["event"] == "auth.login" and l.get("request_id") == "req-login-1"]
+        assert login and login[0]["user_id"] == user_id
+        assert "password" not in json.dumps(sink.lines)
+
+        # 요청 id가 없으면 생성해서 돌려준다
+        assert len(client.get("/").headers["x-request-id"]) == 32
+    finally:
+        app_logging.remove_sink(sink)
+
+
+def test_sampled_out_requests_stay_in_ring_buffer(client, monkeypatch):
+    monkeypatch.setattr(settings, "LOG_SAMPLE_RATES", {"/stats": 0.0})
+    sink = ListSink()
+    app_logging.add_sink(sink)
+    try:
+        request_id = uuid.uuid4().hex
+        client.get("/stats/artifacts", headers={"X-Request-ID": request_id})
+        marker = uuid.uuid4().hex
+        client.get("/", headers={"X-Request-ID": marker})
+
+        assert _wait_for(sink, lambda l: l.get("request_id") == marker)
+        assert not [l for l in sink.lines if l.get("request_id") == request_id]
+        context = app_logging.ring_buffer.context_for(request_id)
+        assert context and context[0]["path"] == "/stats/artifacts"
+    finally:
+        app_logging.remove_sink(sink)
+
+
+def test_error_keeps_context():
+    debug_logger = app_logging.get_logger("test")
+
+    def boom(request):
+        app_logging.log_event(debug_logger, "step.before_failure", logging.DEBUG, step=1)
+        raise RuntimeError("boom")
+
+    failing = app_logging.RequestLoggingMiddleware(Starlette(routes=[Route("/boom", boom)]))
+    sink = ListSink()
+    app_logging.add_sink(sink)
+    try:
+        result = TestClient(failing, raise_server_exceptions=False).get(
+            "/boom", headers={"X-Request-ID": "req-boom"}
+        )
+        assert result.status_code == 500
+
+        context = _wait_for(sink, lambda l: l["event"] == "request.error_context" and l.get("request_id") == "req-boom")
+        assert context
+        events = [r["event"] for r in context[0]["records"]]
+        assert "step.before_failure" in events
+        assert _wait_for(sink, lambda l: l["event"] == "request.exception" and "RuntimeError" in l.get("exc", ""))
+    finally:
+        app_logging.remove_sink(sink)
+
+
+def test_full_queue_drops_without_blocking():
+    handler = app_logging._DroppingQueueHandler(queue.Queue(maxsize=2))
+    record_logger = logging.getLogger("documind-test-drop")
+    record_logger.propagate = False
+    record_logger.addHandler(handler)
+    try:
+        start = time.perf_counter()
+        for i in range(100):
+            record_logger.warning("event %s", i)
+        assert time.perf_counter() - start < 1.0
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 98
+    finally:
+        record_logger.removeHandler(handler)
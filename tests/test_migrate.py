@@ -0,0 +1,96 @@
+"""
+tests/test_migrate.py
+
+✅ 스키마 업그레이드 + 백필 테스트
+- 컬럼이 없던 옛 documents 테이블에 새 컬럼/인덱스가 추가된다.
+- 백필이 파일을 읽어서 size_bytes/sha256/created_at/page_count를 채운다.
+- 파일이 없는 row는 status="missing"
+- 그 사이 다른 실행이 처리한 row는 갱신 수에 세지 않는다.
+"""
+
+import hashlib
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+import app.main  # noqa: F401  (모든 모델을 Base.metadata에 등록)
+from app.db import migrate
+from app.db.database import Base
+from app.db.migrate import backfill_documents, upgrade_schema
+from app.models.document import Document
+
+PDF_BYTES = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n"
+
+
+def test_upgrade_schema_and_backfill(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        # 컬럼 추가 이전(baseline) 스키마
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR, hashed_password VARCHAR)"))
+        conn.execute(text(
+            "CREATE TABLE documents (id INTEGER PRIMARY KEY, filename VARCHAR, file_path VARCHAR,"
+            " content_type VARCHAR, owner_id INTEGER)"
+        ))
+        conn.execute(text("INSERT INTO users VALUES (1, 'a@example.com', 'x')"))
+
+    stored = tmp_path / "stored.pdf"
+    stored.write_bytes(PDF_BYTES)
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO documents VALUES (1, 'a.pdf', :path, 'application/pdf', 1)"),
+            {"path": str(stored)},
+        )
+        conn.execute(text(
+            "INSERT INTO documents VALUES (2, 'gone.pdf', '/nonexistent/gone.pdf', 'application/pdf', 1)"
+        ))
+
+    changes = upgrade_schema(engine)
+    assert "add column documents.sha256" in changes
+    assert "create index ix_documents_owner_created" in changes
+    assert upgrade_schema(engine) == []  # 두 번째 실행은 변경 없음
+
+    columns = {c["name"] for c in inspect(engine).get_columns("users")}
+    assert "catalog_version" in columns
+
+    Session = sessionmaker(bind=engine)
+    assert backfill_documents(batch_size=1, pause=0, session_factory=Session) == 2
+    assert backfill_documents(batch_size=1, pause=0, session_factory=Session) == 0
+
+    with Session() as db:
+        ok = db.get(Document, 1)
+        assert ok.size_bytes == len(PDF_BYTES)
+        assert ok.sha256 == hashlib.sha256(PDF_BYTES).hexdigest()
+        assert ok.created_at is not None
+        assert ok.page_count == 1
+        assert ok.status == "ready"
+
+        gone = db.get(Document, 2)
+        assert gone.status == "missing"
+
+
+def test_backfill_counts_only_rows_it_updated(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'race.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    stored = tmp_path / "stored.pdf"
+    stored.write_bytes(PDF_BYTES)
+    with Session() as db:
+        db.add(Document(id=1, filename="a.pdf", file_path=str(stored), content_type="application/pdf", owner_id=1))
+        db.add(Document(id=2, filename="b.pdf", file_path=str(stored), content_type="application/pdf", owner_id=1))
+        db.commit()
+
+    original = migrate.inspect_file
+
+    def inspect_while_other_run_finishes(path):
+        # 파일을 읽는 동안 다른 백필이 1번 row를 먼저 끝냈다
+        with Session() as db:
+            db.get(Document, 1).sha256 = "done-by-other-run"
+            db.commit()
+        return original(path)
+
+    monkeypatch.setattr(migrate, "inspect_file", inspect_while_other_run_finishes)
+    assert backfill_documents(batch_size=10, pause=0, session_factory=Session) == 1
+
+    with Session() as db:
+        assert db.get(Document, 1).sha256 == "done-by-other-run"
+        assert db.get(Document, 2).sha256 == hashlib.sha256(PDF_BYTES).hexdigest()
@@ -0,0 +1,197 @@
+"""
+tests/test_outbox.py
+
+✅ Outbox / 웹훅 / SSE 테스트
+- 업로드하면 같은 트랜잭션에서 outbox 이벤트가 기록된다.
+- 디스패처가 로컬 HTTP 서버로 이벤트를 배치 전달한다(서명 포함, 순서 보장).
+- 실패하면 cursor를 유지하고 백오프 후 같은 이벤트부터 재전송한다.
+- SSE 스트림이 이벤트를 id와 함께 내보낸다.
+- 사설/loopback 주소나 http 웹훅은 등록/전송 모두 거부하고, 리다이렉트는 따라가지 않는다.
+- 방금 만든(아직 commit 전일 수 있는) 이벤트에서 cursor가 멈춘다.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from app.api.v1.events import event_stream
+from app.core.config import settings
+from app.core.webhook_targets import UnsafeWebhookTarget, resolve_webhook_target
+from app.db.database import SessionLocal
+from app.jobs.outbox_dispatcher import dispatch_once, post_json
+from app.repository import outbox_repository
+
+
+class _Receiver:
+    """웹훅 수신용 로컬 HTTP 서버 (fail=True면 500, redirect_to가 있으면 302)"""
+
+    def __init__(self):
+        self.requests = []
+        self.fail = False
+        self.redirect_to = None
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                receiver.requests.append((self.headers, body))
+                if receiver.redirect_to:
+                    self.send_response(302)
+                    self.send_header("Location", receiver.redirect_to)
+                else:
+                    self.send_response(500 if receiver.fail else 204)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+
+
+def _allow_local_receiver(monkeypatch):
+    """로컬 HTTP 수신 서버(127.0.0.1)로 보낼 수 있게 + 방금 만든 이벤트도 바로 전달"""
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOW_HTTP", True)
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOW_PRIVATE_NETWORKS", True)
+    monkeypatch.setattr(settings, "OUTBOX_CURSOR_LAG_SECONDS", 0.0)
+
+
+def test_webhook_delivery_with_retry(client, register_user, upload, monkeypatch):
+    _allow_local_receiver(monkeypatch)
+    headers = register_user().headers
+    receiver = _Receiver()
+    try:
+        created = client.post("/documents/webhooks", headers=headers, json={"url": receiver.url})
+        assert created.status_code == 201, created.text
+        subscription = created.json()
+
+        first, second = (upload(headers).json()["id"] for _ in range(2))
+
+        # 1) 실패 → cursor 유지, 백오프
+        receiver.fail = True
+        dispatch_once()
+        hooks = client.get("/documents/webhooks", headers=headers).json()
+        assert hooks[0]["failures"] == 1
+        assert hooks[0]["last_event_id"] == subscription["last_event_id"]
+
+        # 백오프 시간 전에는 다시 보내지 않는다
+        sent = len(receiver.requests)
+        dispatch_once()
+        assert len(receiver.requests) == sent
+
+        # 2) 백오프 이후 성공 → 같은 이벤트를 순서대로 한 배치로 재전송
+        receiver.fail = False
+        with SessionLocal() as db:
+            next_attempt = outbox_repository.get_subscription(db, subscription["id"]).next_attempt_at
+        dispatch_once(now=next_attempt + 1)
+
+        request_headers, body = receiver.requests[-1]
+        assert request_headers["X-DocuMind-Signature"] == "sha256=" + hmac.new(
+            subscription["secret"].encode(), body, hashlib.sha256
+        ).hexdigest()
+        events = json.loads(body)["events"]
+        assert [e["document_id"] for e in events] == [first, second]
+        assert all(e["type"] == "document.created" for e in events)
+        assert events[0]["id"] < events[1]["id"]
+
+        hooks = client.get("/documents/webhooks", headers=headers).json()
+        assert hooks[0]["failures"] == 0
+        assert hooks[0]["last_event_id"] == events[-1]["id"]
+    finally:
+        receiver.close()
+
+
+def test_event_stream_yields_new_events(register_user, upload):
+    user = register_user()
+    user_id = user.id
+    with SessionLocal() as db:
+        after = outbox_repository.get_last_event_id(db, user_id)
+    doc_id = upload(user.headers).json()["id"]
+
+    async def never_disconnected():
+        return False
+
+    async def read_one():
+        stream = event_stream(user_id, after, never_disconnected, poll_seconds=0.01)
+        assert (await stream.__anext__()).startswith("retry:")
+        message = await stream.__anext__()
+        await stream.aclose()
+        return message
+
+    message = asyncio.run(read_one())
+    lines = dict(line.split(": ", 1) for line in message.strip().split("\n"))
+    assert lines["event"] == "document.created"
+    assert json.loads(lines["data"])["id"] == doc_id
+    assert int(lines["id"]) > after
+
+
+def test_webhook_rejects_unsafe_targets(client, register_user):
+    headers = register_user().headers
+    for url in (
+        "http://example.com/hook",          # https 아님
+        "https://127.0.0.1/hook",           # loopback
+        "https://localhost:8443/hook",
+        "https://10.1.2.3/hook",            # 사설망
+        "https://169.254.169.254/latest",   # 클라우드 메타데이터(link-local)
+        "https://[::1]/hook",
+        "https://[::ffff:192.168.0.1]/hook",
+    ):
+        result = client.post("/documents/webhooks", headers=headers, json={"url": url})
+        assert result.status_code == 400, (url, result.text)
+    assert client.get("/documents/webhooks", headers=headers).json() == []
+
+    # 공인 주소 리터럴은 DNS 없이 통과하고, 그 IP로 연결한다
+    target = resolve_webhook_target("https://93.184.216.34:8443/hook?x=1")
+    assert (target.address, target.port, target.path) == ("93.184.216.34", 8443, "/hook?x=1")
+
+
+def test_send_rechecks_target_and_does_not_follow_redirects(monkeypatch):
+    _allow_local_receiver(monkeypatch)
+    receiver = _Receiver()
+    try:
+        # 리다이렉트는 따라가지 않고 3xx를 그대로 실패로 돌려준다
+        receiver.redirect_to = "http://169.254.169.254/latest/meta-data"
+        assert post_json(receiver.url, b"{}", {"Content-Type": "application/json"}, 5.0) == 302
+        assert len(receiver.requests) == 1
+
+        # 등록 후에도 보낼 때 다시 검사한다
+        monkeypatch.setattr(settings, "WEBHOOK_ALLOW_PRIVATE_NETWORKS", False)
+        assert post_json(receiver.url, b"{}", {"Content-Type": "application/json"}, 5.0) == 0
+        assert len(receiver.requests) == 1
+    finally:
+        receiver.close()
+
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOW_HTTP", False)
+    with pytest.raises(UnsafeWebhookTarget):
+        resolve_webhook_target(receiver.url)
+
+
+def test_cursor_stops_at_recent_events(register_user, upload):
+    user = register_user()
+    user_id = user.id
+    with SessionLocal() as db:
+        after = outbox_repository.get_last_event_id(db, user_id)
+    first, second = (upload(user.headers).json()["id"] for _ in range(2))
+
+    with SessionLocal() as db:
+        events = outbox_repository.get_events_after(db, user_id, after)
+        assert [e.document_id for e in events] == [first, second]
+        # 두 번째 이벤트가 아직 "최근"이면 그 앞에서 멈춘다(뒤에 오래된 게 있어도 넘어가지 않음)
+        cutoff = events[0].created_at
+        visible = outbox_repository.get_events_after(db, user_id, after, visible_before=cutoff)
+        assert [e.document_id for e in visible] == [first]
+        now = time.time()
+        assert outbox_repository.get_events_after(
+            db, user_id, after, visible_before=outbox_repository.visible_before(now - 60)
+        ) == []
@@ -0,0 +1,128 @@
+"""
+tests/test_profiling.py
+
+✅ 온디맨드 프로파일링 미들웨어 테스트
+- 서명 토큰 헤더가 있는 요청만 프로파일되고 speedscope/pstats/sql 파일이 생긴다.
+- 잘못된 토큰은 무시된다.
+- 같은 시간에 다른 스레드에서 돈 일은 요청 프로파일에 섞이지 않는다.
+- 스레드풀 함수는 프로파일 중인 동안만 감싸고 끝나면 되돌린다.
+- 보관 개수(max_files)를 넘으면 오래된 결과부터 지운다(경로에 "."이 있어도).
+"""
+
+import json
+import pstats
+import threading
+import time
+
+import anyio.to_thread
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core import profiling
+from app.core.config import settings
+from app.core.profiling import ProfilingMiddleware, make_profile_token
+
+
+def _build_client(tmp_path, monkeypatch, max_files=50):
+    monkeypatch.setattr(settings, "PROFILING_SECRET", "test-secret")
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "PROFILING_MAX_FILES", max_files)
+
+    engine = create_engine("sqlite://")
+    demo = FastAPI()
+    demo.add_middleware(ProfilingMiddleware, engine=engine)
+
+    @demo.get("/v1.2/slow")
+    def dotted():
+        return {"ok": True}
+
+    @demo.get("/slow")
+    def slow():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        deadline = time.perf_counter() + 0.03
+        while time.perf_counter() < deadline:
+            pass
+        return {"ok": True}
+
+    return TestClient(demo)
+
+
+def test_signed_header_triggers_profile(tmp_path, monkeypatch):
+    client = _build_client(tmp_path, monkeypatch)
+
+    assert client.get("/slow", headers={"X-Profile-Token": "123.bad"}).status_code == 200
+    assert list(tmp_path.iterdir()) == []
+
+    token = make_profile_token("/slow")
+    assert client.get("/slow", headers={"X-Profile-Token": token}).status_code == 200
+
+    names = sorted(p.name.split(".", 1)[1] for p in tmp_path.iterdir())
+    assert names == ["pstats", "speedscope.json", "sql.json"]
+
+    sql = json.loads(next(tmp_path.glob("*.sql.json")).read_text())
+    assert sql["path"] == "/slow" and sql["status"] == 200
+    assert any("SELECT 1" in q["statement"] for q in sql["queries"])
+
+    speedscope = json.loads(next(tmp_path.glob("*.speedscope.json")).read_text())
+    assert any(p["samples"] for p in speedscope["profiles"])
+    names = {frame["name"] for frame in speedscope["shared"]["frames"]}
+    assert "slow" in names
+
+    stats = pstats.Stats(str(next(tmp_path.glob("*.pstats"))))
+    assert stats.total_tt > 0
+
+
+def test_profile_directory_is_bounded(tmp_path, monkeypatch):
+    client = _build_client(tmp_path, monkeypatch, max_files=2)
+    for _ in range(4):
+        client.get("/slow", headers={"X-Profile-Token": make_profile_token("/slow")})
+        time.sleep(0.01)
+
+    stems = {p.name.split(".", 1)[0] for p in tmp_path.iterdir()}
+    assert len(stems) == 2
+
+
+def _unrelated_spin(stop):
+    while not stop.is_set():
+        pass
+
+
+def test_profile_samples_only_request_threads(tmp_path, monkeypatch):
+    original_run_sync = anyio.to_thread.run_sync
+    client = _build_client(tmp_path, monkeypatch)
+    # 미들웨어를 만드는 것만으로는 스레드풀 함수를 바꾸지 않는다
+    assert anyio.to_thread.run_sync is original_run_sync
+    stop = threading.Event()
+    other = threading.Thread(target=_unrelated_spin, args=(stop,))
+    other.start()
+    try:
+        client.get("/slow", headers={"X-Profile-Token": make_profile_token("/slow")})
+    finally:
+        stop.set()
+        other.join()
+
+    speedscope = json.loads(next(tmp_path.glob("*.speedscope.json")).read_text())
+    names = {frame["name"] for frame in speedscope["shared"]["frames"]}
+    assert "slow" in names
+    assert "_unrelated_spin" not in names
+    # 프로파일이 끝나면 원래 함수로 되돌린다
+    assert anyio.to_thread.run_sync is original_run_sync
+
+
+def test_prune_groups_dotted_paths(tmp_path, monkeypatch):
+    client = _build_client(tmp_path, monkeypatch, max_files=1)
+    for _ in range(2):
+        client.get("/v1.2/slow", headers={"X-Profile-Token": make_profile_token("/v1.2/slow")})
+        time.sleep(0.01)
+
+    # 묶음 1개(3개 파일)만 남는다
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_token_is_bound_to_path(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_SECRET", "test-secret")
+    token = make_profile_token("/documents/upload")
+    assert profiling.verify_profile_token(token, "/documents/upload")
+    assert not profiling.verify_profile_token(token, "/auth/login")
@@ -0,0 +1,52 @@
+"""
+tests/test_quota.py
+
+✅ 사용자별 쿼터/사용량 카운터 테스트
+- 업로드하면 /auth/me/usage 카운터가 증분으로 올라간다.
+- 남은 용량을 넘는 업로드는 413, 파일/row는 남지 않는다.
+- reconcile_usage가 어긋난 카운터를 바로잡는다.
+"""
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.user import User
+from app.repository.usage_repository import reconcile_usage
+
+PDF_BYTES = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n"
+
+
+def test_usage_counters_and_quota(client, register_user, upload, monkeypatch):
+    monkeypatch.setattr(settings, "USER_STORAGE_QUOTA_BYTES", len(PDF_BYTES) + 100)
+    headers = register_user().headers
+
+    upload(headers, PDF_BYTES)
+
+    usage = client.get("/auth/me/usage", headers=headers).json()
+    assert usage["storage_bytes_used"] == len(PDF_BYTES)
+    assert usage["document_count"] == 1
+    assert usage["storage_quota_bytes"] == len(PDF_BYTES) + 100
+
+    # 남은 100바이트보다 큰 업로드 → 스트리밍 중 중단
+    too_big = PDF_BYTES + b"%" + b"x" * 200 + b"\n"
+    upload(headers, too_big, status_code=413)
+
+    usage = client.get("/auth/me/usage", headers=headers).json()
+    assert usage["document_count"] == 1
+    assert len(client.get("/documents/me", headers=headers).json()) == 1
+
+
+def test_reconcile_fixes_drift(client, register_user, upload):
+    owner = register_user()
+    upload(owner.headers, PDF_BYTES)
+
+    with SessionLocal() as db:
+        user = db.query(User).filter(User.email == owner.email).one()
+        user.storage_bytes_used = 999_999
+        user.document_count = 42
+        db.commit()
+
+        assert reconcile_usage(db) >= 1
+
+    usage = client.get("/auth/me/usage", headers=owner.headers).json()
+    assert usage["storage_bytes_used"] == len(PDF_BYTES)
+    assert usage["document_count"] == 1
@@ -0,0 +1,44 @@
+"""
+tests/test_server.py
+
+✅ 서버 런처(python -m app) / 워커 통계 테스트
+- 자동 워커 수/루프/파서 선택이 설치 여부에 맞게 결정된다.
+- /stats/worker 가 이 프로세스의 요청 수를 보여준다(관리자만).
+"""
+
+import importlib.util
+import os
+
+from app.__main__ import build_parser, default_workers, resolve_http, resolve_loop
+
+
+def test_launcher_defaults():
+    assert default_workers() >= 1
+
+    expected_loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    expected_http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    assert resolve_loop("auto") == expected_loop
+    assert resolve_http("auto") == expected_http
+    assert resolve_loop("asyncio") == "asyncio"
+
+    args = build_parser().parse_args(["--workers", "3", "--max-requests", "100", "--no-preload"])
+    assert args.workers == 3
+    assert args.max_requests == 100
+    assert args.preload is False
+
+
+def test_worker_stats_counts_requests(client, register_user):
+    headers = register_user(admin=True).headers
+    before = client.get("/stats/worker", headers=headers).json()
+    client.get("/")
+    after = client.get("/stats/worker", headers=headers).json()
+
+    assert after["pid"] == os.getpid()
+    assert after["requests"] >= before["requests"] + 2
+    assert after["status"]["2xx"] >= 2
+
+
+def test_worker_stats_requires_admin(client, register_user):
+    assert client.get("/stats/worker").status_code == 401
+    headers = register_user().headers
+    assert client.get("/stats/worker", headers=headers).status_code == 403
@@ -0,0 +1,99 @@
+"""
+tests/test_sharing.py
+
+✅ 공유/접근 인덱스 테스트
+- 사용자 직접 공유 / 중첩 그룹 공유 / 폴더 공유가 /documents/accessible 에 반영된다.
+- 공유 해제, 그룹 구성원 제거 시 접근 인덱스에서 빠진다(증분 갱신).
+- 그룹 순환은 409
+- 증분 갱신 결과가 전체 재계산 결과와 같다.
+"""
+
+from app.db.database import SessionLocal
+from app.repository.access_repository import rebuild_access_index
+
+
+def _accessible(client, headers):
+    result = client.get("/documents/accessible", headers=headers)
+    assert result.status_code == 200, result.text
+    return {d["id"] for d in result.json()}
+
+
+def _post(client, path, headers, body):
+    result = client.post(path, headers=headers, json=body)
+    assert result.status_code == 201, result.text
+    return result.json()
+
+
+def test_direct_share_and_unshare(client, register_user, upload):
+    owner = register_user().headers
+    reader = register_user()
+    doc_id = upload(owner).json()["id"]
+
+    assert doc_id in _accessible(client, owner)
+    assert doc_id not in _accessible(client, reader.headers)
+
+    share = _post(client, "/sharing/shares", owner, {"document_id": doc_id, "user_id": reader.id})
+    assert doc_id in _accessible(client, reader.headers)
+    # 공유받은 문서는 /documents/me 에는 나오지 않는다
+    mine = client.get("/documents/me", headers=reader.headers).json()
+    assert doc_id not in {d["id"] for d in mine}
+
+    assert client.delete(f"/sharing/shares/{share['id']}", headers=owner).status_code == 204
+    assert doc_id not in _accessible(client, reader.headers)
+
+
+def test_nested_group_and_folder_share(client, register_user, upload):
+    owner = register_user().headers
+    member = register_user()
+
+    folder = _post(client, "/sharing/folders", owner, {"name": "team"})
+    doc_id = upload(owner).json()["id"]
+    moved = client.put(
+        f"/sharing/documents/{doc_id}/folder", headers=owner, json={"folder_id": folder["id"]}
+    )
+    assert moved.status_code == 200, moved.text
+
+    # outer ⊃ inner ⊃ member
+    outer = _post(client, "/sharing/groups", owner, {"name": "outer"})
+    inner = _post(client, "/sharing/groups", owner, {"name": "inner"})
+    _post(client, f"/sharing/groups/{outer['id']}/members", owner, {"group_id": inner["id"]})
+    _post(client, "/sharing/shares", owner, {"folder_id": folder["id"], "group_id": outer["id"]})
+    assert doc_id not in _accessible(client, member.headers)
+
+    # 구성원 추가 → 상위 그룹 공유가 닿는 문서만 갱신
+    link = _post(
+        client, f"/sharing/groups/{inner['id']}/members", owner, {"user_id": member.id}
+    )
+    assert doc_id in _accessible(client, member.headers)
+
+    # 나중에 폴더에 들어온 문서도 보인다
+    later_id = upload(owner).json()["id"]
+    client.put(f"/sharing/documents/{later_id}/folder", headers=owner, json={"folder_id": folder["id"]})
+    assert later_id in _accessible(client, member.headers)
+
+    # 순환 금지
+    cycle = client.post(
+        f"/sharing/groups/{inner['id']}/members", headers=owner, json={"group_id": outer["id"]}
+    )
+    assert cycle.status_code == 409
+
+    # 증분 결과 == 전체 재계산 결과
+    with SessionLocal() as db:
+        assert rebuild_access_index(db) == (0, 0)
+
+    removed = client.delete(
+        f"/sharing/groups/{inner['id']}/members/{link['id']}", headers=owner
+    )
+    assert removed.status_code == 204
+    assert _accessible(client, member.headers).isdisjoint({doc_id, later_id})
+
+
+def test_only_owner_can_share(client, register_user, upload):
+    owner = register_user().headers
+    other = register_user()
+    doc_id = upload(owner).json()["id"]
+
+    result = client.post(
+        "/sharing/shares", headers=other.headers, json={"document_id": doc_id, "user_id": other.id}
+    )
+    assert result.status_code == 403
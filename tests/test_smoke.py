@@ -10,12 +10,9 @@ tests/test_smoke.py
 """
 
 import uuid
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
-def test_register_login_and_documents_me():
+def test_register_login_and_documents_me(client):
     email = f"user-{uuid.uuid4()}@example.com"
     password = "NoMooHyunFeelingIsGood"
 
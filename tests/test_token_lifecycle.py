@@ -0,0 +1,144 @@
+"""
+tests/test_token_lifecycle.py
+
+✅ 토큰 수명주기 테스트
+- 로그인 시 access + refresh 발급
+- refresh 회전: 새 토큰 발급, 이전 refresh 재사용 시 401 + 전체 refresh 폐기
+- 같은 refresh로 동시에 회전하면 늦은 쪽은 재사용으로 처리된다(조건부 UPDATE)
+- 로그아웃 후 기존 access token은 401
+- Bloom Filter/denylist 단위 동작
+"""
+
+import time
+
+from app.core.revocation import BloomFilter, RevocationList
+from app.models.token import RefreshToken
+from app.repository import token_repository
+
+
+def test_refresh_rotation_and_reuse_detection(client, register_user):
+    tokens = register_user().tokens
+    assert tokens["refresh_token"]
+    assert tokens["expires_in"] > 0
+
+    rotated = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert rotated.status_code == 200, rotated.text
+    new_tokens = rotated.json()
+    assert new_tokens["refresh_token"] != tokens["refresh_token"]
+
+    headers = {"Authorization": f"Bearer {new_tokens['access_token']}"}
+    assert client.get("/documents/me", headers=headers).status_code == 200
+
+    # 이미 회전된 refresh 재사용 → 401, 그리고 새 refresh까지 전부 폐기
+    reused = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert reused.status_code == 401
+    after = client.post("/auth/refresh", json={"refresh_token": new_tokens["refresh_token"]})
+    assert after.status_code == 401
+
+    # access token으로 refresh 시도(토큰 혼용) → 401
+    mixed = client.post("/auth/refresh", json={"refresh_token": new_tokens["access_token"]})
+    assert mixed.status_code == 401
+
+
+def test_concurrent_refresh_is_treated_as_reuse(monkeypatch, client, register_user):
+    tokens = register_user().tokens
+    first = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert first.status_code == 200, first.text
+
+    # 두 번째 요청이 첫 번째 회전 전에 기록을 읽은 상황: revoked_at이 아직 비어 보인다.
+    original = token_repository.get_refresh_token
+
+    def stale_read(db, jti):
+        record = original(db, jti)
+        return RefreshToken(jti=record.jti, user_id=record.user_id, expires_at=record.expires_at)
+
+    monkeypatch.setattr(token_repository, "get_refresh_token", stale_read)
+    second = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert second.status_code == 401
+    monkeypatch.undo()
+
+    # 먼저 회전한 쪽의 refresh도 폐기된다(토큰 가족이 둘로 갈라지지 않음)
+    after = client.post("/auth/refresh", json={"refresh_token": first.json()["refresh_token"]})
+    assert after.status_code == 401
+
+
+def test_logout_revokes_access_and_refresh_token(client, register_user):
+    user = register_user()
+    tokens, headers = user.tokens, user.headers
+
+    result = client.post(
+        "/auth/logout",
+        headers=headers,
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert result.status_code == 204, result.text
+
+    assert client.get("/documents/me", headers=headers).status_code == 401
+    refresh = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert refresh.status_code == 401
+
+
+def test_revocation_list_expires_entries():
+    bloom = BloomFilter(capacity=100, error_rate=0.01)
+    bloom.add("a")
+    assert bloom.might_contain("a")
+
+    revoked = RevocationList(capacity=2, error_rate=0.01, sync_seconds=60)
+    now = time.time()
+    revoked.add("live", int(now) + 60)
+    revoked.add("dead", int(now) - 1)
+    assert revoked.is_revoked("live")
+    assert not revoked.is_revoked("dead")
+    assert not revoked.is_revoked("unknown")
+
+    # 용량 초과 → 만료 항목부터 정리, 살아있는 항목은 유지
+    revoked.add("more", int(now) + 60)
+    revoked.purge_expired()
+    assert revoked.is_revoked("live") and revoked.is_revoked("more")
+    assert len(revoked) == 2
+
+
+def test_revocation_list_purges_before_growing():
+    revoked = RevocationList(capacity=2, error_rate=0.01, sync_seconds=60)
+    num_bits = revoked._bloom.num_bits
+    now = time.time()
+    for i in range(10):
+        revoked.add(f"dead-{i}", int(now) - 1)
+    # 만료 항목만 쌓이면 용량(Bloom 크기)은 그대로
+    assert revoked._bloom.num_bits == num_bits
+    assert len(revoked) <= 2
+
+    for i in range(3):
+        revoked.add(f"live-{i}", int(now) + 60)
+    assert revoked._bloom.num_bits > num_bits
+    assert all(revoked.is_revoked(f"live-{i}") for i in range(3))
+
+
+def test_revocation_sync_rereads_rows_behind_recent_ones(monkeypatch):
+    now = time.time()
+    exp = int(now) + 60
+    # 두 번째 동기화 때 id 2가 (id 3보다 늦게) commit되어 보인다
+    batches = [
+        [(1, "a", exp, now - 10), (3, "c", exp, now)],
+        [(2, "b", exp, now - 9), (3, "c", exp, now)],
+    ]
+    cursors = []
+
+    def get_revoked_since(db, last_id, now):
+        cursors.append(last_id)
+        return batches[len(cursors) - 1]
+
+    monkeypatch.setattr(token_repository, "get_revoked_since", get_revoked_since)
+    revoked = RevocationList(
+        capacity=10, error_rate=0.01, sync_seconds=0, sync_lag_seconds=5, purge_seconds=0.001
+    )
+    revoked.add("old", int(now) - 1)
+    revoked.maybe_sync(None)
+    time.sleep(0.002)
+    revoked.maybe_sync(None)
+
+    # 최근 row(id 3)에서 cursor가 멈춰서 id 2를 놓치지 않는다
+    assert cursors == [0, 1]
+    assert all(revoked.is_revoked(jti) for jti in ("a", "b", "c"))
+    # maybe_sync가 만료된 jti를 정리한다
+    assert len(revoked) == 3
@@ -0,0 +1,104 @@
+"""
+tests/test_upload_validation.py
+
+✅ 업로드 내용 검사(매직 바이트) 테스트
+- 진짜 PDF/DOCX는 통과하고 detected_type/page_count가 기록된다.
+- content_type만 PDF인 가짜 파일, DOCX가 아닌 ZIP은 400
+- 청크 경계가 어디서 잘려도 판별/페이지 수가 같다.
+"""
+
+import io
+import zipfile
+
+import pytest
+
+from app.core.file_sniff import (
+    DOCX_MIME, PDF_MIME, ContentTypeMismatch, UnsupportedFileType, UploadSniffer,
+)
+
+PDF_BYTES = (
+    b"%PDF-1.4\n"
+    b"1 0 obj << /Type /Pages /Kids [2 0 R 3 0 R] /Count 2 >> endobj\n"
+    b"2 0 obj << /Type /Page /Parent 1 0 R >> endobj\n"
+    b"3 0 obj << /Type/Page /Parent 1 0 R >> endobj\n"
+    b"%%EOF\n"
+)
+
+
+def _make_zip(entries: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+DOCX_BYTES = _make_zip({
+    "[Content_Types].xml": "<Types/>",
+    "word/document.xml": "<w:document/>" * 200,
+    "docProps/app.xml": "<Properties><Pages>7</Pages></Properties>",
+})
+
+
+def _sniff(data: bytes, chunk_size: int):
+    sniffer = UploadSniffer()
+    for i in range(0, len(data), chunk_size):
+        sniffer.feed(data[i:i + chunk_size])
+    return sniffer.finish()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_sniffer_is_chunk_boundary_independent(chunk_size):
+    pdf = _sniff(PDF_BYTES, chunk_size)
+    assert (pdf.detected_type, pdf.page_count) == (PDF_MIME, 2)
+
+    docx = _sniff(DOCX_BYTES, chunk_size)
+    assert (docx.detected_type, docx.page_count) == (DOCX_MIME, 7)
+
+
+def test_sniffer_rejects_early():
+    sniffer = UploadSniffer()
+    with pytest.raises(UnsupportedFileType):
+        sniffer.feed(b"MZ\x90\x00\x03 not a document")
+
+    with pytest.raises(UnsupportedFileType):
+        _sniff(_make_zip({"xl/workbook.xml": "<workbook/>"}), 64)
+
+
+def test_sniffer_rejects_declared_type_mismatch_before_end():
+    # PDF라고 주장했는데 ZIP 헤더 → DOCX로 판별되는 청크에서 바로 중단(finish 전에)
+    sniffer = UploadSniffer(expected_type=PDF_MIME)
+    fed = 0
+    with pytest.raises(ContentTypeMismatch):
+        for start in range(0, len(DOCX_BYTES), 64):
+            fed += 1
+            sniffer.feed(DOCX_BYTES[start:start + 64])
+    assert fed * 64 < len(DOCX_BYTES)
+    assert sniffer.detected_type is None
+
+    # 반대로 DOCX라고 주장한 PDF는 첫 청크에서
+    with pytest.raises(ContentTypeMismatch):
+        UploadSniffer(expected_type=DOCX_MIME).feed(PDF_BYTES[:16])
+
+
+def test_upload_records_detected_type_and_pages(register_user, upload):
+    headers = register_user().headers
+
+    pdf = upload(headers, PDF_BYTES, content_type=PDF_MIME).json()
+    assert pdf["detected_type"] == PDF_MIME
+    assert pdf["page_count"] == 2
+
+    docx = upload(headers, DOCX_BYTES, filename="b.docx", content_type=DOCX_MIME).json()
+    assert docx["page_count"] == 7
+
+
+def test_upload_rejects_spoofed_content(client, register_user, upload):
+    headers = register_user().headers
+
+    upload(
+        headers, b"#!/bin/sh\necho hi\n",
+        filename="evil.pdf", content_type=PDF_MIME, status_code=400,
+    )
+    upload(headers, DOCX_BYTES, content_type=PDF_MIME, status_code=400)
+
+    assert client.get("/documents/me", headers=headers).json() == []